@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter`
+=================
+
+The public API, imported on first use::
+
+    import dmx_transmitter
+
+    dmx = dmx_transmitter.DMXTransmitter(first_out_pin=board.D0)
+
+Importing the package itself loads nothing else. Each name below loads
+only its own submodule the first time it is looked up, so boards that
+never merge, record or send RDM never spend the RAM on it. The assembler
+(assembly_code.py) is never loaded; boards use frozen_code.py.
+
+* Author: Dana Runge
+"""
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+# Public name: submodule.
+_EXPORTS = {
+    "DMXTransmitter": "dmx_transmitter",
+    "Payload_USITT_DMX512_A": "payload_USITT_DMX512_A",
+    "TimingPins": "timing_pins",
+    "TRANSMITTING": "timing_pins",
+    "NOT_TRANSMITTING": "timing_pins",
+    "MAB": "timing_pins",
+    "NOT_MAB": "timing_pins",
+    "BREAK": "timing_pins",
+    "NOT_BREAK": "timing_pins",
+    "HTP": "merge",
+    "LTP": "merge",
+    "MergeSource": "merge",
+    "Merger": "merge",
+    "SceneCache": "scene_cache",
+    "SceneLibrary": "scene_library",
+    "SceneLibraryWriter": "scene_library",
+    "FrameRecorder": "recorder",
+    "FrameReplayer": "recorder",
+    "Sequencer": "sequencer",
+    "LiveWriter": "live",
+    "AsyncDriver": "async_driver",
+    "Masters": "masters",
+    "SlewLimiter": "slew",
+    "PixelMap": "pixel_map",
+    "Payload_Alternate_Start_Code": "payload_Alternate_Start_Code",
+    "Payload_Text_Packet": "payload_Alternate_Start_Code",
+    "Payload_System_Information_Packet": "payload_Alternate_Start_Code",
+    "Payload_Manufacturer_Specific": "payload_Alternate_Start_Code",
+    "Payload_RDM": "rdm",
+    "RDMController": "rdm",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    "Import the submodule that defines 'name', on first use."
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'dmx_transmitter' has no attribute '{name}'")
+    value = getattr(__import__("dmx_transmitter." + module, None, None, [name]), name)
+    globals()[name] = value  # Later lookups skip __getattr__.
+    return value
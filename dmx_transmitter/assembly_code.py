@@ -3,8 +3,6 @@
 # SPDX-License-Identifier: MIT
 """Assemble code for CircuitPython_DMX512RP2040"""
 
-import adafruit_pioasm
-
 __author__ = "Dana Runge"
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
@@ -71,6 +69,9 @@ frame_stop:
 """
 
     def __init__(self, universes: int = None):
+        # The assembler is only needed here, not for the timing analysis.
+        import adafruit_pioasm  # pylint: disable=import-outside-toplevel
+
         self.universes = int(universes)
         # self.timing_pins = timing_pins
         prog = adafruit_pioasm.Program(self.pre_process(universes=universes))
@@ -117,94 +118,519 @@ frame_stop:
                 AssemblyCode.get_timing()
             )
         """
+        intervals = TimingAnalyzer(cls.pre_process(1)).minimum()
         timing = {}
-        intervals = {}
-        for number, line in enumerate(cls.pre_process(1).split("\n")):
-            code, _, comments = line.partition(";")
-            # Find out what's not code.
-            code = code.rstrip()
-            if not code:  # Empty
-                continue
-            if code.startswith("."):  # Directives
-                continue
-            if code.endswith(":"):  # Labels
-                continue
-            # This is an opcode, get duration
-            duration = 1
-            if code.endswith("]"):  # Delay
-                end = code[:-1].split("[")[1]
-                duration = duration + (int(end) if end else 0)
-            # Look for interval symbol
-            interval, _, comments = comments.partition(";")
-            interval = interval.strip()
-            if not interval:
-                raise ValueError(f"Line {number + 1} does not have a symbol.")
-            if not comments:
-                raise ValueError(f"Line {number + 1} does not have comments.")
-            if interval not in intervals:
-                intervals[interval] = 0
-            intervals[interval] = intervals[interval] + duration
         timing["mark_before_break_short"] = intervals["MBB"]
         timing["mark_before_break_long"] = intervals["MBB"] + intervals["MAF"]
         timing["space_for_break"] = intervals["BRK"]
         timing["mark_after_break"] = intervals["MAB"] + intervals["AST"]
         assert 4 == intervals["STA"]  # Start bit SHALL be 4 µS
-        assert 4 == intervals["DAT"]  # Data bit SHALL be 4 µS
+        assert 32 == intervals["DAT"]  # 8 data bits SHALL be 4 µS each
         timing["mark_between_slots"] = intervals["STP"] + intervals["AST"]
         assert (
             intervals["AST"] == intervals["ATS"]
         )  # Clean transition to terminal slot.
         assert 4 == intervals["TSA"]  # Terminal start bit SHALL be 4 µS
-        assert 4 == intervals["TDA"]  # Termainal data bit SHALL be 4 µS
+        assert 32 == intervals["TDA"]  # Terminal data bits SHALL be 4 µS each
         timing["mark_after_frame"] = intervals["MAF"] + intervals["WAT"]
         return timing
 
+    @classmethod
+    def cross_check(cls, payload_class=None, trials=20) -> None:
+        """Check a payload class against the assembly code.
+
+        Compares the payload's _MinimumTiming with :meth:`get_timing`, then
+        compares its 'interval' with :meth:`TimingAnalyzer.frame_time` for
+        random timings, slots and universes. Raises AssertionError on the
+        first difference.
+        """
+        # pylint: disable=import-outside-toplevel,protected-access
+        import random
+
+        if payload_class is None:
+            from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+            payload_class = Payload_USITT_DMX512_A
+        for name, value in cls.get_timing().items():
+            frozen = getattr(payload_class._MinimumTiming, name)
+            assert frozen == value, f"_MinimumTiming.{name} is {frozen}, not {value}"
+        for trial in range(trials):
+            universes = trial % 3 + 1
+            analyzer = TimingAnalyzer(cls.pre_process(universes))
+            payload = payload_class(
+                universes=universes, slots=random.choice((1, 2, random.randint(3, 512)))
+            )
+            payload.mark_after_frame = random.choice((False, random.randint(6, 260)))
+            for name in (
+                "mark_before_break",
+                "space_for_break",
+                "mark_after_break",
+                "mark_after_start_code",
+                "mark_between_slots",
+            ):
+                setattr(payload, name, random.randint(12, 260))
+            expected = analyzer.frame_time(payload)
+            assert (
+                payload.interval == expected
+            ), f"interval is {payload.interval}, the assembly code takes {expected}"
+
+
+def _add(poly, other, scale=1) -> dict:
+    "Sum of two polynomials, the second scaled."
+    total = dict(poly)
+    for term, coefficient in other.items():
+        total[term] = total.get(term, 0) + coefficient * scale
+        if not total[term]:
+            del total[term]
+    return total
+
+
+def _multiply(poly, other) -> dict:
+    "Product of two polynomials."
+    total = {}
+    for term, coefficient in poly.items():
+        for other_term, other_coefficient in other.items():
+            total = _add(
+                total,
+                {tuple(sorted(term + other_term)): coefficient * other_coefficient},
+            )
+    return total
+
+
+def _rename(poly, names) -> dict:
+    "Rename symbols."
+    total = {}
+    for term, coefficient in poly.items():
+        renamed = tuple(sorted(names.get(symbol, symbol) for symbol in term))
+        total = _add(total, {renamed: coefficient})
+    return total
+
+
+def _format(poly) -> str:
+    "A polynomial as text, constant first."
+    if not poly:
+        return "0"
+    terms = []
+    for term in sorted(poly, key=lambda term: (len(term), term)):
+        coefficient = poly[term]
+        if not term:
+            terms.append(str(coefficient))
+        elif coefficient == 1:
+            terms.append(" * ".join(term))
+        else:
+            terms.append(" * ".join((str(coefficient),) + term))
+    return " + ".join(terms)
+
+
+class TimingAnalyzer:
+    """Static timing analysis of the pre-processed assembly code.
+
+    Every instruction takes one microsecond plus its delay, and is charged
+    to the interval tag in its first comment column (;MBB, ;BRK ...).
+
+    A ``jmp x--`` or ``jmp y--`` back to an earlier label is a loop. It runs
+    one more time than the value last put in that register, by ``set`` (a
+    constant) or by ``out`` (a symbol). A loop inside one tag is a delay and
+    is part of that tag. A loop across tags repeats whole slots.
+
+    ``out`` symbols are named after what they read: a whole word is
+    ``word0``, ``word1``... in the order of the payload's array; less than a
+    word is named after the tag it feeds. A symbol read once per slot is
+    summed over the slots, as ``sum(STP)``.
+
+    A ``jmp !x`` back to the top ends the frame early when x is 0. What
+    follows is charged only when x is not 0.
+
+    Only the instructions the DMX program uses are modeled. Anything else
+    raises ValueError, rather than give a wrong answer.
+    """
+
+    def __init__(self, source):
+        self.program = []  # (opcode, arguments, microseconds, tag)
+        self.labels = {}
+        for number, line in enumerate(source.split("\n")):
+            code, _, comments = line.partition(";")
+            code = code.strip()
+            if not code or code.startswith("."):  # Empty, or directives.
+                continue
+            if code.endswith(":"):  # Labels
+                self.labels[code[:-1]] = len(self.program)
+                continue
+            tag, _, comments = comments.partition(";")
+            tag = tag.strip()
+            if not tag:
+                raise ValueError(f"Line {number + 1} does not have a symbol.")
+            if not comments:
+                raise ValueError(f"Line {number + 1} does not have comments.")
+            microseconds = 1
+            if code.endswith("]"):  # Delay
+                code, _, delay = code[:-1].rpartition("[")
+                microseconds = microseconds + (int(delay) if delay.strip() else 0)
+            code = code.partition(" side ")[0]
+            opcode, _, arguments = code.strip().partition(" ")
+            arguments = [argument.strip() for argument in arguments.split(",")]
+            self.program.append((opcode, arguments, microseconds, tag))
+        self.word_bits = max(
+            int(arguments[1])
+            for opcode, arguments, _, _ in self.program
+            if opcode == "out" and arguments[0] in ("x", "y")
+        )
+        self._words = 0
+        self.tags = {}  # Each tag's code run once, delays included.
+        self.frame = {}  # One whole frame.
+        self.condition = None  # The symbol tested by 'jmp !x'.
+        self.conditional = {}  # Tags charged only when the condition is not 0.
+        self.summed = {}  # Per slot symbols, by summed name.
+        self._walk(0, len(self.program), {}, top=True)
+
+    def _out_symbol(self, arguments, tag) -> str:
+        "Name the value read by an 'out' instruction."
+        if int(arguments[1]) == self.word_bits:
+            self._words = self._words + 1
+            return f"word{self._words - 1}"
+        return tag
+
+    # pylint: disable-next=too-many-arguments,too-many-branches,too-many-locals
+    def _walk(self, start, end, registers, top=False, skip=None) -> tuple:
+        """Run program counters 'start' to 'end' once.
+
+        Returns each tag's microseconds, the total microseconds and the
+        symbols read by 'out'.
+        """
+        tags = {}
+        total = {}
+        symbols = set()
+        conditional = False
+        for counter in range(start, end):
+            opcode, arguments, microseconds, tag = self.program[counter]
+            cost = {(): microseconds}
+            if conditional:
+                self.conditional[tag] = _add(self.conditional.get(tag, {}), cost)
+            else:
+                tags[tag] = _add(tags.get(tag, {}), cost)
+                total = _add(total, cost)
+            if opcode == "set" and arguments[0] in ("x", "y"):
+                registers[arguments[0]] = {(): int(arguments[1], 0)}
+            elif opcode == "out" and arguments[0] in ("x", "y"):
+                symbol = self._out_symbol(arguments, tag)
+                registers[arguments[0]] = {(symbol,): 1}
+                symbols.add(symbol)
+            elif opcode == "mov" and arguments[0] in ("x", "y"):
+                raise ValueError(f"Line {counter}: 'mov' into x or y is not modeled.")
+            elif opcode == "jmp":
+                if len(arguments) != 2:
+                    raise ValueError(f"Line {counter}: plain 'jmp' is not modeled.")
+                condition, label = arguments
+                target = self.labels[label]
+                if condition in ("x--", "y--") and target <= counter != skip:
+                    count = registers[condition[0]]
+                    body_tags, body, body_symbols = self._walk(
+                        target, counter + 1, dict(registers), skip=counter
+                    )
+                    if len(body_tags) == 1:  # A delay loop, part of its tag.
+                        extra = _multiply(body, count)
+                        if conditional:
+                            self.conditional[tag] = _add(self.conditional[tag], extra)
+                        else:
+                            tags[tag] = _add(tags[tag], extra)
+                            total = _add(total, extra)
+                        continue
+                    # A loop over slots. Per slot symbols are summed.
+                    names = {symbol: f"sum({symbol})" for symbol in body_symbols}
+                    for symbol, name in names.items():
+                        self.summed[name] = symbol
+                    per_slot = {
+                        term: coefficient
+                        for term, coefficient in body.items()
+                        if any(symbol in names for symbol in term)
+                    }
+                    # The first pass is counted already: add the other passes,
+                    # and replace the first pass's per slot symbols by sums.
+                    total = _add(total, _multiply(_add(body, per_slot, -1), count))
+                    total = _add(total, _add(_rename(per_slot, names), per_slot, -1))
+                elif condition == "!x" and top and target == 0:
+                    self.condition = next(iter(registers["x"]))[0]
+                    conditional = True
+                elif counter != skip:
+                    raise ValueError(
+                        f"Line {counter}: 'jmp {condition}' is not modeled."
+                    )
+        if top:
+            self.tags = tags
+            self.frame = total
+        return tags, total, symbols
+
+    def minimum(self) -> dict:
+        """Each tag's shortest time, with every symbol 0. (microseconds)
+
+        Tags charged only when the 'jmp !x' condition holds are included.
+        """
+        minimum = {tag: poly.get((), 0) for tag, poly in self.tags.items()}
+        for tag, poly in self.conditional.items():
+            minimum[tag] = minimum.get(tag, 0) + poly.get((), 0)
+        return minimum
+
+    def formulas(self) -> dict:
+        "Each tag's time as text. (microseconds)"
+        formulas = {tag: _format(poly) for tag, poly in self.tags.items()}
+        for tag, poly in self.conditional.items():
+            formulas[tag] = f"({_format(poly)}) if {self.condition} else 0"
+        return formulas
+
+    def frame_formula(self) -> str:
+        "The BREAK TO BREAK time as text. (microseconds)"
+        text = _format(self.frame)
+        if self.conditional:
+            extra = {}
+            for poly in self.conditional.values():
+                extra = _add(extra, poly)
+            text = f"{text} + (({_format(extra)}) if {self.condition} else 0)"
+        return text
+
+    def frame_time(self, payload) -> int:
+        """The BREAK TO BREAK time of a payload, from its array. (microseconds)
+
+        Words are read in order: the header words, then one slot word per
+        pass of the slot loop, then the last slot.
+        """
+        words = payload.array
+        shift = payload.bits - 8
+        loop_words = words[self._words : self._words + words[self._words - 1] + 1]
+        values = {f"word{index}": words[index] for index in range(self._words)}
+        for name, symbol in self.summed.items():
+            values[name] = sum(word >> shift & 0xFF for word in loop_words)
+            values[symbol] = None
+        values[self.condition] = words[-1] >> shift & 0xFF
+
+        def evaluate(poly):
+            total = 0
+            for term, coefficient in poly.items():
+                for symbol in term:
+                    coefficient = coefficient * values[symbol]
+                total = total + coefficient
+            return total
+
+        total = evaluate(self.frame)
+        if values[self.condition]:
+            for poly in self.conditional.values():
+                total = total + evaluate(poly)
+        return total
+
+
+PIN_NAMES = (
+    "TRANSMITTING",
+    "NOT_TRANSMITTING",
+    "MAB",
+    "NOT_MAB",
+    "BREAK",
+    "NOT_BREAK",
+)
+"The timing pin functions in timing_pins.py, in the frozen module's order."
+
+FROZEN_MODULE = "frozen_code.py"
+"The generated machine code module, next to this file."
+
+FROZEN_PINS_MODULE = "frozen_timing_pins.py"
+"The generated timing pin fields, next to this file. Loaded by timing pins only."
+
+
+def assembly_code_digest() -> str:
+    "SHA-256 of the assembly code source, to spot a stale frozen module."
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    return hashlib.sha256(AssemblyCode.ASSEMBLY_CODE.encode()).hexdigest()
+
+
+def timing_pin_permutations():
+    "Every ordered choice of 0 to 3 timing pin names."
+    import itertools  # pylint: disable=import-outside-toplevel
+
+    for count in range(4):
+        yield from itertools.permutations(PIN_NAMES, count)
+
+
+def timing_pin_fields(program_class=None) -> dict:
+    """The pin values each timing pin permutation gives each opcode.
+
+    Keyed by the tuple of pin names. The bits are the same for every
+    universe count, which is checked, so one entry serves all three.
+    """
+    # pylint: disable=import-outside-toplevel
+    from . import timing_pins
+
+    if program_class is None:
+        program_class = AssemblyCode
+    programs = [program_class(universes=universes) for universes in range(1, 4)]
+    fields = {}
+    for names in timing_pin_permutations():
+        pins = [getattr(timing_pins, name) for name in names]
+        variants = []
+        for program in programs:
+            variant = timing_pins.TimingPin(*pins, program=program)
+            variants.append(
+                bytes(
+                    (opcode >> variant.shift) & (2 ** len(pins) - 1)
+                    for opcode in variant.assembled
+                )
+            )
+        assert variants[0] == variants[1] == variants[2], names
+        fields[names] = variants[0]
+    return fields
 
-def print_parameters():
-    """Prints out the parameters that can be used to freeze the machine code.
 
-    There isn't much of a memory savings, but it's much easier on the newbie
-    because they don't need to import the assembler."""
-    print("# Timing parameters are constant used in Payload_USITT_DMX512_A.")
-    print("class _MinimumTiming:")
-    print('    "Minimum timing from lib/dmx_transmitter/assembly_code.py"')
+def _words(words, indent) -> str:
+    "Format opcodes eight per line, as black would leave them."
+    lines = []
+    for start in range(0, len(words), 8):
+        row = words[start : start + 8]
+        lines.append(indent + " ".join(f"0x{word:04X}," for word in row))
+    return "\n".join(lines)
+
+
+def _module_header(module, summary) -> list:
+    "The license and docstring lines of a generated module."
+    title = f"`dmx_transmitter.{module}`"
+    return [
+        "# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge",
+        "#",
+        "# SPDX-License-Identifier: MIT",
+        '"""',
+        title,
+        "=" * len(title),
+        "",
+        summary,
+        "",
+        "GENERATED by ``python -m dmx_transmitter.assembly_code --write``.",
+        "Do not edit. ``--check`` fails when this drifts from the assembler.",
+        "",
+        "* Author: Dana Runge",
+        '"""',
+        "",
+    ]
+
+
+def frozen_module(program_class=None) -> str:
+    """The text of the frozen module.
+
+    :param program_class: where the opcodes come from. Default: assemble
+        them with :class:`AssemblyCode`.
+    """
+    if program_class is None:
+        program_class = AssemblyCode
+    lines = _module_header("frozen_code", "Frozen machine code and timing constants.")
+    lines += [
+        "ASSEMBLY_CODE_SHA256 = (",
+        f'    "{assembly_code_digest()}"',
+        ")",
+        "",
+        "PIO_KWARGS = " + str(program_class(universes=1).pio_kwargs).replace("'", '"'),
+        "",
+        "MINIMUM_TIMING = {",
+    ]
     for name, value in AssemblyCode.get_timing().items():
-        print(f"    {name} = {value}")
-    print()
-    print()
-    print("# Code varies by universe.")
-    print("# These are used in lib/dmx_transmitter/DMXtx.py")
-    print("class MachineCode:")
-    print('    "Frozen machine code. From lib/dmx_transmitter/assembly_code."')
-    print()
-    print("    def __init__(universes):")
-    print("        self.pio_kwargs = ", end="")
-    print(str(AssemblyCode(universes=1).pio_kwargs).replace("'", '"'))
-    print("        self.assembled = array.array(")
-    print('            "H",')
-    print("            (")
+        lines.append(f'    "{name}": {value},')
+    lines.append("}")
+    lines.append("")
+    lines.append("# Indexed by universes - 1.")
+    lines.append("MACHINE_CODE = (")
     for universes in range(1, 4):
-        print(f"                # {universes} universes:")
-        print("                (")
-        print("                    # fmt: off")
-        code = iter(AssemblyCode(universes=universes).assembled)
-        try:
-            while True:
-                # pylint: disable=consider-using-f-string
-                print("                    ", end="")
-                print("0x{:04X},".format(next(code)), end="")
-                for _ in range(7):
-                    print(" 0x{:04X},".format(next(code)), end="")
-                print()
-        except StopIteration:
-            print()
-            print("                    # fmt: on")
-            print("                ),")
-            continue
-    print("            )[universes - 1],")
-    print("        )")
-    print()
+        lines.append(f"    # {universes} universes:")
+        lines.append("    (")
+        lines.append("        # fmt: off")
+        lines.append(_words(program_class(universes=universes).assembled, " " * 8))
+        lines.append("        # fmt: on")
+        lines.append("    ),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def frozen_pins_module(program_class=None) -> str:
+    """The text of the frozen timing pin module.
+
+    :param program_class: as in :func:`frozen_module`.
+    """
+    lines = _module_header(
+        "frozen_timing_pins", "Frozen timing pin fields of the frozen machine code."
+    )
+    lines.append("# Timing pin values, one digit per opcode (bit n is pin n),")
+    lines.append("# by timing pin names.")
+    lines.append("TIMING_PIN_FIELDS = {")
+    for names, field in timing_pin_fields(program_class).items():
+        key = str(names).replace("'", '"')
+        lines.append(f'    {key}: "{"".join(str(bits) for bits in field)}",')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _frozen_path(directory, name) -> str:
+    "A frozen module's path, in 'directory' or next to this file by default."
+    import os  # pylint: disable=import-outside-toplevel
+
+    if directory is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(directory, name)
+
+
+def _frozen_modules() -> dict:
+    "The text of each frozen module, by file name."
+    return {FROZEN_MODULE: frozen_module(), FROZEN_PINS_MODULE: frozen_pins_module()}
+
+
+def write_frozen(directory=None) -> None:
+    "Assemble and write the frozen modules."
+    for name, text in _frozen_modules().items():
+        with open(_frozen_path(directory, name), "w", encoding="utf-8") as file:
+            file.write(text)
+
+
+def check_frozen(directory=None) -> list:
+    """Compare the frozen modules and the payload with the assembler.
+
+    Returns a list of problems, empty when everything matches.
+    """
+    problems = []
+    for name, text in _frozen_modules().items():
+        with open(_frozen_path(directory, name), "r", encoding="utf-8") as file:
+            frozen = file.read()
+        if frozen != text:
+            problems.append(f"{name} differs from the assembler output.")
+    # pylint: disable=import-outside-toplevel,protected-access
+    from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+    minimum = Payload_USITT_DMX512_A._MinimumTiming
+    for name, value in AssemblyCode.get_timing().items():
+        if getattr(minimum, name) != value:
+            problems.append(f"_MinimumTiming.{name} is not {value}.")
+    try:
+        AssemblyCode.cross_check()
+    except AssertionError as exc:
+        problems.append(f"Payload_USITT_DMX512_A: {exc}")
+    return problems
+
+
+def main(argv=None) -> int:
+    """Command line: --write the frozen modules, or --check them. (exit
+    status)
+
+    Without options, prints the frozen machine code module.
+    """
+    import sys  # pylint: disable=import-outside-toplevel
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ["--write"]:
+        write_frozen()
+        return 0
+    if argv == ["--check"]:
+        problems = check_frozen()
+        for problem in problems:
+            print(problem)
+        return 1 if problems else 0
+    if argv:
+        print("Usage: python -m dmx_transmitter.assembly_code [--write | --check]")
+        return 2
+    print(frozen_module(), end="")
+    return 0
 
 
 if "__main__" == __name__:
-    print_parameters()
+    raise SystemExit(main())
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.async_driver`
+==============================
+
+Drive a :class:`DMXTransmitter` from asyncio, one tick per frame.
+
+Effects register a callback, plain or ``async``, that runs every tick.
+They write into a shared :class:`Batch` rather than the payload; after
+every effect has run, the batch goes into the payload in one
+:meth:`Payload_USITT_DMX512_A.update` and ``show()`` is called once.
+
+Ticks are scheduled from the start time, not from the last tick, so a
+late tick does not push the rest back. How late each tick was is kept
+in 'stats'.
+
+Example::
+
+    driver = AsyncDriver(dmx)
+
+    async def chase(tick, batch):
+        batch[tick % 24] = 255
+
+    driver.every_frame(chase)
+    asyncio.create_task(driver.run())
+
+* Author: Dana Runge
+"""
+
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio  # pylint: disable=import-error
+
+from .masters import channel_writes
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+
+class Batch:
+    """Slot writes collected during one tick. The last write wins.
+
+    Index it like the payload: a slot major index, or (universe, slot),
+    checked as the payload checks it.
+    """
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.writes = {}
+
+    def __setitem__(self, index, val) -> None:
+        if isinstance(index, tuple):
+            for i, value in zip(*channel_writes(self.payload, index, val)):
+                self.writes[i] = value
+            return
+        self.writes[index] = val
+
+    def __len__(self):
+        return len(self.writes)
+
+
+class TickStats:
+    """How late the ticks were. (seconds)
+
+    'jitter' is the standard deviation of the lateness. A tick more than
+    half a period late counts as 'late'; a whole period or more late, the
+    missed ticks are 'skipped'.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.late = 0
+        self.skipped = 0
+        self.maximum = 0.0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    def add(self, lateness, period) -> None:
+        "Record one tick's lateness."
+        self.ticks = self.ticks + 1
+        if lateness > period / 2:
+            self.late = self.late + 1
+        if lateness > self.maximum:
+            self.maximum = lateness
+        # Welford's running mean and variance.
+        delta = lateness - self._mean
+        self._mean = self._mean + delta / self.ticks
+        self._squares = self._squares + delta * (lateness - self._mean)
+
+    @property
+    def mean(self) -> float:
+        "Average lateness."
+        return self._mean
+
+    @property
+    def jitter(self) -> float:
+        "Standard deviation of the lateness."
+        if self.ticks < 2:
+            return 0.0
+        return (self._squares / (self.ticks - 1)) ** 0.5
+
+
+class AsyncDriver:
+    """A frame clock task for a transmitter.
+
+    :param transmitter: a :class:`DMXTransmitter`.
+    :param float period: seconds between ticks. Default: the payload's
+        interval, read every tick.
+    :param clock: a function returning nanoseconds.
+    :param sleep: a coroutine function sleeping for seconds. Default:
+        asyncio.sleep.
+    """
+
+    def __init__(self, transmitter, period=None, clock=None, sleep=None):
+        self.transmitter = transmitter
+        self.period = period
+        self.clock = clock if clock is not None else time.monotonic_ns
+        self.sleep = sleep if sleep is not None else asyncio.sleep
+        self.callbacks = []
+        self.tick = 0
+        self.stats = TickStats()
+        self.running = False
+
+    def every_frame(self, callback):
+        """Call ``callback(tick, batch)`` every tick. It may be ``async``.
+
+        Returns the callback, so this works as a decorator.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def remove(self, callback) -> None:
+        "Stop calling a callback."
+        self.callbacks.remove(callback)
+
+    def _period(self) -> float:
+        "Seconds between ticks."
+        if self.period is not None:
+            return self.period
+        return self.transmitter.payload.timing.interval / 1_000_000
+
+    async def step(self) -> int:
+        "Run every callback, write the batch and show. Returns its size."
+        batch = Batch(self.transmitter.payload)
+        waiting = []
+        for callback in list(self.callbacks):
+            result = callback(self.tick, batch)
+            if result is not None and hasattr(result, "send"):
+                waiting.append(result)
+        if waiting:
+            await asyncio.gather(*waiting)
+        if batch.writes:
+            self.transmitter.payload.update(batch.writes)
+        self.transmitter.show()
+        self.tick = self.tick + 1
+        return len(batch)
+
+    async def run(self, ticks=None) -> None:
+        """The frame clock. Runs until :meth:`stop`, or for 'ticks' ticks."""
+        self.running = True
+        start = self.clock()
+        due = 0  # Nanoseconds after start.
+        count = 0
+        while self.running and (ticks is None or count < ticks):
+            period = int(self._period() * 1_000_000_000)
+            wait = start + due - self.clock()
+            if wait > 0:
+                await self.sleep(wait / 1_000_000_000)
+            lateness = self.clock() - start - due
+            if lateness >= period:
+                # Missed whole ticks. Skip them rather than bunch up.
+                missed = lateness // period
+                self.stats.skipped = self.stats.skipped + missed
+                due = due + missed * period
+                lateness = lateness - missed * period
+            self.stats.add(lateness / 1_000_000_000, period / 1_000_000_000)
+            await self.step()
+            due = due + period
+            count = count + 1
+        self.running = False
+
+    def stop(self) -> None:
+        "End :meth:`run` after the current tick."
+        self.running = False
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.compliance`
+============================
+
+Check payload timing against the USITT DMX512-A transmitter limits.
+
+The payload setters only refuse what the state machine cannot send. This
+checks what the standard allows, without raising: every limit is a row in
+:data:`LIMITS`, and a report lists each check with its margin. A whole
+batch of venue configurations can be checked in one call, without
+building payloads::
+
+    report = check(dmx.payload)
+    if not report.compliant:
+        print(report.worst)
+
+* Author: Dana Runge
+"""
+
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple  # pylint: disable=import-error
+
+from .payload_USITT_DMX512_A import frame_timing
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+# Transmitter limits: name, minimum, maximum. (microseconds, or count)
+# Marks include the two 4 microsecond stop bits of the slot before them.
+LIMITS = (
+    ("space_for_break", 92, 1_000_000),
+    ("mark_after_break", 12, 1_000_000),
+    ("mark_after_start_code", 8, 1_000_000),
+    ("mark_between_slots", 8, 1_000_000),
+    # The mark after the terminal slot: mark_before_break, or
+    # mark_after_frame if the transmitter is turned off after the frame.
+    ("mark_after_last_slot", 8, 1_000_000),
+    ("slots", 1, 512),
+    ("break_to_break", 1204, 1_000_000),
+)
+
+# The payload defaults, for configurations that leave a parameter out.
+DEFAULTS = {
+    "mark_before_break": 8,
+    "space_for_break": 172,
+    "mark_after_break": 8,
+    "mark_after_start_code": 8,
+    "mark_between_slots": 8,
+    "slots": 512,
+    "mark_after_frame": False,
+}
+
+Check = namedtuple("Check", ("name", "value", "minimum", "maximum", "margin"))
+Report = namedtuple("Report", ("compliant", "worst", "checks", "timing"))
+
+
+def _values(timing) -> dict:
+    "The checked quantities of a Timing."
+    mark_after_frame = timing.terminal_time - 36
+    return {
+        "space_for_break": timing.space_for_break,
+        "mark_after_break": timing.mark_after_break,
+        "mark_after_start_code": timing.start_code_time - 36,
+        # With one slot there is no mark between slots.
+        "mark_between_slots": timing.slot_time - 36 if timing.slots > 1 else None,
+        "mark_after_last_slot": mark_after_frame or timing.mark_before_break,
+        "slots": timing.slots,
+        "break_to_break": timing.interval,
+    }
+
+
+def check_timing(timing) -> Report:
+    """Check a :class:`Timing`, from a payload's 'timing' property or
+    :func:`frame_timing`."""
+    values = _values(timing)
+    checks = []
+    worst = None
+    for name, minimum, maximum in LIMITS:
+        value = values[name]
+        if value is None:
+            continue
+        margin = min(value - minimum, maximum - value)
+        item = Check(name, value, minimum, maximum, margin)
+        checks.append(item)
+        if worst is None or margin < worst.margin:
+            worst = item
+    return Report(worst.margin >= 0, worst, checks, timing)
+
+
+def check(payload) -> Report:
+    """Check a payload's timing.
+
+    :param payload: a :class:`Payload_USITT_DMX512_A`, or a dictionary of
+        its timing parameters and 'slots'. Missing entries take the
+        payload defaults.
+    """
+    if isinstance(payload, dict):
+        unknown = [name for name in payload if name not in DEFAULTS]
+        if unknown:
+            raise ValueError(f"Unknown timing parameters: {', '.join(unknown)}")
+        config = dict(DEFAULTS, **payload)
+        if config["mark_after_frame"] is True:
+            config["mark_after_frame"] = 8  # As mark_after_frame_default.
+        return check_timing(
+            frame_timing(
+                config["mark_before_break"],
+                config["space_for_break"],
+                config["mark_after_break"],
+                config["mark_after_start_code"],
+                config["mark_between_slots"],
+                config["slots"],
+                config["mark_after_frame"],
+            )
+        )
+    return check_timing(payload.timing)
+
+
+def check_all(configurations):
+    """Check many payloads or timing dictionaries, as in :func:`check`.
+
+    Returns the reports in order. A dictionary of configurations gives a
+    dictionary of reports with the same keys.
+    """
+    if isinstance(configurations, dict):
+        return {key: check(config) for key, config in configurations.items()}
+    return [check(config) for config in configurations]
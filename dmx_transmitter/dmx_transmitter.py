@@ -21,19 +21,10 @@ Implementation Notes
 """
 
 import array
-import rp2pio
-
-from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
-
-try:
-    from .timing_pins import TimingPins
-except ImportError:
-
-    def TimingPins(*timing_pins, program=None):  # pylint: disable=invalid-name
-        "Fake timing pins manager, for when not loaded."
-        assert not timing_pins
-        return program
 
+# rp2pio, the payload, frozen_code.py and timing_pins.py are imported on
+# first use, not here, to keep importing this module small.
+# frozen_timing_pins.py is only imported when timing pins are used.
 
 __author__ = "Dana Runge"
 __version__ = "0.0.0+auto.0"
@@ -65,6 +56,13 @@ class DMXTransmitter:
     :param list timing_pins: a list of :class:`TimingPin` class methods that
         control how many, and which TimingPin functionalities to implement.
 
+    :param recorder: an optional :class:`FrameRecorder` that is given every
+        frame sent by :meth:`show` and :meth:`run`, and every :meth:`stop`.
+        It can also be set later with the 'recorder' attribute.
+
+    :param state_machine_class: replaces rp2pio.StateMachine, for example
+        with a stand-in that records writes, to test on a host.
+
     If this state machine is cloned, :meth:`clone` both pin counts
     will be needed in the cloned state machine.
     """
@@ -76,36 +74,45 @@ class DMXTransmitter:
         universes=1,
         first_timing_pin=None,
         timing_pins=(),
-        payload_class=Payload_USITT_DMX512_A,
+        payload_class=None,
         clone_from=None,
         exclusive_pin_use=True,
+        recorder=None,
+        state_machine_class=None,
         **kwargs,
     ) -> None:
         # Bind a list-like object to a PIO state machine to send DMX.
+        self.recorder = recorder
         if clone_from is None:
             #
             # Initiate the assembled machine code
             #   and coded-in parameters: universes, and timing_pins
             self.universes = int(universes)
+            if payload_class is None:
+                # pylint: disable=import-outside-toplevel
+                from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+                payload_class = Payload_USITT_DMX512_A
             self.payload = payload_class(universes=self.universes, **kwargs)
-            self.program = TimingPins(
-                *timing_pins,
-                program=MachineCode(
-                    universes=self.universes,
-                ),
-            )
+            self.program = _program(self.universes, timing_pins)
         else:
             #
             # Copy of the code and coded-in parameters
             self.universes = clone_from.universes
+            if payload_class is None:
+                payload_class = type(clone_from.payload)
             self.payload = payload_class(clone_from=clone_from.payload, **kwargs)
             self.program = clone_from.program
         #
         # Setup the runtime environment.
         # State machine
-        self.state_machine = rp2pio.StateMachine(
-            array.array("H", (i & 0xE3FF for i in self.program.assembled)),
-            # **self.program.sm_kwargs,
+        if state_machine_class is None:
+            import rp2pio  # pylint: disable=import-outside-toplevel
+
+            state_machine_class = rp2pio.StateMachine
+        self.state_machine = state_machine_class(
+            self.program.assembled,
+            **self.program.sm_kwargs,
             frequency=1_000_000,
             pull_threshold=16 if self.universes == 1 else 32,
             auto_pull=True,
@@ -142,6 +149,7 @@ class DMXTransmitter:
         :param ~microcontroller.Pin timing_pin: a optional pin used for
             debugging or supporting RDM.
         """
+        kwargs.setdefault("state_machine_class", type(self.state_machine))
         return type(self)(
             first_out_pin, first_timing_pin=first_timing_pin, clone_from=self, **kwargs
         )
@@ -149,18 +157,29 @@ class DMXTransmitter:
     def run(self, once=None) -> None:
         """Link DMX payload to the state machine and out the wire.
 
-        Changes are not buffered, but are sent immediately.
+        Changes are not buffered, but are sent immediately. For immediate
+        changes without tearing, see :class:`LiveWriter`.
         """
         self.state_machine.background_write()
         self.state_machine.background_write(once=once, loop=self.payload.array)
+        if self.recorder is not None:
+            self.recorder.record(self.payload.array, once=once)
 
-    def show(self, once=None) -> None:
+    def show(self, once=None, loop=None) -> None:
         """Buffer DMX payload to the state machine and out the wire.
 
         Changes are not seen until 'show' is called again.
+
+        :param loop: an already encoded frame to send instead of a copy of
+            the payload. For example from :meth:`SceneCache.frame`.
+            It is sent as is, so do not change it while it is being sent.
         """
+        if loop is None:
+            loop = self.payload.array_copy()
         self.state_machine.background_write()
-        self.state_machine.background_write(once=once, loop=self.payload.array_copy())
+        self.state_machine.background_write(once=once, loop=loop)
+        if self.recorder is not None:
+            self.recorder.record(loop, once=once)
 
     def stop(self) -> None:
         """Stop sending data down the wire.
@@ -170,6 +189,8 @@ class DMXTransmitter:
         self.state_machine.background_write(
             once=self.payload.array_stop(), loop=self.payload.array_empty()
         )
+        if self.recorder is not None:
+            self.recorder.record_stop()
 
     def deinit(self) -> None:
         """Turn off the state machine and release its resources."""
@@ -202,40 +223,27 @@ class DMXTransmitter:
         self.payload[index] = val
 
 
+def _program(universes, timing_pins):
+    "The machine code, rewritten for the timing pins if there are any."
+    program = MachineCode(universes=universes)
+    if timing_pins:
+        # pylint: disable=import-outside-toplevel
+        from .timing_pins import TimingPins
+
+        return TimingPins(*timing_pins, program=program)
+    # Clear the sideset bits, they would be read as delays.
+    program.assembled = array.array("H", (i & 0xE3FF for i in program.assembled))
+    return program
+
+
 class MachineCode:  # pylint: disable=too-few-public-methods
-    "Frozen machine code. From lib/dmx_transmitter/assembly_code."
+    "Frozen machine code. From lib/dmx_transmitter/frozen_code."
 
     def __init__(self, universes):
-        self.pio_kwargs = {"sideset_enable": False, "sideset_pin_count": 3}
-        self.assembled = array.array(
-            "H",
-            (
-                # 1 universes:
-                (
-                    # fmt: off
-                    0x6430, 0x0441, 0xB403, 0x7430, 0x1444, 0x7430, 0xAC0B, 0x0C47,
-                    0x6C50, 0x8CE0, 0xA603, 0xE427, 0x6501, 0xA442, 0x044C, 0xA40B,
-                    0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6501, 0xA442,
-                    0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
-                    # fmt: on
-                ),
-                # 2 universes:
-                (
-                    # fmt: off
-                    0x6420, 0x0441, 0xB403, 0x7420, 0x1444, 0x7420, 0xAC0B, 0x0C47,
-                    0x6C40, 0x8CE0, 0xA603, 0xE427, 0x6502, 0x6461, 0x044C, 0xA40B,
-                    0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6502, 0x6461,
-                    0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
-                    # fmt: on
-                ),
-                # 3 universes:
-                (
-                    # fmt: off
-                    0x6420, 0x0441, 0xB403, 0x7420, 0x1444, 0x7420, 0xAC0B, 0x0C47,
-                    0x6C40, 0x8CE0, 0xA603, 0xE427, 0x6503, 0xA442, 0x044C, 0xA40B,
-                    0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6503, 0xA442,
-                    0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
-                    # fmt: on
-                ),
-            )[universes - 1],
-        )
+        from . import frozen_code  # pylint: disable=import-outside-toplevel
+
+        self.universes = universes
+        self.pio_kwargs = dict(frozen_code.PIO_KWARGS)
+        self.frozen = True  # Timing pins may use frozen_timing_pins.py.
+        self.assembled = array.array("H", frozen_code.MACHINE_CODE[universes - 1])
+        self.sm_kwargs = {}
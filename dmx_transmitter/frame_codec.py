@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.frame_codec`
+=============================
+
+Whole frames in and out of a payload, for rendering on a host.
+
+A frame is the slot values of every universe, universe by universe, as a
+``(universes, slots)`` uint8 NumPy array, or as any flat sequence or
+buffer of ``universes * slots`` bytes in the same order.
+
+With NumPy, the payload's words are encoded and decoded with whole array
+shifts and masks, no Python call per slot. NumPy is an optional, host
+only extra, installed with pip rather than the CircuitPython bundle;
+without it the payload's own bulk paths are used. Usually reached through
+:meth:`Payload_USITT_DMX512_A.set_frame` and
+:meth:`Payload_USITT_DMX512_A.get_frame`.
+
+* Author: Dana Runge
+"""
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_LANES = 0x249249  # Universe 0's bits in a 32 bit word.
+
+
+def _words(payload):
+    "The slot words of a payload, as a NumPy view of its array."
+    dtype = {2: numpy.uint16, 4: numpy.uint32, 8: numpy.uint64}[payload.array.itemsize]
+    return numpy.frombuffer(payload.array, dtype=dtype)[payload.slot_index :]
+
+
+def encode(payload, frame) -> None:
+    """Copy a frame into the payload's slots. Timing is kept.
+
+    :param frame: ``(universes, slots)`` values 0-255, or a flat sequence
+        or buffer of them.
+    """
+    size = len(payload)
+    if numpy is not None and isinstance(frame, (bytes, bytearray)):
+        frame = numpy.frombuffer(frame, dtype=numpy.uint8)
+    if numpy is None or not isinstance(frame, numpy.ndarray):
+        if len(frame) != size:
+            raise ValueError(f"Frame must have {size} slot values.")
+        payload.update(range(size), frame)
+        return
+    if frame.size != size:
+        raise ValueError(f"Frame must have {size} slot values.")
+    if frame.dtype != numpy.uint8 and (frame.min() < 0 or frame.max() > 255):
+        raise ValueError("Value out of range")
+    rows = frame.reshape(payload.universes, payload.slots)
+    words = _words(payload)
+    if payload.bits == 16:
+        words[:] = (words & 0xFF00) | rows[0]
+        return
+    # Spread each byte to every third bit, one universe per lane.
+    lanes = 0
+    bits = numpy.zeros(payload.slots, dtype=words.dtype)
+    for universe in range(payload.universes):
+        val = rows[universe].astype(words.dtype)
+        val = (val | val << 8) & 0x00F00F
+        val = (val | val << 4) & 0x0C30C3
+        val = (val | val << 2) & 0x249249
+        bits |= val << universe
+        lanes |= _LANES << universe
+    words[:] = (words & ~numpy.array(lanes, dtype=words.dtype)) | bits
+
+
+def decode(payload):
+    """The payload's slot values as a frame.
+
+    A ``(universes, slots)`` uint8 NumPy array, or without NumPy a
+    bytearray in the same order.
+    """
+    if numpy is None:
+        return bytearray(payload[:])
+    words = _words(payload)
+    if payload.bits == 16:
+        return (words & 0xFF).astype(numpy.uint8).reshape(1, payload.slots)
+    frame = numpy.empty((payload.universes, payload.slots), dtype=numpy.uint8)
+    for universe in range(payload.universes):
+        val = (words >> universe) & 0x249249
+        val = (val | val >> 2) & 0x0C30C3
+        val = (val | val >> 4) & 0x00F00F
+        frame[universe] = (val | val >> 8) & 0xFF
+    return frame
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.frozen_code`
+=============================
+
+Frozen machine code and timing constants.
+
+GENERATED by ``python -m dmx_transmitter.assembly_code --write``.
+Do not edit. ``--check`` fails when this drifts from the assembler.
+
+* Author: Dana Runge
+"""
+
+ASSEMBLY_CODE_SHA256 = (
+    "7279d165e63007f213aab999b2ba3d0ebbcd21e521f3734158d188fc01a1851d"
+)
+
+PIO_KWARGS = {"sideset_enable": False, "sideset_pin_count": 3}
+
+MINIMUM_TIMING = {
+    "mark_before_break_short": 2,
+    "mark_before_break_long": 5,
+    "space_for_break": 4,
+    "mark_after_break": 4,
+    "mark_between_slots": 5,
+    "mark_after_frame": 5,
+}
+
+# Indexed by universes - 1.
+MACHINE_CODE = (
+    # 1 universes:
+    (
+        # fmt: off
+        0x6430, 0x0441, 0xB403, 0x7430, 0x1444, 0x7430, 0xAC0B, 0x0C47,
+        0x6C50, 0x8CE0, 0xA603, 0xE427, 0x6501, 0xA442, 0x044C, 0xA40B,
+        0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6501, 0xA442,
+        0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
+        # fmt: on
+    ),
+    # 2 universes:
+    (
+        # fmt: off
+        0x6420, 0x0441, 0xB403, 0x7420, 0x1444, 0x7420, 0xAC0B, 0x0C47,
+        0x6C40, 0x8CE0, 0xA603, 0xE427, 0x6502, 0x6461, 0x044C, 0xA40B,
+        0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6502, 0x6461,
+        0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
+        # fmt: on
+    ),
+    # 3 universes:
+    (
+        # fmt: off
+        0x6420, 0x0441, 0xB403, 0x7420, 0x1444, 0x7420, 0xAC0B, 0x0C47,
+        0x6C40, 0x8CE0, 0xA603, 0xE427, 0x6503, 0xA442, 0x044C, 0xA40B,
+        0x6428, 0x0451, 0x0489, 0x84E0, 0xA603, 0xE427, 0x6503, 0xA442,
+        0x0456, 0xA40B, 0x6428, 0x0420, 0x045C, 0x80A0,
+        # fmt: on
+    ),
+)
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.frozen_timing_pins`
+====================================
+
+Frozen timing pin fields of the frozen machine code.
+
+GENERATED by ``python -m dmx_transmitter.assembly_code --write``.
+Do not edit. ``--check`` fails when this drifts from the assembler.
+
+* Author: Dana Runge
+"""
+
+# Timing pin values, one digit per opcode (bit n is pin n),
+# by timing pin names.
+TIMING_PIN_FIELDS = {
+    (): "000000000000000000000000000000",
+    ("TRANSMITTING",): "111111111111111111111111111110",
+    ("NOT_TRANSMITTING",): "000000000000000000000000000001",
+    ("MAB",): "000000111100000000000000000000",
+    ("NOT_MAB",): "111111000011111111111111111111",
+    ("BREAK",): "001111000000000000000000000000",
+    ("NOT_BREAK",): "110000111111111111111111111111",
+    ("TRANSMITTING", "NOT_TRANSMITTING"): "111111111111111111111111111112",
+    ("TRANSMITTING", "MAB"): "111111333311111111111111111110",
+    ("TRANSMITTING", "NOT_MAB"): "333333111133333333333333333332",
+    ("TRANSMITTING", "BREAK"): "113333111111111111111111111110",
+    ("TRANSMITTING", "NOT_BREAK"): "331111333333333333333333333332",
+    ("NOT_TRANSMITTING", "TRANSMITTING"): "222222222222222222222222222221",
+    ("NOT_TRANSMITTING", "MAB"): "000000222200000000000000000001",
+    ("NOT_TRANSMITTING", "NOT_MAB"): "222222000022222222222222222223",
+    ("NOT_TRANSMITTING", "BREAK"): "002222000000000000000000000001",
+    ("NOT_TRANSMITTING", "NOT_BREAK"): "220000222222222222222222222223",
+    ("MAB", "TRANSMITTING"): "222222333322222222222222222220",
+    ("MAB", "NOT_TRANSMITTING"): "000000111100000000000000000002",
+    ("MAB", "NOT_MAB"): "222222111122222222222222222222",
+    ("MAB", "BREAK"): "002222111100000000000000000000",
+    ("MAB", "NOT_BREAK"): "220000333322222222222222222222",
+    ("NOT_MAB", "TRANSMITTING"): "333333222233333333333333333331",
+    ("NOT_MAB", "NOT_TRANSMITTING"): "111111000011111111111111111113",
+    ("NOT_MAB", "MAB"): "111111222211111111111111111111",
+    ("NOT_MAB", "BREAK"): "113333000011111111111111111111",
+    ("NOT_MAB", "NOT_BREAK"): "331111222233333333333333333333",
+    ("BREAK", "TRANSMITTING"): "223333222222222222222222222220",
+    ("BREAK", "NOT_TRANSMITTING"): "001111000000000000000000000002",
+    ("BREAK", "MAB"): "001111222200000000000000000000",
+    ("BREAK", "NOT_MAB"): "223333000022222222222222222222",
+    ("BREAK", "NOT_BREAK"): "221111222222222222222222222222",
+    ("NOT_BREAK", "TRANSMITTING"): "332222333333333333333333333331",
+    ("NOT_BREAK", "NOT_TRANSMITTING"): "110000111111111111111111111113",
+    ("NOT_BREAK", "MAB"): "110000333311111111111111111111",
+    ("NOT_BREAK", "NOT_MAB"): "332222111133333333333333333333",
+    ("NOT_BREAK", "BREAK"): "112222111111111111111111111111",
+    ("TRANSMITTING", "NOT_TRANSMITTING", "MAB"): "111111555511111111111111111112",
+    ("TRANSMITTING", "NOT_TRANSMITTING", "NOT_MAB"): "555555111155555555555555555556",
+    ("TRANSMITTING", "NOT_TRANSMITTING", "BREAK"): "115555111111111111111111111112",
+    ("TRANSMITTING", "NOT_TRANSMITTING", "NOT_BREAK"): "551111555555555555555555555556",
+    ("TRANSMITTING", "MAB", "NOT_TRANSMITTING"): "111111333311111111111111111114",
+    ("TRANSMITTING", "MAB", "NOT_MAB"): "555555333355555555555555555554",
+    ("TRANSMITTING", "MAB", "BREAK"): "115555333311111111111111111110",
+    ("TRANSMITTING", "MAB", "NOT_BREAK"): "551111777755555555555555555554",
+    ("TRANSMITTING", "NOT_MAB", "NOT_TRANSMITTING"): "333333111133333333333333333336",
+    ("TRANSMITTING", "NOT_MAB", "MAB"): "333333555533333333333333333332",
+    ("TRANSMITTING", "NOT_MAB", "BREAK"): "337777111133333333333333333332",
+    ("TRANSMITTING", "NOT_MAB", "NOT_BREAK"): "773333555577777777777777777776",
+    ("TRANSMITTING", "BREAK", "NOT_TRANSMITTING"): "113333111111111111111111111114",
+    ("TRANSMITTING", "BREAK", "MAB"): "113333555511111111111111111110",
+    ("TRANSMITTING", "BREAK", "NOT_MAB"): "557777111155555555555555555554",
+    ("TRANSMITTING", "BREAK", "NOT_BREAK"): "553333555555555555555555555554",
+    ("TRANSMITTING", "NOT_BREAK", "NOT_TRANSMITTING"): "331111333333333333333333333336",
+    ("TRANSMITTING", "NOT_BREAK", "MAB"): "331111777733333333333333333332",
+    ("TRANSMITTING", "NOT_BREAK", "NOT_MAB"): "775555333377777777777777777776",
+    ("TRANSMITTING", "NOT_BREAK", "BREAK"): "335555333333333333333333333332",
+    ("NOT_TRANSMITTING", "TRANSMITTING", "MAB"): "222222666622222222222222222221",
+    ("NOT_TRANSMITTING", "TRANSMITTING", "NOT_MAB"): "666666222266666666666666666665",
+    ("NOT_TRANSMITTING", "TRANSMITTING", "BREAK"): "226666222222222222222222222221",
+    ("NOT_TRANSMITTING", "TRANSMITTING", "NOT_BREAK"): "662222666666666666666666666665",
+    ("NOT_TRANSMITTING", "MAB", "TRANSMITTING"): "444444666644444444444444444441",
+    ("NOT_TRANSMITTING", "MAB", "NOT_MAB"): "444444222244444444444444444445",
+    ("NOT_TRANSMITTING", "MAB", "BREAK"): "004444222200000000000000000001",
+    ("NOT_TRANSMITTING", "MAB", "NOT_BREAK"): "440000666644444444444444444445",
+    ("NOT_TRANSMITTING", "NOT_MAB", "TRANSMITTING"): "666666444466666666666666666663",
+    ("NOT_TRANSMITTING", "NOT_MAB", "MAB"): "222222444422222222222222222223",
+    ("NOT_TRANSMITTING", "NOT_MAB", "BREAK"): "226666000022222222222222222223",
+    ("NOT_TRANSMITTING", "NOT_MAB", "NOT_BREAK"): "662222444466666666666666666667",
+    ("NOT_TRANSMITTING", "BREAK", "TRANSMITTING"): "446666444444444444444444444441",
+    ("NOT_TRANSMITTING", "BREAK", "MAB"): "002222444400000000000000000001",
+    ("NOT_TRANSMITTING", "BREAK", "NOT_MAB"): "446666000044444444444444444445",
+    ("NOT_TRANSMITTING", "BREAK", "NOT_BREAK"): "442222444444444444444444444445",
+    ("NOT_TRANSMITTING", "NOT_BREAK", "TRANSMITTING"): "664444666666666666666666666663",
+    ("NOT_TRANSMITTING", "NOT_BREAK", "MAB"): "220000666622222222222222222223",
+    ("NOT_TRANSMITTING", "NOT_BREAK", "NOT_MAB"): "664444222266666666666666666667",
+    ("NOT_TRANSMITTING", "NOT_BREAK", "BREAK"): "224444222222222222222222222223",
+    ("MAB", "TRANSMITTING", "NOT_TRANSMITTING"): "222222333322222222222222222224",
+    ("MAB", "TRANSMITTING", "NOT_MAB"): "666666333366666666666666666664",
+    ("MAB", "TRANSMITTING", "BREAK"): "226666333322222222222222222220",
+    ("MAB", "TRANSMITTING", "NOT_BREAK"): "662222777766666666666666666664",
+    ("MAB", "NOT_TRANSMITTING", "TRANSMITTING"): "444444555544444444444444444442",
+    ("MAB", "NOT_TRANSMITTING", "NOT_MAB"): "444444111144444444444444444446",
+    ("MAB", "NOT_TRANSMITTING", "BREAK"): "004444111100000000000000000002",
+    ("MAB", "NOT_TRANSMITTING", "NOT_BREAK"): "440000555544444444444444444446",
+    ("MAB", "NOT_MAB", "TRANSMITTING"): "666666555566666666666666666662",
+    ("MAB", "NOT_MAB", "NOT_TRANSMITTING"): "222222111122222222222222222226",
+    ("MAB", "NOT_MAB", "BREAK"): "226666111122222222222222222222",
+    ("MAB", "NOT_MAB", "NOT_BREAK"): "662222555566666666666666666666",
+    ("MAB", "BREAK", "TRANSMITTING"): "446666555544444444444444444440",
+    ("MAB", "BREAK", "NOT_TRANSMITTING"): "002222111100000000000000000004",
+    ("MAB", "BREAK", "NOT_MAB"): "446666111144444444444444444444",
+    ("MAB", "BREAK", "NOT_BREAK"): "442222555544444444444444444444",
+    ("MAB", "NOT_BREAK", "TRANSMITTING"): "664444777766666666666666666662",
+    ("MAB", "NOT_BREAK", "NOT_TRANSMITTING"): "220000333322222222222222222226",
+    ("MAB", "NOT_BREAK", "NOT_MAB"): "664444333366666666666666666666",
+    ("MAB", "NOT_BREAK", "BREAK"): "224444333322222222222222222222",
+    ("NOT_MAB", "TRANSMITTING", "NOT_TRANSMITTING"): "333333222233333333333333333335",
+    ("NOT_MAB", "TRANSMITTING", "MAB"): "333333666633333333333333333331",
+    ("NOT_MAB", "TRANSMITTING", "BREAK"): "337777222233333333333333333331",
+    ("NOT_MAB", "TRANSMITTING", "NOT_BREAK"): "773333666677777777777777777775",
+    ("NOT_MAB", "NOT_TRANSMITTING", "TRANSMITTING"): "555555444455555555555555555553",
+    ("NOT_MAB", "NOT_TRANSMITTING", "MAB"): "111111444411111111111111111113",
+    ("NOT_MAB", "NOT_TRANSMITTING", "BREAK"): "115555000011111111111111111113",
+    ("NOT_MAB", "NOT_TRANSMITTING", "NOT_BREAK"): "551111444455555555555555555557",
+    ("NOT_MAB", "MAB", "TRANSMITTING"): "555555666655555555555555555551",
+    ("NOT_MAB", "MAB", "NOT_TRANSMITTING"): "111111222211111111111111111115",
+    ("NOT_MAB", "MAB", "BREAK"): "115555222211111111111111111111",
+    ("NOT_MAB", "MAB", "NOT_BREAK"): "551111666655555555555555555555",
+    ("NOT_MAB", "BREAK", "TRANSMITTING"): "557777444455555555555555555551",
+    ("NOT_MAB", "BREAK", "NOT_TRANSMITTING"): "113333000011111111111111111115",
+    ("NOT_MAB", "BREAK", "MAB"): "113333444411111111111111111111",
+    ("NOT_MAB", "BREAK", "NOT_BREAK"): "553333444455555555555555555555",
+    ("NOT_MAB", "NOT_BREAK", "TRANSMITTING"): "775555666677777777777777777773",
+    ("NOT_MAB", "NOT_BREAK", "NOT_TRANSMITTING"): "331111222233333333333333333337",
+    ("NOT_MAB", "NOT_BREAK", "MAB"): "331111666633333333333333333333",
+    ("NOT_MAB", "NOT_BREAK", "BREAK"): "335555222233333333333333333333",
+    ("BREAK", "TRANSMITTING", "NOT_TRANSMITTING"): "223333222222222222222222222224",
+    ("BREAK", "TRANSMITTING", "MAB"): "223333666622222222222222222220",
+    ("BREAK", "TRANSMITTING", "NOT_MAB"): "667777222266666666666666666664",
+    ("BREAK", "TRANSMITTING", "NOT_BREAK"): "663333666666666666666666666664",
+    ("BREAK", "NOT_TRANSMITTING", "TRANSMITTING"): "445555444444444444444444444442",
+    ("BREAK", "NOT_TRANSMITTING", "MAB"): "001111444400000000000000000002",
+    ("BREAK", "NOT_TRANSMITTING", "NOT_MAB"): "445555000044444444444444444446",
+    ("BREAK", "NOT_TRANSMITTING", "NOT_BREAK"): "441111444444444444444444444446",
+    ("BREAK", "MAB", "TRANSMITTING"): "445555666644444444444444444440",
+    ("BREAK", "MAB", "NOT_TRANSMITTING"): "001111222200000000000000000004",
+    ("BREAK", "MAB", "NOT_MAB"): "445555222244444444444444444444",
+    ("BREAK", "MAB", "NOT_BREAK"): "441111666644444444444444444444",
+    ("BREAK", "NOT_MAB", "TRANSMITTING"): "667777444466666666666666666662",
+    ("BREAK", "NOT_MAB", "NOT_TRANSMITTING"): "223333000022222222222222222226",
+    ("BREAK", "NOT_MAB", "MAB"): "223333444422222222222222222222",
+    ("BREAK", "NOT_MAB", "NOT_BREAK"): "663333444466666666666666666666",
+    ("BREAK", "NOT_BREAK", "TRANSMITTING"): "665555666666666666666666666662",
+    ("BREAK", "NOT_BREAK", "NOT_TRANSMITTING"): "221111222222222222222222222226",
+    ("BREAK", "NOT_BREAK", "MAB"): "221111666622222222222222222222",
+    ("BREAK", "NOT_BREAK", "NOT_MAB"): "665555222266666666666666666666",
+    ("NOT_BREAK", "TRANSMITTING", "NOT_TRANSMITTING"): "332222333333333333333333333335",
+    ("NOT_BREAK", "TRANSMITTING", "MAB"): "332222777733333333333333333331",
+    ("NOT_BREAK", "TRANSMITTING", "NOT_MAB"): "776666333377777777777777777775",
+    ("NOT_BREAK", "TRANSMITTING", "BREAK"): "336666333333333333333333333331",
+    ("NOT_BREAK", "NOT_TRANSMITTING", "TRANSMITTING"): "554444555555555555555555555553",
+    ("NOT_BREAK", "NOT_TRANSMITTING", "MAB"): "110000555511111111111111111113",
+    ("NOT_BREAK", "NOT_TRANSMITTING", "NOT_MAB"): "554444111155555555555555555557",
+    ("NOT_BREAK", "NOT_TRANSMITTING", "BREAK"): "114444111111111111111111111113",
+    ("NOT_BREAK", "MAB", "TRANSMITTING"): "554444777755555555555555555551",
+    ("NOT_BREAK", "MAB", "NOT_TRANSMITTING"): "110000333311111111111111111115",
+    ("NOT_BREAK", "MAB", "NOT_MAB"): "554444333355555555555555555555",
+    ("NOT_BREAK", "MAB", "BREAK"): "114444333311111111111111111111",
+    ("NOT_BREAK", "NOT_MAB", "TRANSMITTING"): "776666555577777777777777777773",
+    ("NOT_BREAK", "NOT_MAB", "NOT_TRANSMITTING"): "332222111133333333333333333337",
+    ("NOT_BREAK", "NOT_MAB", "MAB"): "332222555533333333333333333333",
+    ("NOT_BREAK", "NOT_MAB", "BREAK"): "336666111133333333333333333333",
+    ("NOT_BREAK", "BREAK", "TRANSMITTING"): "556666555555555555555555555551",
+    ("NOT_BREAK", "BREAK", "NOT_TRANSMITTING"): "112222111111111111111111111115",
+    ("NOT_BREAK", "BREAK", "MAB"): "112222555511111111111111111111",
+    ("NOT_BREAK", "BREAK", "NOT_MAB"): "556666111155555555555555555555",
+}
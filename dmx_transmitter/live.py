@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.live`
+======================
+
+Live channel updates without tearing, and without copying whole frames.
+
+:meth:`DMXTransmitter.run` sends the payload itself, so a write can land
+part way through a frame. :meth:`DMXTransmitter.show` avoids that by
+copying the whole payload every time. A :class:`LiveWriter` sits between:
+writers change the payload, which is only a back buffer, and
+:meth:`LiveWriter.publish` copies just the changed words into one of three
+frame buffers and hands it to the state machine. The state machine takes
+the new buffer at the end of the frame it is sending. The buffer being
+sent and the one handed over are never written.
+
+Writers may be several threads or asyncio tasks. They hold a lock only
+for their own write: with 2 or 3 universes every word holds a slot of
+each universe, so even writes to different universes change the same
+words. Publish holds it only to take the values of the changed words, so
+it never sends a write half done.
+
+* Author: Dana Runge
+"""
+
+import array
+import time
+
+try:
+    from threading import Lock
+except ImportError:
+    Lock = None
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+
+class _NoLock:
+    "Stands in for threading.Lock where there are no threads."
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class LiveWriter:
+    """Tear free live updates of a transmitter's payload.
+
+    :param transmitter: a :class:`DMXTransmitter`.
+    :param clock: a function returning nanoseconds.
+    :param sleep: a function sleeping for seconds, for ``publish(wait=True)``.
+
+    Write channels through the writer, not the payload, so it knows what
+    changed. Then publish, as often as once a frame::
+
+        live = LiveWriter(dmx)
+        live.start()
+        live[0:3] = 255
+        live[1, 0] = 128  # Universe 1, slot 0.
+        live.publish()
+    """
+
+    def __init__(self, transmitter, clock=None, sleep=None):
+        self.transmitter = transmitter
+        self.payload = transmitter.payload
+        self.clock = clock if clock is not None else time.monotonic_ns
+        self.sleep = sleep if sleep is not None else time.sleep
+        self._lock = Lock() if Lock is not None else _NoLock()
+        self._dirty = set()
+        self._buffers = [self.payload.array_copy() for _ in range(3)]
+        # Words each frame buffer is missing, by buffer.
+        self._stale = [set(), set(), set()]
+        # The buffers last handed over, and the one before it.
+        self._last = 0
+        self._previous = 0
+        self._published = None
+
+    def _words(self, index):
+        "The array words an index touches."
+        payload = self.payload
+        first = payload.slot_index
+        if isinstance(index, slice):
+            slots = payload.slots
+            return {ix % slots + first for ix in range(*index.indices(len(payload)))}
+        if isinstance(index, tuple):
+            # pylint: disable=protected-access
+            word = payload._locate(index)[1]
+            return word if isinstance(word, range) else (word,)
+        index = int(index)
+        if index < 0:
+            index = index + len(payload)
+        return (index % payload.slots + first,)
+
+    def __len__(self):
+        return len(self.payload)
+
+    def __getitem__(self, index):
+        return self.payload[index]
+
+    def __setitem__(self, index, val) -> None:
+        words = self._words(index)
+        with self._lock:
+            self.payload[index] = val
+            self._dirty.update(words)
+
+    def update(self, indexes, values=None) -> None:
+        "As :meth:`Payload_USITT_DMX512_A.update`."
+        if values is None:
+            pairs = list(indexes.items() if hasattr(indexes, "items") else indexes)
+            indexes = [pair[0] for pair in pairs]
+            values = [pair[1] for pair in pairs]
+        else:
+            indexes = list(indexes)
+        slots = self.payload.slots
+        first = self.payload.slot_index
+        with self._lock:
+            self.payload.update(indexes, values)
+            self._dirty.update(int(ix) % slots + first for ix in indexes)
+
+    def dirty_all(self) -> None:
+        "Publish every word next time. After changing timing on the payload."
+        with self._lock:
+            self._dirty.update(range(len(self.payload.array)))
+
+    def start(self) -> None:
+        "Start sending, from a full copy of the payload."
+        with self._lock:
+            self._dirty.clear()
+            frame = self.payload.array_copy()
+        for buffer, stale in zip(self._buffers, self._stale):
+            buffer[:] = frame
+            stale.clear()
+        self.transmitter.show(loop=self._buffers[0])
+        self._last = self._previous = 0
+        self._published = self.clock()
+
+    def _early(self) -> int:
+        """Nanoseconds until the state machine takes the next buffer handed
+        over, 0 if it would now.
+
+        Asks the state machine, where it can tell whether the last buffer
+        handed over is still pending. Otherwise a buffer is taken within a
+        frame interval.
+        """
+        interval = self.payload.timing.interval * 1000  # Nanoseconds.
+        early = 0
+        if self._published is not None:
+            early = max(self._published + interval - self.clock(), 0)
+        state_machine = self.transmitter.state_machine
+        pending = getattr(
+            state_machine, "pending_write", getattr(state_machine, "pending", None)
+        )
+        if pending is None:
+            return early
+        return max(early, interval // 8) if pending else 0
+
+    def _free(self) -> int:
+        "A frame buffer the state machine is not sending, nor about to."
+        busy = {self._last}
+        sending = getattr(self.transmitter.state_machine, "last_write", None)
+        for number, buffer in enumerate(self._buffers):
+            if buffer is sending:
+                busy.add(number)
+                break
+        else:
+            # Which one is being sent is not known: the one handed over
+            # before the last may still be.
+            busy.add(self._previous)
+        for step in (1, 2):
+            number = (self._last + step) % 3
+            if number not in busy:
+                return number
+        raise RuntimeError("No free frame buffer")  # Not with three.
+
+    def publish(self, wait=False) -> bool:
+        """Send what changed since the last publish, from the next frame on.
+
+        A buffer is only handed over once the state machine has taken the
+        last one: when it says so, or else a frame interval after the last
+        was handed over. Sooner than that, returns False and keeps the
+        changes for the next publish, or with 'wait', sleeps until then.
+
+        Returns True once published.
+        """
+        early = self._early()
+        while early:
+            if not wait:
+                return False
+            self.sleep(early / 1_000_000_000)
+            early = self._early()
+        number = self._free()
+        # The only locked step: take the values of the changed words, so
+        # no write is published half done.
+        stale = self._stale[number]
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            for missing in self._stale:
+                missing.update(dirty)
+            words = self.payload.array
+            values = [(word, words[word]) for word in stale]
+        buffer = self._buffers[number]
+        for word, val in values:
+            buffer[word] = val
+        stale.clear()
+        self.transmitter.state_machine.background_write(loop=buffer)
+        recorder = getattr(self.transmitter, "recorder", None)
+        if recorder is not None:
+            recorder.record(buffer)
+        self._last, self._previous = number, self._last
+        self._published = self.clock()
+        return True
+
+    @property
+    def frame(self) -> array.array:
+        "The frame buffer most recently published."
+        return self._buffers[self._last]
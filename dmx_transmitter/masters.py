@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.masters`
+=========================
+
+A grand master, universe masters and group submasters, applied as the
+channels are encoded into the payload.
+
+The channel values written through :class:`Masters` are kept as they
+were set. The payload gets them scaled by every master over them, looked
+up in a 256 entry table per master level. Moving a fader only re-encodes
+the channels whose scale changed, a table lookup per run of channels::
+
+    masters = Masters(dmx.payload)
+    masters[0:6] = 255
+    masters.group("front", range(0, 3))
+    masters.set_group("front", 128)   # Channels 0 - 2 at half.
+    masters.grand = 0                 # Blackout. The values are kept.
+
+* Author: Dana Runge
+"""
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+_TABLES = 16  # Scale tables kept, 256 bytes each.
+_tables = {}
+
+
+def scale_table(level) -> bytes:
+    """The 256 entry table scaling a value by a master level.
+
+    :param int level: 0 (black) to 255 (unchanged).
+    """
+    table = _tables.get(level)
+    if table is None:
+        if not 0 <= level <= 255:
+            raise ValueError("Value out of range")
+        if len(_tables) >= _TABLES:
+            _tables.clear()
+        table = _tables[level] = bytes((val * level + 127) // 255 for val in range(256))
+    return table
+
+
+def _translate(values, table) -> bytes:
+    "Look every value up in a table."
+    if hasattr(values, "translate"):
+        return values.translate(table)
+    return bytes(table[val] for val in values)
+
+
+def _scale(first, second) -> int:
+    "Two master levels, one over the other."
+    return (first * second + 127) // 255
+
+
+def channel_index(payload, index):
+    """A slot major index of the payload, or a range of them.
+
+    :param index: a slot major index, a slice, or (universe, slot), checked
+        as the payload checks them.
+    """
+    if isinstance(index, tuple):
+        # pylint: disable=protected-access
+        universe, word = payload._locate(index)
+        first = universe * payload.slots - payload.slot_index
+        if isinstance(word, range):
+            return range(word.start + first, word.stop + first, word.step)
+        return word + first
+    size = len(payload)
+    if isinstance(index, slice):
+        return range(*index.indices(size))
+    index = int(index)
+    if index < 0:
+        index = index + size
+    if not 0 <= index < size:
+        raise IndexError("Index out of range")
+    return index
+
+
+def channel_writes(payload, index, val) -> tuple:
+    """The (indexes, values) of ``channels[index] = val``: a value, or a
+    sequence the size of a slice."""
+    index = channel_index(payload, index)
+    if isinstance(index, range):
+        try:
+            val = list(val)
+        except TypeError:
+            val = [val] * len(index)
+        return index, val
+    return (index,), (val,)
+
+
+def checked_writes(indexes, values, size) -> tuple:
+    """'indexes' and 'values' as lists, once every index is below 'size'
+    and every value is 0 - 255. Nothing is written before this."""
+    indexes = list(indexes)
+    values = list(values)
+    if len(indexes) != len(values):
+        raise ValueError("'indexes' and 'values' must be the same length")
+    if indexes and (min(indexes) < 0 or max(indexes) >= size):
+        raise IndexError("Index out of range")
+    if values and (min(values) < 0 or max(values) > 255):
+        raise ValueError("Value out of range")
+    return indexes, values
+
+
+class Masters:
+    """Master levels over a payload's channels.
+
+    :param payload: the payload to encode into. Its current values become
+        the starting channel values.
+
+    Index like the payload: a slot major index, a slice, or
+    (universe, slot). Reading returns the channel values as set, not as
+    scaled.
+    """
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.values = bytearray(payload[:])
+        self._grand = 255
+        self._universes = [255] * payload.universes
+        self._groups = {}
+        self._levels = bytearray(b"\xff" * len(payload))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        index = channel_index(self.payload, index)
+        if isinstance(index, range):
+            return [self.values[channel] for channel in index]
+        return self.values[index]
+
+    def __setitem__(self, index, val) -> None:
+        self.update(*channel_writes(self.payload, index, val))
+
+    def update(self, indexes, values) -> None:
+        "Set many channel values, and encode them, in one call."
+        indexes, values = checked_writes(indexes, values, len(self.values))
+        levels = self._levels
+        scaled = []
+        for index, val in zip(indexes, values):
+            self.values[index] = val
+            scaled.append(scale_table(levels[index])[val])
+        self.payload.update(indexes, scaled)
+
+    @property
+    def grand(self) -> int:
+        "The grand master, over every channel. 0 - 255."
+        return self._grand
+
+    @grand.setter
+    def grand(self, level) -> None:
+        scale_table(level)
+        self._grand = level
+        self._refresh()
+
+    def universe(self, universe) -> int:
+        "A universe's master level."
+        return self._universes[universe]
+
+    def set_universe(self, universe, level) -> None:
+        "Set a universe's master level. 0 - 255."
+        scale_table(level)
+        self._universes[universe] = level
+        self._refresh()
+
+    def group(self, name, indexes, level=255) -> None:
+        """Add, or replace, a submaster over some channels.
+
+        :param name: any hashable name.
+        :param indexes: slot major indexes, or a slice. A channel may be in
+            several groups; their levels multiply.
+        :param int level: 0 - 255.
+        """
+        if isinstance(indexes, slice):
+            indexes = range(*indexes.indices(len(self.values)))
+        indexes = tuple(indexes)
+        if indexes and (min(indexes) < 0 or max(indexes) >= len(self.values)):
+            raise IndexError("Index out of range")
+        scale_table(level)
+        self._groups[name] = [indexes, level]
+        self._refresh()
+
+    def set_group(self, name, level) -> None:
+        "Set a submaster's level. 0 - 255."
+        scale_table(level)
+        self._groups[name][1] = level
+        self._refresh()
+
+    def remove_group(self, name) -> None:
+        "Remove a submaster."
+        del self._groups[name]
+        self._refresh()
+
+    def _new_levels(self) -> bytearray:
+        "Every channel's level, under the grand, universe and group masters."
+        slots = self.payload.slots
+        levels = bytearray(len(self.values))
+        for universe, level in enumerate(self._universes):
+            level = _scale(self._grand, level)
+            levels[universe * slots : (universe + 1) * slots] = bytes([level]) * slots
+        for indexes, level in self._groups.values():
+            if level != 255:
+                for index in indexes:
+                    levels[index] = _scale(levels[index], level)
+        return levels
+
+    def _refresh(self) -> None:
+        "Work out every channel's level, and re-encode those that changed."
+        slots = self.payload.slots
+        levels = self._new_levels()
+        # Re-encode each run of channels at one level, if its level moved.
+        indexes = []
+        scaled = bytearray()
+        old = self._levels
+        for first in range(0, len(levels), slots):
+            end = first + slots
+            if old[first:end] == levels[first:end]:
+                continue
+            if levels[first:end] == bytes(levels[first : first + 1]) * slots:
+                stops = (end,)  # No submasters here, one run.
+            else:
+                stops = range(first + 1, end + 1)
+            start = first
+            for stop in stops:
+                if stop < end and levels[stop] == levels[start]:
+                    continue
+                if old[start:stop] != levels[start:stop]:
+                    table = scale_table(levels[start])
+                    indexes.extend(range(start, stop))
+                    scaled.extend(_translate(self.values[start:stop], table))
+                start = stop
+        self._levels = levels
+        if len(indexes) == len(levels):
+            self.payload.set_frame(scaled)
+        else:
+            self.payload.update(indexes, scaled)
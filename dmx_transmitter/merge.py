@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.merge`
+=======================
+
+Merge several sources of lighting data into one payload.
+
+When two consoles, or a console and some local effects, drive the same
+universe, each one gets a :class:`MergeSource`. The :class:`Merger` combines
+them per channel with HIGHEST TAKES PRECEDENCE (HTP) or LATEST TAKES
+PRECEDENCE (LTP) and writes the result into the payload.
+
+Only the channels a source changed are recomputed, so a merge with nothing
+new to do costs almost nothing.
+
+* Author: Dana Runge
+"""
+
+import time
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+HTP = 0
+"Highest Takes Precedence: the largest value of all live sources wins."
+
+LTP = 1
+"Latest Takes Precedence: the source that last changed a channel wins."
+
+_NO_OWNER = 0xFF
+
+
+class MergeSource:
+    """One source of lighting data for a :class:`Merger`.
+
+    Behaves like a list of byte values in the same slot major order as
+    the payload. Not constructed by the user, see :meth:`Merger.add_source`.
+
+    A source is live from its first write until it has been quiet for longer
+    than the merger's timeout. Call :meth:`touch` to keep a source alive
+    without changing any values.
+    """
+
+    def __init__(self, merger, number, name=None):
+        self._merger = merger
+        self.number = number
+        self.name = name
+        self.values = bytearray(len(merger))
+        self.last_seen = None
+        self.live = False
+
+    def touch(self) -> None:
+        "Mark this source as alive, without changing any values."
+        self.last_seen = self._merger.clock()
+        if not self.live:
+            self.live = True
+            self._merger.dirty_all()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __setitem__(self, index, val) -> None:
+        merger = self._merger
+        if isinstance(index, slice):
+            indexes = range(*index.indices(len(self.values)))
+            try:
+                val = list(val)
+            except TypeError:
+                val = [val] * len(indexes)
+            if len(val) != len(indexes):
+                raise ValueError(
+                    f"Can only assign a slice of the same size. ({len(indexes)})"
+                )
+        else:
+            index = int(index)
+            if index < 0:
+                index = index + len(self.values)
+            if index < 0 or index >= len(self.values):
+                raise IndexError("Index out of range")
+            indexes = (index,)
+            val = (val,)
+        for channel, value in zip(indexes, val):
+            value = int(value)
+            if value < 0 or value > 255:
+                raise ValueError("Value out of range")
+            if self.values[channel] != value or merger.modes[channel] == LTP:
+                self.values[channel] = value
+                merger.owners[channel] = self.number
+                merger.dirty.add(channel)
+        self.touch()
+
+
+class Merger:
+    """Merge several :class:`MergeSource` objects into one payload.
+
+    :param payload: the destination, usually ``dmx.payload``.
+
+    :param int mode: the default merge mode for every channel,
+        :data:`HTP` or :data:`LTP`. Default: HTP.
+
+    :param float timeout: seconds without data before a source is dropped.
+        None never drops a source. Default: 2.5, as in ANSI E1.31.
+
+    :param clock: a function returning nanoseconds. Default
+        ``time.monotonic_ns``. Useful for testing.
+
+    Typical use, once per frame::
+
+        merger = Merger(dmx.payload)
+        console = merger.add_source("console")
+        effects = merger.add_source("effects")
+        ...
+        console[0:3] = 255
+        merger.merge()
+        dmx.show()
+    """
+
+    def __init__(self, payload, mode=HTP, timeout=2.5, clock=None):
+        if mode not in (HTP, LTP):
+            raise ValueError("'mode' must be HTP or LTP")
+        self.payload = payload
+        self.clock = clock if clock is not None else time.monotonic_ns
+        self.timeout = None if timeout is None else int(timeout * 1_000_000_000)
+        self.sources = []
+        self.modes = bytearray([mode] * len(payload))
+        self.owners = bytearray([_NO_OWNER] * len(payload))
+        self.merged = bytearray(payload[:])
+        self.dirty = set()
+        self._dirty_all = False
+
+    def __len__(self):
+        return len(self.payload)
+
+    def add_source(self, name=None) -> MergeSource:
+        "Create a new source. Up to 255 sources."
+        numbers = [source.number for source in self.sources]
+        for number in range(_NO_OWNER):
+            if number not in numbers:
+                break
+        else:
+            raise ValueError("No more than 255 sources.")
+        source = MergeSource(self, number, name)
+        self.sources.append(source)
+        return source
+
+    def remove_source(self, source) -> None:
+        "Stop merging this source."
+        self.sources.remove(source)
+        self.dirty_all()
+
+    def set_mode(self, index, mode) -> None:
+        """Set the merge mode for a channel, or a slice of channels.
+
+        For example, dimmers in HTP and moving light positions in LTP.
+        """
+        if mode not in (HTP, LTP):
+            raise ValueError("'mode' must be HTP or LTP")
+        if isinstance(index, slice):
+            for channel in range(*index.indices(len(self))):
+                self.modes[channel] = mode
+        else:
+            self.modes[int(index)] = mode
+        self.dirty_all()
+
+    def dirty_all(self) -> None:
+        "Recompute every channel on the next merge."
+        self._dirty_all = True
+
+    def _expire(self, now) -> None:
+        "Drop the sources that have timed out."
+        if self.timeout is None:
+            return
+        for source in self.sources:
+            if source.live and now - source.last_seen > self.timeout:
+                source.live = False
+                self._dirty_all = True
+
+    def merge(self) -> int:
+        """Merge the changed channels into the payload.
+
+        Returns the number of payload channels that were written.
+        """
+        self._expire(self.clock())
+        if self._dirty_all:
+            dirty = range(len(self))
+            self._dirty_all = False
+            self.dirty.clear()
+        elif self.dirty:
+            dirty, self.dirty = self.dirty, set()
+        else:
+            return 0
+        live = [source for source in self.sources if source.live]
+        by_number = {source.number: source for source in live}
+        latest = None
+        if live:
+            latest = live[0]
+            for source in live:
+                if source.last_seen > latest.last_seen:
+                    latest = source
+        modes = self.modes
+        owners = self.owners
+        merged = self.merged
+        indexes = []
+        values = []
+        for index in dirty:
+            if not live:
+                val = 0
+            elif modes[index] == HTP:
+                val = max(source.values[index] for source in live)
+            else:
+                owner = by_number.get(owners[index], latest)
+                val = owner.values[index]
+            if val != merged[index]:
+                merged[index] = val
+                indexes.append(index)
+                values.append(val)
+        self.payload.update(indexes, values)
+        return len(indexes)
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=invalid-name
+# pylint: enable=invalid-name
+"""
+`dmx_transmitter.payload_Alternate_Start_Code`
+==============================================
+
+Payloads for frames with a START CODE other than NULL.
+
+* Text Packet, START CODE 0x17.
+* System Information Packet, START CODE 0xCF.
+* Manufacturer specific, START CODE 0x91.
+
+Each payload builds its data slots from a message. The encoded words are
+cached, so the same message is never encoded twice. Send these payloads
+between NULL START CODE frames with ``dmx.show(once=packet.array_copy())``,
+or add them to a :class:`Sequencer`.
+
+* Author: Dana Runge
+"""
+
+from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+# Encoded messages, by class: (words by key, keys oldest first).
+_caches = {}
+
+
+def checksum8(data, start_code=0) -> int:
+    "The 8 bit additive checksum of a START CODE and data slots."
+    return (start_code + sum(data)) & 0xFF
+
+
+def checksum16(data, start_code=0) -> int:
+    "The 16 bit additive checksum of a START CODE and data slots."
+    return (start_code + sum(data)) & 0xFFFF
+
+
+class Payload_Alternate_Start_Code(Payload_USITT_DMX512_A):
+    """Base class of payloads built from a message.
+
+    Subclasses set START_CODE and implement :meth:`encode_message`.
+    The slot count is the length of the encoded message.
+
+    :param message: passed to :meth:`encode_message`.
+
+    :param int universes: as in Payload_USITT_DMX512_A. Every universe
+        gets the same message.
+
+    :param Payload_USITT_DMX512_A clone_from: copy the timing of this payload,
+        usually ``dmx.payload``.
+    """
+
+    START_CODE = None
+    CACHE_SIZE = 8
+    "How many encoded messages each class keeps."
+
+    def __init__(self, *message, universes=1, clone_from=None, **kwargs):
+        data = self.encode_message(*message, **kwargs)
+        self.data_slots = b""
+        super().__init__(universes=universes, slots=len(data), clone_from=clone_from)
+        self._load_data(data)
+        self._message = (message, kwargs)
+
+    def _init_start_code(self, start_code=None) -> None:
+        "Set this class's START CODE."
+        super()._init_start_code(self.START_CODE)
+
+    def encode_message(self, *message, **kwargs) -> bytes:
+        "Return the data slots for a message."
+        raise NotImplementedError("Subclasses implement encode_message.")
+
+    def clone(self, slots=None, **kwargs):  # pylint: disable=unused-argument
+        "Clone this object, with the same message."
+        message, message_kwargs = self._message
+        return type(self)(*message, clone_from=self, **dict(message_kwargs, **kwargs))
+
+    def set_message(self, *message, **kwargs) -> None:
+        """Change the message. It must encode to the same number of slots."""
+        data = self.encode_message(*message, **kwargs)
+        if len(data) != self.slots:
+            raise ValueError(
+                f"Message needs {len(data)} slots, this payload has {self.slots}."
+            )
+        self._load_data(data)
+        self._message = (message, kwargs)
+
+    def _load_data(self, data) -> None:
+        "Copy in the words for 'data', from the cache when possible."
+        cache, order = _caches.setdefault(type(self), ({}, []))
+        key = (
+            bytes(data),
+            self.universes,
+            self._mark_between_slots,
+            self._get_mark_val(self.array[-1]),
+        )
+        words = cache.get(key)
+        if words is None:
+            slots = self.slots
+            self.update(
+                range(slots * self.universes),
+                [data[i % slots] for i in range(slots * self.universes)],
+            )
+            words = self.array[self.slot_index :]
+            cache[key] = words
+            order.append(key)
+            while len(order) > self.CACHE_SIZE:
+                del cache[order.pop(0)]
+        else:
+            self.array[self.slot_index :] = words
+        self.data_slots = bytes(data)
+
+
+class Payload_Text_Packet(Payload_Alternate_Start_Code):
+    """An ASCII Text Packet, START CODE 0x17.
+
+    :param str text: the ASCII text. A NUL terminator is added.
+    :param int page: the page number. Default: 0.
+    :param int characters_per_line: suggested line length for the receiving
+        display. 0 for none. Default: 0.
+    """
+
+    START_CODE = 0x17
+
+    # pylint: disable=arguments-differ
+    def encode_message(self, text, page=0, characters_per_line=0) -> bytes:
+        "Page, characters per line, then the NUL terminated text."
+        if isinstance(text, str):
+            text = text.encode("ascii")
+        data = bytes((int(page), int(characters_per_line))) + bytes(text) + b"\0"
+        if len(data) > 512:
+            raise ValueError("Text is too long. At most 509 characters.")
+        return data
+
+
+class Payload_System_Information_Packet(Payload_Alternate_Start_Code):
+    """A System Information Packet (SIP), START CODE 0xCF.
+
+    Data slots::
+
+        1      checksum pointer: slots from here to the SIP checksum
+        2      SIP control bit field
+        3-4    16 bit checksum of the previous packet (MSB first)
+        5      SIP sequence number
+        6      universe number
+        7      processing level
+        8      software version
+        9-10   standard packet length (MSB first)
+        11-12  packets sent since the last SIP (MSB first)
+        13-22  manufacturer IDs of up to five devices (MSB first)
+        23     SIP checksum, the 8 bit sum of the START CODE and slots 1-22
+
+    :param previous: the data slots of the previous packet, to checksum.
+        Or the 16 bit checksum itself, as an integer.
+    :param int sequence: SIP sequence number.
+    :param int universe: universe number.
+    :param int level: processing level. Default: 0.
+    :param int software: software version. Default: 0.
+    :param int packet_length: standard packet length. Default: 513.
+    :param int packets: packets sent since the last SIP. Default: 0.
+    :param tuple manufacturers: up to five ESTA manufacturer IDs.
+    :param int control: SIP control bit field. Default: 0.
+    """
+
+    START_CODE = 0xCF
+
+    # pylint: disable=arguments-differ,too-many-arguments
+    def encode_message(
+        self,
+        previous,
+        sequence=0,
+        universe=0,
+        level=0,
+        software=0,
+        packet_length=513,
+        packets=0,
+        manufacturers=(),
+        control=0,
+    ) -> bytes:
+        "Assemble the SIP slots and append the SIP checksum."
+        if not isinstance(previous, int):
+            previous = checksum16(previous)
+        if len(manufacturers) > 5:
+            raise ValueError("At most five manufacturer IDs.")
+        manufacturers = tuple(manufacturers) + (0,) * (5 - len(manufacturers))
+        words = (previous, packet_length, packets) + manufacturers
+        data = bytearray((22, control))
+        data.extend((words[0] >> 8 & 0xFF, words[0] & 0xFF))
+        data.extend((sequence & 0xFF, universe & 0xFF, level & 0xFF, software & 0xFF))
+        for word in words[1:]:
+            data.extend((word >> 8 & 0xFF, word & 0xFF))
+        data.append(checksum8(data, self.START_CODE))
+        return bytes(data)
+
+
+class Payload_Manufacturer_Specific(Payload_Alternate_Start_Code):
+    """A manufacturer specific packet, START CODE 0x91.
+
+    :param int manufacturer: the ESTA manufacturer ID. Sent MSB first in
+        the first two data slots.
+    :param data: the manufacturer's data slots.
+    """
+
+    START_CODE = 0x91
+
+    # pylint: disable=arguments-differ
+    def encode_message(self, manufacturer, data=b"") -> bytes:
+        "Manufacturer ID, then the data."
+        data = bytes((manufacturer >> 8 & 0xFF, manufacturer & 0xFF)) + bytes(data)
+        if len(data) > 512:
+            raise ValueError("Data is too long. At most 510 bytes.")
+        return data
@@ -20,11 +20,77 @@ This class can be used to adjust the DMX timing.
 """
 
 import array
+import sys
+
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple  # pylint: disable=import-error
 
 __author__ = "Dana Runge"
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
 
+# The timing of a whole frame, from Payload_USITT_DMX512_A.timing, in
+# microseconds. start_code_time, slot_time and terminal_time are each one
+# byte on the wire: start bit, 8 data bits and the mark after. The frame has
+# one START CODE, slots - 1 data slots and one terminal slot. 'refresh' is
+# frames per second (Hz).
+Timing = namedtuple(
+    "Timing",
+    (
+        "mark_before_break",
+        "space_for_break",
+        "mark_after_break",
+        "start_code_time",
+        "slot_time",
+        "slots",
+        "terminal_time",
+        "interval",
+        "refresh",
+    ),
+)
+
+
+def frame_timing(  # pylint: disable=too-many-arguments
+    mark_before_break,
+    space_for_break,
+    mark_after_break,
+    mark_after_start_code,
+    mark_between_slots,
+    slots,
+    mark_after_frame=False,
+) -> Timing:
+    """The :class:`Timing` of a frame with these parameters. (microseconds)
+
+    For checking timings without building a payload.
+    """
+    # Every slot on the wire: a 4 microsecond start bit, 8 data bits of
+    # 4 microseconds each, then the mark (including stop bits).
+    start_code_time = 4 + 32 + mark_after_start_code
+    slot_time = 4 + 32 + mark_between_slots
+    # The last slot is the terminal slot.
+    terminal_time = 4 + 32 + (mark_after_frame or 0)
+    interval = (
+        mark_before_break
+        + space_for_break
+        + mark_after_break
+        + start_code_time
+        + (slots - 1) * slot_time
+        + terminal_time
+    )
+    return Timing(
+        mark_before_break,
+        space_for_break,
+        mark_after_break,
+        start_code_time,
+        slot_time,
+        slots,
+        terminal_time,
+        interval,
+        1_000_000 / interval,
+    )
+
 
 def bit_interlace(integer: int, interlace: int) -> int:
     """Interlace input bits with zero bits.
@@ -72,6 +138,24 @@ def bit_deinterlace(integer: int, deinterlace: int) -> int:
     return output
 
 
+_LANE = 0b001_001_001_001_001_001_001_001  # Universe 0's bits in a 32 bit word.
+
+
+def _spread(val: int) -> int:
+    "bit_interlace(val, 2) for one byte, without a loop."
+    val = (val | val << 8) & 0x00F00F
+    val = (val | val << 4) & 0x0C30C3
+    return (val | val << 2) & 0x249249
+
+
+def _compress(val: int) -> int:
+    "bit_deinterlace(val & _LANE, 2), without a loop. The inverse of _spread."
+    val = val & 0x249249
+    val = (val | val >> 2) & 0x0C30C3
+    val = (val | val >> 4) & 0x00F00F
+    return (val | val >> 8) & 0xFF
+
+
 class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
     """This object mimics a list of byte values, and stores it and timing
     parameters into a data structure suitable for sending into a DMX512TxEngine
@@ -82,7 +166,9 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
     the list indexes.
 
     This virtual list has a fixed size, the product of 'slots' and 'universes'.
-    Indexes are in slot major order.
+    Indexes are in slot major order. A (universe, slot) index also works,
+    such as ``payload[1, 0]`` or ``payload[1, 0:24]``, and is quicker than
+    working out the flat index.
 
     Like Python lists, slicing is supported, but because of the fixed size,
     slice assignment is limited. A slice assignment from a list-like object
@@ -132,6 +218,13 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
     ##       +--------+--------+--------+--------+ +--------+--------+
     ##
     slot_index = 5  # Index of first slot data
+    mark_after_frame_default = 8  # last slot mark, for stopping
+
+    # Cleared slot words, keyed by (data_code, count, word). Shared by
+    # every payload; most have the same slots and mark_between_slots.
+    _templates = {}
+    _templates_order = []
+    TEMPLATES = 4
 
     class _MinimumTiming:  # pylint: disable=too-few-public-methods
         "Minimum timing from lib/dmx_transmitter/assembly_code.py"
@@ -150,6 +243,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
     ):
         "Sets up default USITT DMX512-A timings."
         self._mark_after_frame = None
+        self._timing = (None, None)  # (timing words, Timing)
         #
         # slots
         slots = int(slots) if slots is not None else 512  # cast to int.
@@ -195,9 +289,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
 
         #
         # Create array
-        self.array = array.array(
-            self.data_code, (0 for _ in range(self.slot_index + slots))
-        )
+        self.array = self._make_array(self.slot_index + slots)
         #
         # Clone, if indicated
         if clone_from is not None:
@@ -214,12 +306,18 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
         else:
             #
             # Initialize the newly-created array
-            self._mark_after_frame = None
-            self.array[self.slot_index - 2] = slots - 1  # Slot count.
-            self._init_timing_defaults()
+            self._init_array(slots)
         # Clones should take on the start code.
         self._init_start_code()
 
+    def _init_array(self, slots) -> None:
+        """Write the slot count and default timings into a new array.
+
+        Useful for a subclass author.
+        """
+        self.array[self.slot_index - 2] = slots - 1  # Slot count.
+        self._init_timing_defaults()
+
     def _init_start_code(self, start_code=0x00) -> None:
         """Set the START CODE. Default NULL. (Byte)
 
@@ -232,11 +330,18 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
                 self._set_slot(self.array[4], start_code, 1), start_code, 2
             )
 
+    def _make_array(self, count):
+        """Storage for 'count' words of 'data_code'. Default an array.
+
+        Useful for a subclass author. Anything with the array's item access,
+        slicing and buffer protocol will do.
+        """
+        return array.array(self.data_code, (0 for _ in range(count)))
+
     def _init_timing_defaults(self) -> None:
         "Set up default USITT DMX512-A timings."
         # fmt: off
         self.mark_after_frame = False  # last slot mark, bits 8-15 or 24-31
-        self.mark_after_frame_default = 8  # last slot mark, for stopping
         # Set mark_after_frame before setting mark_before_break.
         self.mark_before_break = 8      ## self.array[0]
         self.space_for_break = 172      ## self.array[1]
@@ -286,18 +391,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
     @staticmethod
     def _get32_slot(existing: int, universe: int) -> int:
         "Static method for getting slot data for 32 bit words."
-        return bit_deinterlace(
-            (
-                existing
-                & (
-                    0b0000_0000_001_001_001_001_001_001_001_001,  # Universe 0
-                    0b0000_0000_010_010_010_010_010_010_010_010,  # Universe 1
-                    0b0000_0000_100_100_100_100_100_100_100_100,  # Universe 2
-                )[universe]
-            )
-            >> universe,
-            2,
-        )
+        return _compress(existing >> universe)
 
     @staticmethod
     def _set32_slot(existing: int, val: int, universe: int) -> None:
@@ -309,7 +403,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
                 0b1111_1111_101_101_101_101_101_101_101_101,  # Universe 1
                 0b1111_1111_011_011_011_011_011_011_011_011,  # Universe 2
             )[universe]
-        ) | (bit_interlace(val & 0xFF, 2) << universe)
+        ) | (_spread(val & 0xFF) << universe)
 
     def clone(self, slots=None, **kwargs):
         "Clone this object"
@@ -321,7 +415,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
 
     def array_stop(self):
         """Return a copy of the array. For the stopping."""
-        val = array.array(self.data_code, self.array)
+        val = self.array_copy()
         val[-1] = self._set_mark_val(val[-1], self.mark_after_frame_default)
         return val
 
@@ -329,16 +423,84 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
         """Return an empty array"""
         return array.array(self.data_code)
 
+    def array_load(self, frame, universes=None) -> None:
+        """Overwrite the array with a frame. Such as from :meth:`array_copy`.
+
+        The frame must come from a payload with the same universes and slots.
+        Timing comes along with the data.
+
+        :param frame: an array, or a memoryview of the same item type.
+        :param int universes: the universes of the payload the frame came
+            from, checked when given. Two and three universes use the same
+            words, so the frame alone cannot tell them apart.
+        """
+        code = getattr(frame, "typecode", getattr(frame, "format", self.data_code))
+        if code != self.data_code:
+            raise ValueError("Frame does not match this payload's universes.")
+        if universes is not None and universes != self.universes:
+            raise ValueError("Frame does not match this payload's universes.")
+        if len(frame) != len(self.array) or frame[3] != self.array[3]:
+            raise ValueError("Frame does not match this payload's slots.")
+        try:
+            self.array[:] = frame
+        except TypeError:
+            # A memoryview, for example from a memory mapped file.
+            memoryview(self.array)[:] = frame
+        if self.slots > 1:
+            self._mark_between_slots = self._get_mark_val(self.array[self.slot_index])
+
     def clear(self) -> None:
         "Set all slot values to 0."
-        # Get the value of just the mark values
+        count = self.slots - 1
+        # The value of just the mark values
         val = self._set_mark_val(0, self._mark_between_slots)
+        key = (self.data_code, count, val)
+        template = self._templates.get(key)
+        if template is None:
+            try:
+                template = array.array(self.data_code, (val,)) * count
+            except TypeError:
+                # No array repetition here.
+                template = array.array(self.data_code, (val for _ in range(count)))
+            self._templates[key] = template
+            self._templates_order.append(key)
+            while len(self._templates_order) > self.TEMPLATES:
+                del self._templates[self._templates_order.pop(0)]
         # The last slot has a different mark parameter.
-        for i in range(self.slot_index, self.slot_index + self.slots - 1):
-            self.array[i] = val
+        self.array[self.slot_index : self.slot_index + count] = template
         # Clear the value(s) on the last slot.
         self.array[-1] = self._set_mark_val(0, self._get_mark_val(self.array[-1]))
 
+    def _fill_marks(self, start, stop, val) -> None:
+        "Set the mark of array words 'start' to 'stop' - 1, keeping the slots."
+        # The mark is the most significant byte of the 16 or 32 bits.
+        if not self._fill_byte(range(start, stop), self.bits // 8 - 1, val):
+            # No memoryview.cast here. One word at a time.
+            for i in range(start, stop):
+                self.array[i] = self._set_mark_val(self.array[i], val)
+
+    def _fill_byte(self, words, byte, val) -> bool:
+        """Set one byte of each array word in a range, through a byte view.
+
+        :param range words: array indexes, any step.
+        :param int byte: which byte of the 16 or 32 bits, 0 is the lowest.
+
+        Returns False, changing nothing, where memoryview.cast is missing.
+        """
+        try:
+            view = memoryview(self.array).cast("B")
+        except (AttributeError, TypeError):
+            return False
+        if not words:
+            return True
+        size = self.array.itemsize
+        if sys.byteorder == "big":
+            byte = size - 1 - byte
+        first = words[0] * size + byte
+        step = words.step * size
+        view[first : first + len(words) * step : step] = bytes((val,)) * len(words)
+        return True
+
     @property
     def mark_before_break(self) -> int:
         """Timing from the last frame to before the SPACE FOR BREAK.
@@ -474,8 +636,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
             )
         self._mark_between_slots = val
         # The last slot has a different mark parameter.
-        for i in range(self.slot_index, self.slot_index + self.slots - 1):
-            self.array[i] = self._set_mark_val(self.array[i], val)
+        self._fill_marks(self.slot_index, self.slot_index + self.slots - 1, val & 0xFF)
 
     @property
     def mark_after_frame(self) -> int:
@@ -522,36 +683,187 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
         If a longer interval is needed, adjust the timing parameters in the
         class constructor.
         """
-        return (
-            self.mark_before_break
-            + self.space_for_break
-            + self.mark_after_break
-            # Start code start bit.
-            + 4
-            # Start code data bits.
-            + 32
-            + self.mark_after_start_code
-            + self.slots
-            * (
-                # Data slot start bit.
-                4
-                # Data slot data bits.
-                + 32
-                # Including the two stop bits & extra mark time.
-                + self.mark_between_slots
-            )
-            # Terminal slot start bit.
-            + 4
-            # Terminal slot data bits.
-            + 32
-            # Including the two stop bits & extra mark time.
-            + (self.mark_after_frame if self.mark_after_frame is not False else 0)
+        return self.timing.interval
+
+    @property
+    def timing(self) -> Timing:
+        """The frame timing, phase by phase, as a :class:`Timing`.
+
+        Worked out once, then kept while the timing words are unchanged,
+        even when the array is written directly or by another process.
+        Cheap enough for a frame rate scheduler to read every frame.
+        """
+        words = self.array
+        shift = self.bits - 8  # The mark byte.
+        key = (
+            words[0],
+            words[1],
+            words[2],
+            words[3],
+            words[4] >> shift,
+            words[-1] >> shift,
+            self._mark_between_slots,
         )
+        cached, timing = self._timing
+        if cached != key:
+            timing = frame_timing(
+                self.mark_before_break,
+                self.space_for_break,
+                self.mark_after_break,
+                self.mark_after_start_code,
+                self.mark_between_slots,
+                self.slots,
+                self.mark_after_frame,
+            )
+            self._timing = (key, timing)
+        return timing
+
+    def update(self, indexes, values=None) -> None:
+        """Assign many slot values in one call.
+
+        A bulk path for merge engines and other producers that compute
+        several channels at a time. Everything is validated first, then
+        writes to the same word (the same slot in 2 or 3 universes) are
+        combined into one read-modify-write. A later write to an index
+        wins over an earlier one.
+
+        :param indexes: iterable of slot major indexes. Or, without
+            'values', an iterable of (index, value) pairs, or a dictionary
+            of values by index.
+        :param values: iterable of byte values, parallel to indexes.
+        """
+        if values is None:
+            pairs = list(indexes.items() if hasattr(indexes, "items") else indexes)
+            indexes = [int(pair[0]) for pair in pairs]
+            values = [int(pair[1]) for pair in pairs]
+        else:
+            indexes = [int(index) for index in indexes]
+            values = [int(val) for val in values]
+        if len(indexes) != len(values):
+            raise ValueError("'indexes' and 'values' must be the same length")
+        if not indexes:
+            return
+        size = len(self)
+        if min(indexes) < 0 or max(indexes) >= size:
+            raise IndexError("Index out of range")
+        if min(values) < 0 or max(values) > 255:
+            raise ValueError("Value out of range")
+        words = self.array
+        if self.bits == 16:
+            # One universe, one slot per word.
+            for index, val in zip(indexes, values):
+                word = index + self.slot_index
+                words[word] = (words[word] & 0xFF00) | val
+            return
+        # Gather (mask, bits) for each word, then write each word once.
+        slots = self.slots
+        pending = {}
+        for index, val in zip(indexes, values):
+            universe = index // slots
+            word = index - universe * slots + self.slot_index
+            mask = _LANE << universe
+            bits = _spread(val) << universe
+            old = pending.get(word)
+            if old is not None:
+                mask, bits = old[0] | mask, (old[1] & ~mask) | bits
+            pending[word] = (mask, bits)
+        for word, (mask, bits) in pending.items():
+            words[word] = (words[word] & ~mask) | bits
+
+    def set_frame(self, frame) -> None:
+        """Assign every slot of every universe from one frame.
+
+        :param frame: a ``(universes, slots)`` NumPy uint8 array, or a flat
+            sequence or buffer of ``len(payload)`` values, universe by
+            universe. See :mod:`dmx_transmitter.frame_codec`.
+        """
+        from . import frame_codec  # pylint: disable=import-outside-toplevel
+
+        frame_codec.encode(self, frame)
+
+    def get_frame(self):
+        """Every slot of every universe as one frame.
+
+        A ``(universes, slots)`` NumPy uint8 array, or a bytearray without
+        NumPy.
+        """
+        from . import frame_codec  # pylint: disable=import-outside-toplevel
+
+        return frame_codec.decode(self)
 
     def __len__(self):
         return self.size
 
+    def _locate(self, ixes) -> tuple:
+        """The universe and the array index, or range of array indexes, of a
+        (universe, slot) index."""
+        universe, slot = ixes
+        universe = int(universe)
+        if universe < 0:
+            universe = universe + self.universes
+        if universe < 0 or universe >= self.universes:
+            raise IndexError("Universe out of range")
+        slots = self.slots
+        if isinstance(slot, slice):
+            start, stop, step = slot.indices(slots)
+            first = self.slot_index
+            return universe, range(start + first, stop + first, step)
+        slot = int(slot)
+        if slot < 0:
+            slot = slot + slots
+        if slot < 0 or slot >= slots:
+            raise IndexError("Index out of range")
+        return universe, slot + self.slot_index
+
+    def _get_row(self, universe, words) -> list:
+        "Slot values of one universe, from a range of array indexes."
+        if not words:
+            return []
+        row = self.array[words.start : words.stop : words.step]
+        if self.bits == 16:
+            return [word & 0xFF for word in row]
+        return [_compress(word >> universe) for word in row]
+
+    def _set_row(self, universe, words, val) -> None:
+        "Assign a scalar or a same size sequence to one universe's slots."
+        try:
+            values = [int(value) for value in val]
+        except TypeError:
+            values = None
+            val = int(val)
+            if val < 0 or val > 255:
+                # pylint: disable=raise-missing-from
+                raise ValueError("Value out of range")
+        if values is not None:
+            if len(values) != len(words):
+                raise ValueError(
+                    f"Can only assign a slice of the same size. ({len(words)})"
+                )
+            if values and (min(values) < 0 or max(values) > 255):
+                raise ValueError("Value out of range")
+        data = self.array
+        if self.bits == 16:
+            if values is None and self._fill_byte(words, 0, val):
+                return
+            for word, value in zip(words, values or [val] * len(words)):
+                data[word] = (data[word] & 0xFF00) | value
+            return
+        mask = ~(_LANE << universe)
+        if values is None:
+            bits = _spread(val) << universe
+            for word in words:
+                data[word] = (data[word] & mask) | bits
+            return
+        for word, value in zip(words, values):
+            data[word] = (data[word] & mask) | (_spread(value) << universe)
+
     def __getitem__(self, ixes: int) -> int:
+        if isinstance(ixes, tuple):
+            # payload[universe, slot] or payload[universe, start:stop]
+            universe, word = self._locate(ixes)
+            if isinstance(word, range):
+                return self._get_row(universe, word)
+            return self._get_slot(self.array[word], universe)
         slots = self.slots
         if isinstance(ixes, slice):
             return [
@@ -570,39 +882,54 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
             raise IndexError("Index out of range")
         return self._get_slot(self.array[ixes % slots + self.slot_index], ixes // slots)
 
-    def __setitem__(
-        self,
-        ixes,
-        val,
-    ) -> None:
+    def _set_located(self, ixes, val) -> None:
+        "payload[universe, slot] or payload[universe, start:stop] = val"
+        universe, word = self._locate(ixes)
+        if isinstance(word, range):
+            self._set_row(universe, word, val)
+            return
+        val = int(val)
+        if val < 0 or val > 255:
+            raise ValueError("Value out of range")
+        self.array[word] = self._set_slot(self.array[word], val, universe)
+
+    def _set_slice(self, ixes, val) -> None:
+        "payload[start:stop] = val, a scalar or a same size sequence."
         slots = self.slots
-        if isinstance(ixes, slice):
-            size = sum(1 for _ in range(*ixes.indices(len(self))))
-            try:
-                if len(val) != size:
-                    raise ValueError(
-                        f"Can only assign a slice of the same size. ({size})"
-                    )
-            except TypeError:
-                # Attempt a scalar to slice assignment.
-                val = int(val)
-                if val < 0 or val > 255:
-                    # pylint: disable=raise-missing-from
-                    raise ValueError("Value out of range")
-                for index in range(*ixes.indices(len(self))):
-                    self.array[index % slots + self.slot_index] = self._set_slot(
-                        self.array[index % slots + self.slot_index], val, index // slots
-                    )
-                return
-            # Attempt a slice to slice assignment.
-            values = iter(val)
+        size = sum(1 for _ in range(*ixes.indices(len(self))))
+        try:
+            if len(val) != size:
+                raise ValueError(f"Can only assign a slice of the same size. ({size})")
+        except TypeError:
+            # Attempt a scalar to slice assignment.
+            val = int(val)
+            if val < 0 or val > 255:
+                # pylint: disable=raise-missing-from
+                raise ValueError("Value out of range")
             for index in range(*ixes.indices(len(self))):
-                val = int(next(values))
-                if val < 0 or val > 255:
-                    raise ValueError("Value out of range")
                 self.array[index % slots + self.slot_index] = self._set_slot(
                     self.array[index % slots + self.slot_index], val, index // slots
                 )
+            return
+        # Attempt a slice to slice assignment.
+        values = iter(val)
+        for index in range(*ixes.indices(len(self))):
+            val = int(next(values))
+            if val < 0 or val > 255:
+                raise ValueError("Value out of range")
+            self.array[index % slots + self.slot_index] = self._set_slot(
+                self.array[index % slots + self.slot_index], val, index // slots
+            )
+
+    def __setitem__(
+        self,
+        ixes,
+        val,
+    ) -> None:
+        if isinstance(ixes, tuple):
+            self._set_located(ixes, val)
+        elif isinstance(ixes, slice):
+            self._set_slice(ixes, val)
         else:
             # Attempt a scalar to scalar assignment.
             try:
@@ -617,6 +944,7 @@ class Payload_USITT_DMX512_A:  # pylint: disable=too-many-instance-attributes
                 raise IndexError("Index out of range")
             if val < 0 or val > 255:
                 raise ValueError("Value out of range")
+            slots = self.slots
             self.array[ixes % slots + self.slot_index] = self._set_slot(
                 self.array[ixes % slots + self.slot_index], val, ixes // slots
             )
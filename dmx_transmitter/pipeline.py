@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.pipeline`
+==========================
+
+Chains of generators, from lighting data to the wire.
+
+Every stage is a generator. Sources yield frames: a bytearray of slot
+values in the payload's slot major order. Transforms take the stage
+before them and yield changed frames. The encoder writes frames into a
+payload, and sinks send or record it::
+
+    chain = show(encoder(master(effect(chase, len(dmx.payload)), 200),
+                         dmx.payload), dmx)
+    while True:
+        next(chain)  # One frame, from the source to the wire.
+
+Nothing runs until the last stage is asked for a frame, so a chain that
+is not pulled costs nothing. Each stage keeps one buffer and yields it
+again every frame; a stage must be done with a frame before it pulls the
+next one. The encoder only writes the slots that changed. Transforms
+work in place on their buffer; with NumPy, as whole array operations.
+
+* Author: Dana Runge
+"""
+
+from .masters import scale_table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+_CHUNK = 32  # Slots compared at once when looking for changes.
+
+
+def _buffer(buffer, frame):
+    "The stage's buffer, remade only if the frame size changed."
+    if buffer is None or len(buffer) != len(frame):
+        return bytearray(len(frame))
+    return buffer
+
+
+def _uint8(data):
+    "A uint8 NumPy view of a frame or table. Nothing is copied."
+    if isinstance(data, numpy.ndarray):
+        return data.reshape(-1)
+    return numpy.frombuffer(data, dtype=numpy.uint8)
+
+
+def _table(table):
+    "A 256 entry table, as :func:`_translate` wants it."
+    return table if numpy is None else _uint8(table)
+
+
+def _translate(frame, table, buffer) -> None:
+    "Look every slot of 'frame' up in 'table', into 'buffer', in place."
+    if numpy is not None:
+        numpy.take(table, _uint8(frame), out=_uint8(buffer), mode="clip")
+    elif hasattr(frame, "translate"):
+        buffer[:] = frame.translate(table)
+    else:  # CircuitPython has no bytes.translate().
+        for i, val in enumerate(frame):
+            buffer[i] = table[val]
+
+
+# Sources
+
+
+def scene(values):
+    "Source: the same slot values every frame. They are copied once."
+    buffer = bytearray(values)
+    while True:
+        yield buffer
+
+
+def follow(values):
+    """Source: a buffer that something else changes, such as a network
+    receiver or a :class:`MergeSource`'s values. Not copied."""
+    while True:
+        yield values
+
+
+def effect(render, size):
+    """Source: ``render(number, frame)`` fills in each frame.
+
+    :param render: a function of the frame number, counting from 0, and
+        the frame to change. It is the same frame every time, holding the
+        values it was left with.
+    :param int size: slots per frame, ``len(payload)``.
+    """
+    buffer = bytearray(size)
+    number = 0
+    while True:
+        render(number, buffer)
+        number = number + 1
+        yield buffer
+
+
+# Transforms
+
+
+def curve(upstream, table):
+    """Transform: map every slot value through a 256 entry table, such as
+    a dimmer curve."""
+    table = bytes(table)
+    if len(table) != 256:
+        raise ValueError("A curve needs 256 entries.")
+    table = _table(table)
+    buffer = None
+    for frame in upstream:
+        buffer = _buffer(buffer, frame)
+        _translate(frame, table, buffer)
+        yield buffer
+
+
+def master(upstream, level):
+    """Transform: scale every slot by a master level.
+
+    :param level: 0 (black) to 255 (unchanged), or a function returning it,
+        read every frame. The scale table is only rebuilt when it changes.
+    """
+    buffer = None
+    table = None
+    current = None
+    for frame in upstream:
+        now = level() if callable(level) else level
+        if now != current:
+            table = _table(scale_table(now))
+            current = now
+        buffer = _buffer(buffer, frame)
+        _translate(frame, table, buffer)
+        yield buffer
+
+
+def htp(*upstreams):
+    "Transform: the highest value of each slot, across several stages."
+    buffer = None
+    for frames in zip(*upstreams):
+        buffer = _buffer(buffer, frames[0])
+        buffer[:] = frames[0]
+        for frame in frames[1:]:
+            if numpy is not None:
+                view = _uint8(buffer)
+                numpy.maximum(view, _uint8(frame), out=view)
+                continue
+            buffer[: len(frame)] = bytes(map(max, buffer, frame))
+        yield buffer
+
+
+# Encoder
+
+
+def encoder(upstream, payload):
+    """Write each frame into the payload, and yield the payload.
+
+    Only the slots that changed since the last frame are written. A frame
+    with no changes costs one comparison.
+    """
+    last = bytearray()
+    for frame in upstream:
+        if len(last) != len(frame):
+            payload.update(range(len(frame)), frame)
+            last = bytearray(frame)
+        elif frame != last:
+            changes = []
+            for start in range(0, len(frame), _CHUNK):
+                end = start + _CHUNK
+                if frame[start:end] != last[start:end]:
+                    end = min(end, len(frame))
+                    changes.extend(i for i in range(start, end) if frame[i] != last[i])
+            payload.update(changes, [frame[i] for i in changes])
+            last[:] = frame
+        yield payload
+
+
+# Sinks
+
+
+def show(upstream, transmitter):
+    "Sink: send each encoded payload with ``transmitter.show()``."
+    for payload in upstream:
+        transmitter.show()
+        yield payload
+
+
+def record(upstream, recorder):
+    "Sink: give each encoded payload to a :class:`FrameRecorder`."
+    for payload in upstream:
+        recorder.record(payload.array)
+        yield payload
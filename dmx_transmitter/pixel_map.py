@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.pixel_map`
+===========================
+
+Map an image onto LED fixtures: matrices, pixel tape, single pixels.
+
+The layout says where each fixture is in the image, the order of its
+colour channels and the universe and slot it starts at. Universes count
+across all the payloads, like :class:`RenderPool`. The layout is compiled
+once into two index arrays per payload: where in the image each channel
+comes from, and which slot it goes to. Each frame is then one gather and
+one batched write per payload, with no Python call per pixel::
+
+    pixels = PixelMap([dmx.payload], width=16, height=8)
+    for y in range(8):
+        pixels.strip([(x, y) for x in range(16)], universe=0, slot=y * 48)
+    pixels.write(image)  # 16 x 8 x 3 bytes, row by row.
+
+An image is rows of pixels, each pixel 'channels' bytes in R, G, B, W
+order: a flat buffer, or a ``(height, width, channels)`` uint8 NumPy
+array. With NumPy the gather and the encode are whole array operations.
+
+* Author: Dana Runge
+"""
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_COLOURS = "RGBW"
+
+
+class PixelMap:
+    """An image to fixture channel map over one or more payloads.
+
+    :param payloads: the payloads to write, in universe order.
+    :param int width: image width. (pixels)
+    :param int height: image height. (pixels)
+    :param int channels: bytes per image pixel, 3 (RGB) or 4 (RGBW).
+    """
+
+    def __init__(self, payloads, width, height, channels=3):
+        if channels not in (3, 4):
+            raise ValueError("'channels' shall be 3 or 4")
+        self.payloads = list(payloads)
+        self.width = width
+        self.height = height
+        self.channels = channels
+        # (universe, slot, image index) for every mapped channel.
+        self._channels = []
+        self._compiled = None
+
+    @property
+    def universes(self) -> int:
+        "Universes across all the payloads."
+        return sum(payload.universes for payload in self.payloads)
+
+    def _payload(self, universe):
+        "The payload holding a universe, and the universe in it."
+        if universe < 0:
+            raise IndexError("Universe out of range")
+        for payload in self.payloads:
+            if universe < payload.universes:
+                return payload, universe
+            universe = universe - payload.universes
+        raise IndexError("Universe out of range")
+
+    def add(  # pylint: disable=too-many-arguments
+        self, x, y, universe, slot, order="RGB"
+    ) -> None:
+        """Map one image pixel to a fixture.
+
+        :param int x: column in the image.
+        :param int y: row in the image.
+        :param int universe: the fixture's universe, across all payloads.
+        :param int slot: the fixture's first slot, counting from 0.
+        :param str order: the fixture's channels, such as "GRB" or "RGBW".
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("Pixel out of the image")
+        payload = self._payload(universe)[0]
+        if slot < 0 or slot + len(order) > payload.slots:
+            raise IndexError("Fixture does not fit in the universe")
+        pixel = (y * self.width + x) * self.channels
+        for offset, colour in enumerate(order):
+            channel = _COLOURS.find(colour)
+            if not 0 <= channel < self.channels:
+                raise ValueError(f"No '{colour}' in the image")
+            self._channels.append((universe, slot + offset, pixel + channel))
+        self._compiled = None
+
+    def strip(self, points, universe, slot, order="RGB") -> tuple:
+        """Map a run of pixels to fixtures one after another, such as pixel
+        tape. A fixture that would not fit starts the next universe.
+
+        :param points: the (x, y) image pixel for each fixture, in order.
+        Returns the (universe, slot) after the last fixture.
+        """
+        for x, y in points:
+            if slot + len(order) > self._payload(universe)[0].slots:
+                universe = universe + 1
+                slot = 0
+            self.add(x, y, universe, slot, order)
+            slot = slot + len(order)
+        return universe, slot
+
+    def compile(self) -> None:
+        """Build the gather index arrays. Done by the first :meth:`write`
+        after the layout changes."""
+        compiled = [([], []) for _ in self.payloads]
+        first = {}
+        universe = 0
+        for number, payload in enumerate(self.payloads):
+            for offset in range(payload.universes):
+                first[universe + offset] = (number, offset * payload.slots)
+            universe = universe + payload.universes
+        for universe, slot, pixel in self._channels:
+            number, start = first[universe]
+            compiled[number][0].append(pixel)
+            compiled[number][1].append(start + slot)
+        if numpy is not None:
+            compiled = [
+                (numpy.array(pixels, dtype=numpy.intp), numpy.array(slots, numpy.intp))
+                for pixels, slots in compiled
+            ]
+        self._compiled = compiled
+
+    def _array(self, image):
+        "The image as a flat uint8 NumPy array, checked as the payload would."
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            return numpy.frombuffer(image, dtype=numpy.uint8)
+        image = numpy.asarray(image)
+        shape = (self.height, self.width, self.channels)
+        if image.ndim != 1 and image.shape != shape:
+            raise ValueError(f"Image must be flat, or of shape {shape}.")
+        if image.dtype != numpy.uint8:
+            if image.dtype.kind not in "iu":
+                raise ValueError("Image values must be integers.")
+            if image.min() < 0 or image.max() > 255:
+                raise ValueError("Value out of range")
+            image = image.astype(numpy.uint8)
+        return image.reshape(-1)
+
+    def write(self, image) -> None:
+        """Write an image to every mapped fixture.
+
+        :param image: ``width * height * channels`` bytes, row by row, or a
+            ``(height, width, channels)`` NumPy array. Values must be
+            0 - 255.
+        """
+        size = self.width * self.height * self.channels
+        if len(image) != size and getattr(image, "size", None) != size:
+            raise ValueError(f"Image must have {size} values.")
+        if self._compiled is None:
+            self.compile()
+        if numpy is not None:
+            image = self._array(image)
+        for payload, (pixels, slots) in zip(self.payloads, self._compiled):
+            if len(slots) == 0:
+                continue
+            if numpy is None:
+                payload.update(slots, [image[pixel] for pixel in pixels])
+                continue
+            frame = payload.get_frame()
+            frame.reshape(-1)[slots] = image[pixels]
+            payload.set_frame(frame)
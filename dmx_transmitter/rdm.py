@@ -0,0 +1,392 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.rdm`
+=====================
+
+Remote Device Management (ANSI E1.20) requests, START CODE 0xCC.
+
+Builds discovery, GET and SET requests, and encodes them into a payload
+that can be sent with ``dmx.show(once=request.array_copy())``. Requests
+are cached already encoded; sending the same request again copies the
+encoded words and patches only the transaction number and the checksum.
+
+Receiving responses needs hardware this library does not drive, so
+discovery takes a 'responder' function: it sends a request and returns
+the bytes that came back, or None. The decoders here also check frames
+on a host.
+
+Sending RDM needs a TRANSMITTING timing pin wired to the line driver's
+transmit enable, see the Hardware Hackers section.
+
+* Author: Dana Runge
+"""
+
+try:
+    from collections import namedtuple
+except ImportError:
+    from ucollections import namedtuple  # pylint: disable=import-error
+
+from .payload_Alternate_Start_Code import Payload_Alternate_Start_Code
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+START_CODE = 0xCC
+SUB_START_CODE = 0x01
+BROADCAST_UID = 0xFFFFFFFFFFFF
+MAXIMUM_UID = 0xFFFFFFFFFFFE
+
+# Command classes
+DISCOVERY_COMMAND = 0x10
+DISCOVERY_COMMAND_RESPONSE = 0x11
+GET_COMMAND = 0x20
+GET_COMMAND_RESPONSE = 0x21
+SET_COMMAND = 0x30
+SET_COMMAND_RESPONSE = 0x31
+
+# Parameter IDs
+DISC_UNIQUE_BRANCH = 0x0001
+DISC_MUTE = 0x0002
+DISC_UN_MUTE = 0x0003
+DEVICE_INFO = 0x0060
+DMX_START_ADDRESS = 0x00F0
+IDENTIFY_DEVICE = 0x1000
+
+_TRANSACTION = 15  # Offset of the transaction number, START CODE is 0.
+_DATA = 24  # Offset of the parameter data.
+_REQUESTS = 16  # Requests kept to copy from, least recently used dropped.
+
+RDMMessage = namedtuple(
+    "RDMMessage",
+    (
+        "destination",
+        "source",
+        "transaction",
+        "port",
+        "message_count",
+        "sub_device",
+        "command_class",
+        "pid",
+        "data",
+    ),
+)
+
+
+def uid_bytes(uid) -> bytes:
+    "A 48 bit UID as six bytes, manufacturer ID first."
+    return bytes((uid >> shift) & 0xFF for shift in range(40, -8, -8))
+
+
+def _uid(data, offset=0) -> int:
+    "Six bytes as a 48 bit UID."
+    uid = 0
+    for byte in data[offset : offset + 6]:
+        uid = uid << 8 | byte
+    return uid
+
+
+def _checksum(data) -> bytes:
+    "The RDM checksum: 16 bit sum of every byte, MSB first."
+    total = sum(data) & 0xFFFF
+    return bytes((total >> 8, total & 0xFF))
+
+
+def build_request(  # pylint: disable=too-many-arguments
+    destination,
+    source,
+    command_class,
+    pid,
+    data=b"",
+    transaction=0,
+    port=1,
+    sub_device=0,
+) -> bytes:
+    """Assemble an RDM request, START CODE through checksum."""
+    data = bytes(data)
+    if len(data) > 231:
+        raise ValueError("Parameter data is too long. At most 231 bytes.")
+    packet = (
+        bytes((START_CODE, SUB_START_CODE, 24 + len(data)))
+        + uid_bytes(destination)
+        + uid_bytes(source)
+        + bytes(
+            (
+                transaction & 0xFF,
+                port & 0xFF,
+                0,  # Message count, always 0 from a controller.
+                sub_device >> 8 & 0xFF,
+                sub_device & 0xFF,
+                command_class,
+                pid >> 8 & 0xFF,
+                pid & 0xFF,
+                len(data),
+            )
+        )
+        + data
+    )
+    return packet + _checksum(packet)
+
+
+def decode(frame) -> RDMMessage:
+    """Decode and check an RDM message.
+
+    :param frame: bytes from the START CODE through the checksum, or a
+        payload holding an RDM request.
+    """
+    if hasattr(frame, "start_code"):
+        frame = bytes((frame.start_code,)) + bytes(frame[: frame.slots])
+    frame = bytes(frame)
+    if len(frame) < 26 or frame[0] != START_CODE or frame[1] != SUB_START_CODE:
+        raise ValueError("Not an RDM message.")
+    length = frame[2]
+    if length < 24 or len(frame) < length + 2:
+        raise ValueError("RDM message is truncated.")
+    if frame[23] != length - 24:
+        raise ValueError("RDM parameter data length is wrong.")
+    if _checksum(frame[:length]) != frame[length : length + 2]:
+        raise ValueError("RDM checksum is wrong.")
+    return RDMMessage(
+        _uid(frame, 3),
+        _uid(frame, 9),
+        frame[15],
+        frame[16],
+        frame[17],
+        frame[18] << 8 | frame[19],
+        frame[20],
+        frame[21] << 8 | frame[22],
+        frame[24:length],
+    )
+
+
+def encode_discovery_response(uid, preamble=7) -> bytes:
+    "The reply of a responder to DISC_UNIQUE_BRANCH. For testing."
+    euid = bytearray()
+    for byte in uid_bytes(uid):
+        euid.extend((byte | 0xAA, byte | 0x55))
+    total = sum(euid)
+    high, low = total >> 8 & 0xFF, total & 0xFF
+    return (
+        b"\xFE" * preamble
+        + b"\xAA"
+        + bytes(euid)
+        + bytes((high | 0xAA, high | 0x55, low | 0xAA, low | 0x55))
+    )
+
+
+def decode_discovery_response(data):
+    """The UID in a DISC_UNIQUE_BRANCH reply.
+
+    Returns None if the reply is damaged, usually because more than one
+    responder answered.
+    """
+    data = bytes(data)
+    start = 0
+    while start < 7 and start < len(data) and data[start] == 0xFE:
+        start = start + 1
+    if start >= len(data) or data[start] != 0xAA or len(data) < start + 17:
+        return None
+    euid = data[start + 1 : start + 13]
+    check = data[start + 13 : start + 17]
+    total = (check[0] & check[1]) << 8 | (check[2] & check[3])
+    if sum(euid) & 0xFFFF != total:
+        return None
+    return _uid(bytes(euid[i] & euid[i + 1] for i in range(0, 12, 2)))
+
+
+class Payload_RDM(Payload_Alternate_Start_Code):  # pylint: disable=invalid-name
+    """An RDM request, START CODE 0xCC, with RDM controller timing.
+
+    :param bytes packet: a request from :func:`build_request`.
+
+    The BREAK is 176 microseconds and the MARK AFTER BREAK 12, the shortest
+    an RDM controller may send. mark_after_frame is on, so a TRANSMITTING
+    timing pin releases the line for the reply.
+    """
+
+    START_CODE = START_CODE
+    CACHE_SIZE = 16
+
+    # pylint: disable=arguments-differ
+    def encode_message(self, packet) -> bytes:
+        "The slots after the START CODE."
+        packet = bytes(packet)
+        if not packet or packet[0] != START_CODE:
+            raise ValueError("Not an RDM request.")
+        return packet[1:]
+
+    @property
+    def packet(self) -> bytes:
+        "The request, START CODE through checksum."
+        return bytes((START_CODE,)) + self.data_slots
+
+    def patch(self, packet, slots) -> None:
+        """Copy in only some slots of a packet the same size as this one.
+
+        :param packet: the new request, from :func:`build_request`.
+        :param slots: which slots changed, 0 is the slot after the START CODE.
+        """
+        data = self.encode_message(packet)
+        count = self.slots
+        indexes = [u * count + i for u in range(self.universes) for i in slots]
+        self.update(indexes, [data[i] for i in slots] * self.universes)
+        self.data_slots = data
+        self._message = ((packet,), {})
+
+    def _init_timing_defaults(self) -> None:
+        "Set up RDM controller timings."
+        # fmt: off
+        self.mark_after_frame_default = 8
+        self.mark_after_frame = True
+        # Set mark_after_frame before setting mark_before_break.
+        self.mark_before_break = 8
+        self.space_for_break = 176
+        self.mark_after_break = 12
+        self.mark_after_start_code = 8
+        self.mark_between_slots = 8
+        # fmt: on
+
+
+class RDMController:
+    """Build and cache RDM requests from one controller UID.
+
+    :param int uid: this controller's 48 bit UID.
+
+    :param int universes: as in :class:`DMXTransmitter`.
+
+    :param int port: the port ID sent in requests. Default: 1.
+
+    Example::
+
+        rdm = RDMController(0x7FF0_00000001)
+        request = rdm.get(0x4D50_12345678, DEVICE_INFO)
+        dmx.show(once=request.array_copy())
+    """
+
+    def __init__(self, uid, universes=1, port=1):
+        self.uid = uid
+        self.universes = universes
+        self.port = port
+        self.transaction = 0
+        self._requests = {}
+        self._order = []  # Least recently used first.
+
+    def _packet(  # pylint: disable=too-many-arguments
+        self, destination, command_class, pid, data=b"", sub_device=0
+    ):
+        "A request packet, with the next transaction number."
+        transaction = self.transaction
+        self.transaction = (self.transaction + 1) & 0xFF
+        return build_request(
+            destination,
+            self.uid,
+            command_class,
+            pid,
+            data,
+            transaction=transaction,
+            port=self.port,
+            sub_device=sub_device,
+        )
+
+    def request(  # pylint: disable=too-many-arguments
+        self, destination, command_class, pid, data=b"", sub_device=0
+    ):
+        """A new request payload, with the next transaction number.
+
+        A request made recently is copied from its encoded words, patching
+        only the transaction number and checksum. Payloads already returned
+        are never changed.
+        """
+        key = (destination, command_class, pid, bytes(data), sub_device)
+        packet = self._packet(destination, command_class, pid, data, sub_device)
+        template = self._requests.get(key)
+        if template is None:
+            if len(self._order) >= _REQUESTS:
+                del self._requests[self._order.pop(0)]
+            # Kept as first encoded, to copy from.
+            self._requests[key] = Payload_RDM(packet, universes=self.universes)
+            self._order.append(key)
+            return Payload_RDM(packet, universes=self.universes)
+        self._order.remove(key)
+        self._order.append(key)
+        # The same packet as the template's: its words come from the cache.
+        payload = Payload_RDM(template.packet, universes=self.universes)
+        # Slots are offset by one from the packet: no START CODE.
+        slots = payload.slots
+        payload.patch(packet, (_TRANSACTION - 1, slots - 2, slots - 1))
+        return payload
+
+    def get(self, destination, pid, data=b"", sub_device=0):
+        "A GET_COMMAND request."
+        return self.request(destination, GET_COMMAND, pid, data, sub_device)
+
+    def set(self, destination, pid, data=b"", sub_device=0):
+        "A SET_COMMAND request."
+        return self.request(destination, SET_COMMAND, pid, data, sub_device)
+
+    def discover_unique_branch(self, lower, upper):
+        "A DISC_UNIQUE_BRANCH request for UIDs from 'lower' to 'upper'."
+        return self.request(
+            BROADCAST_UID,
+            DISCOVERY_COMMAND,
+            DISC_UNIQUE_BRANCH,
+            uid_bytes(lower) + uid_bytes(upper),
+        )
+
+    def mute(self, destination):
+        """A DISC_MUTE request. Not cached: discovery mutes each responder
+        once."""
+        packet = self._packet(destination, DISCOVERY_COMMAND, DISC_MUTE)
+        return Payload_RDM(packet, universes=self.universes)
+
+    def unmute(self, destination=BROADCAST_UID):
+        "A DISC_UN_MUTE request. Default: every responder."
+        return self.request(destination, DISCOVERY_COMMAND, DISC_UN_MUTE)
+
+    def discover(self, responder) -> list:
+        """Find the UIDs of every responder with the binary branch search.
+
+        :param responder: a function that sends a request payload and returns
+            the reply bytes, or None if nothing came back. The branch
+            requests are one payload, changed between calls; copy it to
+            keep it.
+
+        Returns a sorted list of UIDs. Every responder found is left muted.
+        """
+        found = []
+        responder(self.unmute())
+        branch = None  # One DISC_UNIQUE_BRANCH payload, patched each time.
+        branches = [(0, MAXIMUM_UID)]
+        while branches:
+            lower, upper = branches.pop()
+            packet = self._packet(
+                BROADCAST_UID,
+                DISCOVERY_COMMAND,
+                DISC_UNIQUE_BRANCH,
+                uid_bytes(lower) + uid_bytes(upper),
+            )
+            if branch is None:
+                branch = Payload_RDM(packet, universes=self.universes)
+            else:
+                # The transaction number, the bounds and the checksum.
+                slots = branch.slots
+                changed = [_TRANSACTION - 1] + list(range(_DATA - 1, slots))
+                branch.patch(packet, changed)
+            reply = responder(branch)
+            if reply is None:
+                continue  # Nobody in this branch.
+            uid = decode_discovery_response(reply)
+            if uid is not None and lower <= uid <= upper:
+                # One clear reply. Mute it, then look here again.
+                if responder(self.mute(uid)) is not None:
+                    found.append(uid)
+                    branches.append((lower, upper))
+                    continue
+            if lower == upper:
+                continue
+            middle = (lower + upper) // 2
+            branches.append((middle + 1, upper))
+            branches.append((lower, middle))
+        return sorted(found)
@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.recorder`
+==========================
+
+Record what went out of a DMXTransmitter, and play it back later.
+
+Frames are written as they were handed to the state machine: the encoded
+words, timing included. A keyframe holds every word, the frames in between
+hold only the words that changed, so a mostly static show uses very little
+flash. A frame with no changes at all is not written: the state machine
+keeps sending the last one anyway. After a once frame it is, as an empty
+delta, so the once frame is replayed on time.
+
+File layout, little-endian except the words, which are in the byte order
+named in the header::
+
+    header: b"DMXR", version (2), data code (b"H" or b"L"),
+            bytes per word, byte order (0 little, 1 big),
+            universes, slots (2 bytes)
+    record: kind (b"K" keyframe, b"D" delta, b"O" once, b"S" stop),
+            nanoseconds since the recording started (8 bytes),
+            count (4 bytes)
+        K:  count words
+        D:  count pairs of index (4 bytes) and word
+        O:  count words, sent once before the K or D frame after it
+        S:  nothing, count is 0
+
+* Author: Dana Runge
+"""
+
+import array
+import struct
+import sys
+import time
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+MAGIC = b"DMXR"
+VERSION = 2
+_HEADER = "<4sBcBBBH"
+_RECORD = "<cqI"
+_WORD_FORMATS = {2: "H", 4: "I", 8: "Q"}
+_BYTE_ORDERS = ("little", "big")
+_CHUNK = 32  # Words compared at once when looking for changes.
+
+
+class FrameRecorder:
+    """Stream the frames sent by a DMXTransmitter to a file.
+
+    :param file: a file opened for binary writing.
+
+    :param payload: the transmitter's payload. Sets the word format.
+
+    :param int keyframe_every: write a full frame at least this often.
+        (frames) Default: 100.
+
+    :param clock: a function returning nanoseconds.
+        Default ``time.monotonic_ns``.
+
+    Example::
+
+        with open("/show.dmxr", "wb") as file:
+            dmx.recorder = FrameRecorder(file, dmx.payload)
+            ...
+            dmx.recorder = None
+    """
+
+    def __init__(self, file, payload, keyframe_every=100, clock=None):
+        self.file = file
+        self.data_code = payload.data_code
+        self.itemsize = getattr(payload.array, "itemsize", payload.bits // 8)
+        self.keyframe_every = int(keyframe_every)
+        self.clock = clock if clock is not None else time.monotonic_ns
+        self._pair = "<I" + _WORD_FORMATS[self.itemsize]
+        self._previous = None
+        self._since_keyframe = 0
+        self._start = self.clock()
+        file.write(
+            struct.pack(
+                _HEADER,
+                MAGIC,
+                VERSION,
+                self.data_code.encode(),
+                self.itemsize,
+                _BYTE_ORDERS.index(sys.byteorder),
+                payload.universes,
+                payload.slots,
+            )
+        )
+
+    def _changes(self, frame) -> list:
+        "Indexes of the words that differ from the previous frame."
+        previous = self._previous
+        changes = []
+        for start in range(0, len(frame), _CHUNK):
+            end = start + _CHUNK
+            if frame[start:end] != previous[start:end]:
+                end = min(end, len(frame))
+                changes.extend(i for i in range(start, end) if frame[i] != previous[i])
+        return changes
+
+    def record(self, frame, once=None) -> None:
+        """Record a frame, as sent by ``show`` or ``run``.
+
+        :param once: the frame sent once before it, if any.
+        """
+        stamp = self.clock() - self._start
+        if once is not None:
+            self.file.write(struct.pack(_RECORD, b"O", stamp, len(once)))
+            self.file.write(once)
+        previous = self._previous
+        changes = None
+        if (
+            previous is not None
+            and len(previous) == len(frame)
+            and self._since_keyframe < self.keyframe_every
+        ):
+            changes = self._changes(frame)
+            # A long delta is bigger than a keyframe.
+            if len(changes) * struct.calcsize(self._pair) >= len(frame) * self.itemsize:
+                changes = None
+        if changes is None:
+            self.file.write(struct.pack(_RECORD, b"K", stamp, len(frame)))
+            self.file.write(frame)
+            self._previous = array.array(self.data_code, frame)
+            self._since_keyframe = 1  # Counting the keyframe itself.
+            return
+        if not changes and once is None:
+            return
+        self.file.write(struct.pack(_RECORD, b"D", stamp, len(changes)))
+        for i in changes:
+            self.file.write(struct.pack(self._pair, i, frame[i]))
+            previous[i] = frame[i]
+        self._since_keyframe = self._since_keyframe + 1
+
+    def record_stop(self) -> None:
+        "Record that the transmitter was stopped."
+        self.file.write(struct.pack(_RECORD, b"S", self.clock() - self._start, 0))
+
+
+class FrameReplayer:
+    """Send a recording back out of a DMXTransmitter, with its original timing.
+
+    Only one frame is held in memory, so the length of the recording does
+    not matter.
+
+    :param file: a file opened for binary reading.
+
+    :param transmitter: where the frames go. It must have the same
+        universes and slots as the recording. Its payload is left untouched.
+
+    :param clock: a function returning nanoseconds.
+        Default ``time.monotonic_ns``.
+
+    :param sleep: a function that sleeps for seconds. Default ``time.sleep``.
+
+    Example::
+
+        with open("/show.dmxr", "rb") as file:
+            FrameReplayer(file, dmx).play()
+    """
+
+    def __init__(self, file, transmitter, clock=None, sleep=None):
+        self.file = file
+        self.transmitter = transmitter
+        self.clock = clock if clock is not None else time.monotonic_ns
+        self.sleep = sleep if sleep is not None else time.sleep
+        header = struct.unpack(_HEADER, file.read(struct.calcsize(_HEADER)))
+        magic, version, data_code, self.itemsize, byte_order = header[:5]
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a recording, or an unknown version.")
+        if _BYTE_ORDERS[byte_order] != sys.byteorder:
+            raise ValueError("Recording was made with another byte order.")
+        self.data_code = data_code.decode()
+        payload = transmitter.payload
+        if self.data_code != payload.data_code or header[5] != payload.universes:
+            raise ValueError("Recording does not match the transmitter's universes.")
+        if header[6] != payload.slots:
+            raise ValueError("Recording does not match the transmitter's slots.")
+        self._pair = "<I" + _WORD_FORMATS[self.itemsize]
+        self._frame = None
+
+    def _read(self, size) -> bytes:
+        "Read exactly 'size' bytes."
+        data = self.file.read(size)
+        if len(data) != size:
+            raise ValueError("Recording is truncated.")
+        return data
+
+    def _wait(self, start, stamp) -> None:
+        "Sleep until 'stamp' nanoseconds after 'start'."
+        delay = start + stamp - self.clock()
+        if delay > 0:
+            self.sleep(delay / 1_000_000_000)
+
+    def _stop(self) -> None:
+        "Send the last recorded frame once, with the stop mark, then stop."
+        payload = self.transmitter.payload
+        state_machine = self.transmitter.state_machine
+        if self._frame is None:
+            state_machine.background_write()
+            return
+        probe = payload.clone(slots=self._frame[3] + 1)
+        probe.array_load(self._frame)
+        state_machine.background_write()
+        state_machine.background_write(
+            once=probe.array_stop(), loop=probe.array_empty()
+        )
+
+    def play(self) -> int:
+        """Play the whole recording. Returns the number of frames sent."""
+        record_size = struct.calcsize(_RECORD)
+        pair_size = struct.calcsize(self._pair)
+        start = self.clock()
+        frames = 0
+        once = None
+        while True:
+            header = self.file.read(record_size)
+            if not header:
+                return frames
+            kind, stamp, count = struct.unpack(_RECORD, header)
+            if kind == b"O":
+                once = array.array(self.data_code, self._read(count * self.itemsize))
+                continue
+            if kind == b"K":
+                if self._frame is None or len(self._frame) != count:
+                    self._frame = array.array(self.data_code, (0 for _ in range(count)))
+                if self.file.readinto(self._frame) != count * self.itemsize:
+                    raise ValueError("Recording is truncated.")
+            elif kind == b"D":
+                if self._frame is None:
+                    raise ValueError("Recording starts without a keyframe.")
+                data = self._read(count * pair_size)
+                for offset in range(0, len(data), pair_size):
+                    index, word = struct.unpack_from(self._pair, data, offset)
+                    self._frame[index] = word
+            self._wait(start, stamp)
+            if kind == b"S":
+                self._stop()
+                continue
+            self.transmitter.show(
+                once=once, loop=array.array(self.data_code, self._frame)
+            )
+            once = None
+            frames = frames + 1
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.render_pool`
+=============================
+
+Render many universes in a pool of processes. Host only.
+
+Each transmitter's payload is a :class:`SharedPayload`. A partition is
+one payload: its 1 to 3 universes share words, so one worker renders all
+of them. Workers attach to the shared memory once, then write their
+universes' slots straight into the words. When every partition of a
+frame is done, the coordinator calls every transmitter's ``show()``.
+
+The render function must be importable by the workers (defined at module
+level). It is called with the frame number and the universe number,
+counting across all the transmitters, and returns the slot values::
+
+    def render(frame, universe):
+        return [(frame + universe) % 256] * 512
+
+    dmxs = [DMXTransmitter(pin, universes=3, payload_class=SharedPayload)
+            for pin in pins]
+    with RenderPool(dmxs, render) as pool:
+        while True:
+            pool.frame()
+
+* Author: Dana Runge
+"""
+
+import time
+from multiprocessing import Pool
+
+from .shared_payload import SharedPayload
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+# Payloads this worker process has attached to, by name.
+_attached = {}
+
+
+def _render_partition(job):
+    "Worker: render and encode one payload's universes. Returns stage times."
+    render, name, first_universe, number = job
+    payload = _attached.get(name)
+    if payload is None:
+        payload = _attached[name] = SharedPayload.attach(name)
+    start = time.monotonic()
+    rows = [render(number, first_universe + u) for u in range(payload.universes)]
+    rendered = time.monotonic()
+    with payload.writing():
+        for universe, row in enumerate(rows):
+            payload[universe, :] = row
+    return rendered - start, time.monotonic() - rendered
+
+
+class StageStats:
+    "Latency of one pipeline stage. (seconds)"
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.last = None
+
+    def add(self, seconds) -> None:
+        "Record one measurement."
+        self.count = self.count + 1
+        self.total = self.total + seconds
+        self.last = seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    @property
+    def mean(self):
+        "Average, or None before the first measurement."
+        return self.total / self.count if self.count else None
+
+    def __repr__(self):
+        if not self.count:
+            return "StageStats(count=0)"
+        return (
+            f"StageStats(count={self.count}, mean={self.mean:.6f}, "
+            f"minimum={self.minimum:.6f}, maximum={self.maximum:.6f})"
+        )
+
+
+class RenderPool:
+    """Render every universe of several transmitters in worker processes.
+
+    :param transmitters: :class:`DMXTransmitter` objects, or anything with a
+        'payload' and a ``show()``. Every payload must be a
+        :class:`SharedPayload`.
+    :param render: ``render(frame, universe)`` returning the universe's slot
+        values. Must be importable by the workers.
+    :param int processes: worker processes. Default: one per CPU.
+
+    'stats' has a :class:`StageStats` for each stage: 'render' and 'encode'
+    (in the workers, per partition), 'frame' (submit to all partitions
+    done) and 'show'.
+    """
+
+    def __init__(self, transmitters, render, processes=None):
+        self.transmitters = list(transmitters)
+        self.render = render
+        self.number = 0
+        self._jobs = []
+        first_universe = 0
+        for transmitter in self.transmitters:
+            payload = transmitter.payload
+            if not isinstance(payload, SharedPayload):
+                raise ValueError("Every payload must be a SharedPayload.")
+            self._jobs.append((payload.name, first_universe))
+            first_universe = first_universe + payload.universes
+        self.universes = first_universe
+        self.stats = {
+            stage: StageStats() for stage in ("render", "encode", "frame", "show")
+        }
+        self._pool = Pool(processes)  # pylint: disable=consider-using-with
+
+    def frame(self, number=None) -> int:
+        """Render, encode and show one frame. Returns its number.
+
+        :param int number: passed to the render function. Default: one more
+            than the last frame.
+        """
+        if number is None:
+            number = self.number
+        self.number = number + 1
+        start = time.monotonic()
+        jobs = [(self.render, name, first, number) for name, first in self._jobs]
+        for rendering, encoding in self._pool.imap_unordered(_render_partition, jobs):
+            self.stats["render"].add(rendering)
+            self.stats["encode"].add(encoding)
+        done = time.monotonic()
+        self.stats["frame"].add(done - start)
+        for transmitter in self.transmitters:
+            transmitter.show()
+        self.stats["show"].add(time.monotonic() - done)
+        return number
+
+    def close(self) -> None:
+        "Stop the worker processes."
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.scene_cache`
+=============================
+
+Keep looks ready to send, already encoded for the state machine.
+
+A scene is a copy of the payload's array: the timing, the START CODE and
+every slot with its mark, in the same 16 or 32 bit words the state machine
+reads. Recalling a scene is one word copy, no re-encoding.
+
+* Author: Dana Runge
+"""
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+
+class SceneCache:
+    """A memory limited, least recently used, cache of encoded scenes.
+
+    :param payload: the payload scenes are stored from and recalled into,
+        usually ``dmx.payload``.
+
+    :param int budget: the most memory the scenes may use. (bytes)
+        When a new scene does not fit, the least recently used scenes
+        are dropped. Default: 16384.
+
+    Example::
+
+        scenes = SceneCache(dmx.payload, budget=8192)
+        dmx[0:3] = 255
+        scenes.store("warm")
+        ...
+        scenes.recall("warm")          # Into the payload, then:
+        dmx.show()
+        dmx.show(loop=scenes.frame("warm"))  # Or send it directly.
+    """
+
+    def __init__(self, payload, budget=16384):
+        self.payload = payload
+        self.budget = int(budget)
+        if self.budget < 0:
+            raise ValueError("'budget' must not be negative")
+        self._scenes = {}
+        self._order = []  # Least recently used first.
+        self.used = 0
+
+    def _size(self, frame) -> int:
+        "Memory used by a frame. (bytes)"
+        return len(frame) * getattr(frame, "itemsize", self.payload.bits // 8)
+
+    def _touch(self, name) -> None:
+        "Move a scene to the most recently used end."
+        self._order.remove(name)
+        self._order.append(name)
+
+    def store(self, name) -> None:
+        "Store the payload as it is now, under 'name'."
+        frame = self.payload.array_copy()
+        size = self._size(frame)
+        if size > self.budget:
+            raise ValueError(
+                f"Scene needs {size} bytes, more than the budget of {self.budget}."
+            )
+        self.discard(name)
+        while self.used + size > self.budget:
+            self.discard(self._order[0])
+        self._scenes[name] = (self.payload.universes, frame)
+        self._order.append(name)
+        self.used = self.used + size
+
+    def frame(self, name):
+        """The stored array for 'name'. Ready for ``dmx.show(loop=...)``.
+
+        Raises KeyError if the scene is not in the cache.
+        """
+        frame = self._scenes[name][1]
+        self._touch(name)
+        return frame
+
+    def recall(self, name) -> None:
+        """Copy the scene into the payload.
+
+        Raises KeyError if the scene is not in the cache, and ValueError if
+        the payload no longer has the scene's universes and slots.
+        """
+        self.payload.array_load(self.frame(name), universes=self._scenes[name][0])
+
+    def discard(self, name) -> None:
+        "Remove a scene, if present."
+        scene = self._scenes.pop(name, None)
+        if scene is not None:
+            self._order.remove(name)
+            self.used = self.used - self._size(scene[1])
+
+    def __contains__(self, name):
+        return name in self._scenes
+
+    def __len__(self):
+        return len(self._scenes)
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.scene_library`
+===============================
+
+A file of pre-encoded cues, for Linux hosts with thousands of looks.
+
+The file holds a header, then one fixed size record per cue: a name and
+the payload's array exactly as the state machine reads it. The reader
+memory maps the file, so recalling cue 3 or cue 3000 is the same single
+copy into the payload, with no parsing.
+
+Needs ``mmap`` and ``struct``, so it runs under CPython, not CircuitPython.
+
+File layout, all little-endian except the cue words, which are in the
+byte order named in the header::
+
+    offset  size  field
+         0     4  magic b"DMXL"
+         4     1  version (1)
+         5     1  universes (1-3)
+         6     1  bytes per word
+         7     1  byte order of the words (0 little, 1 big)
+         8     2  slots (1-512)
+        10     2  reserved
+        12     4  words per cue
+        16     4  number of cues
+        20    12  timing when written: mark_before_break, space_for_break,
+                  mark_after_break, mark_after_start_code,
+                  mark_between_slots, mark_after_frame (0 is False).
+                  (microseconds, 2 bytes each)
+        32     -  cues: a 16 byte UTF-8 name, NUL padded, then the words
+
+* Author: Dana Runge
+"""
+
+import mmap
+import struct
+import sys
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+MAGIC = b"DMXL"
+VERSION = 1
+NAME_SIZE = 16
+_HEADER = struct.Struct("<4sBBBBHHII6H")
+_COUNT_OFFSET = 16
+_BYTE_ORDERS = ("little", "big")
+
+
+def _timing(payload) -> tuple:
+    "The header's timing fields from a payload."
+    mark_after_frame = payload.mark_after_frame
+    return (
+        payload.mark_before_break,
+        payload.space_for_break,
+        payload.mark_after_break,
+        payload.mark_after_start_code,
+        payload.mark_between_slots,
+        0 if mark_after_frame is False else mark_after_frame,
+    )
+
+
+class SceneLibraryWriter:
+    """Write a new scene library, one snapshot of the payload per cue.
+
+    :param str path: the file to create. An existing file is replaced.
+    :param payload: the payload to snapshot, usually ``dmx.payload``.
+
+    Example::
+
+        with SceneLibraryWriter("show.dmxl", dmx.payload) as writer:
+            for look in looks:
+                dmx[:] = look
+                writer.snapshot()
+    """
+
+    def __init__(self, path, payload):
+        self.payload = payload
+        self.count = 0
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                payload.universes,
+                payload.array.itemsize,
+                _BYTE_ORDERS.index(sys.byteorder),
+                payload.slots,
+                0,
+                len(payload.array),
+                0,
+                *_timing(payload),
+            )
+        )
+
+    def snapshot(self, name="") -> int:
+        """Append the payload as it is now. Returns the cue number."""
+        encoded = name.encode("utf-8")
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f"'name' is longer than {NAME_SIZE} bytes.")
+        self._file.write(encoded + bytes(NAME_SIZE - len(encoded)))
+        self._file.write(self.payload.array.tobytes())
+        self.count = self.count + 1
+        return self.count - 1
+
+    def close(self) -> None:
+        "Write the cue count and close the file."
+        if self._file.closed:
+            return
+        self._file.seek(_COUNT_OFFSET)
+        self._file.write(struct.pack("<I", self.count))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SceneLibrary:
+    """Read a scene library through a memory map.
+
+    :param str path: a file written by :class:`SceneLibraryWriter`.
+
+    Example::
+
+        with SceneLibrary("show.dmxl") as library:
+            library.recall(42, dmx.payload)
+            dmx.show()
+            library.recall("blackout", dmx.payload)
+            dmx.show()
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                self.universes,
+                self.itemsize,
+                byte_order,
+                self.slots,
+                _,
+                self.words,
+                self.count,
+                *self.timing,
+            ) = _HEADER.unpack_from(self._map)
+        except struct.error as exc:
+            self._map.close()
+            raise ValueError("Not a scene library.") from exc
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError("Not a scene library, or an unknown version.")
+        if _BYTE_ORDERS[byte_order] != sys.byteorder:
+            self._map.close()
+            raise ValueError("Scene library was written with another byte order.")
+        self._record = NAME_SIZE + self.words * self.itemsize
+        if len(self._map) < _HEADER.size + self.count * self._record:
+            self._map.close()
+            raise ValueError("Scene library is truncated.")
+        self._names = None
+
+    def _offset(self, cue) -> int:
+        "Offset of a cue's words, by number or by name."
+        if isinstance(cue, str):
+            if self._names is None:
+                self._names = {}
+                for number in range(self.count):
+                    self._names.setdefault(self.name(number), number)
+            cue = self._names[cue]
+        cue = int(cue)
+        if cue < 0:
+            cue = cue + self.count
+        if cue < 0 or cue >= self.count:
+            raise IndexError("Cue out of range")
+        return _HEADER.size + cue * self._record + NAME_SIZE
+
+    def name(self, cue) -> str:
+        "The name of a cue, by number."
+        start = self._offset(cue) - NAME_SIZE
+        return bytes(self._map[start : start + NAME_SIZE]).rstrip(b"\0").decode()
+
+    def recall(self, cue, payload) -> None:
+        """Copy a cue, by number or name, into the payload.
+
+        The payload must have the same universes, slots and word size
+        as the library.
+        """
+        if (
+            payload.universes != self.universes
+            or payload.slots != self.slots
+            or payload.array.itemsize != self.itemsize
+        ):
+            raise ValueError("Payload does not match the scene library.")
+        start = self._offset(cue)
+        with memoryview(self._map) as view:
+            with view[start : start + self.words * self.itemsize] as words:
+                with words.cast(payload.data_code) as frame:
+                    payload.array_load(frame)
+
+    def __len__(self):
+        return self.count
+
+    def close(self) -> None:
+        "Release the memory map."
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
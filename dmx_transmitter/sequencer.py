@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.sequencer`
+===========================
+
+Send a sequence of pre-encoded frames back to back: chases, alternate
+START CODE frames between NULL START CODE data, test patterns.
+
+Each frame tells the state machine its own timing and slot count, so
+frames can simply follow each other in one buffer. Repeats are written
+into the ring as copies, so the state machine does the counting: frame
+exact, with no work in Python per frame or per step. The copies cost
+memory, so the ring has a budget. Frames with fewer slots, from
+``payload.clone(slots=...)``, make longer sequences fit.
+
+* Author: Dana Runge
+"""
+
+import array
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+
+class Sequencer:
+    """A ring of pre-encoded frames.
+
+    :param payload: a payload with the transmitter's universes. Sets the
+        word format and provides the default frame for :meth:`add`.
+    :param int budget: the most memory the ring may use, repeats
+        included. (bytes) Default: 16384.
+
+    Example, a two step chase::
+
+        sequence = Sequencer(dmx.payload.clone(slots=24))
+        sequence.payload[0] = 255
+        sequence.add(repeat=20)       # About half a second.
+        sequence.payload.clear()
+        sequence.add(repeat=20)
+        sequence.play(dmx)
+    """
+
+    def __init__(self, payload, budget=16384):
+        self.payload = payload
+        self.budget = int(budget)
+        if self.budget < 0:
+            raise ValueError("'budget' must not be negative")
+        # (frame, repeat, interval) for every step.
+        self.steps = []
+        self.used = 0
+        self._ring = None
+
+    def add(self, frame=None, repeat=1) -> None:
+        """Add a frame to the end of the sequence.
+
+        :param frame: a payload, or an encoded frame such as from
+            ``array_copy``. Default: a copy of the payload as it is now.
+        :param int repeat: how many times the frame is sent in a row.
+        """
+        repeat = int(repeat)
+        if repeat < 1:
+            raise ValueError("'repeat' shall be at least 1")
+        if frame is None:
+            frame = self.payload.array_copy()
+        elif hasattr(frame, "array_copy"):
+            if frame.data_code != self.payload.data_code:
+                raise ValueError("Frame does not match the payload's universes.")
+            frame = frame.array_copy()
+        else:
+            if getattr(frame, "typecode", self.payload.data_code) != (
+                self.payload.data_code
+            ):
+                raise ValueError("Frame does not match the payload's universes.")
+            frame = array.array(self.payload.data_code, frame)
+        if len(frame) <= self.payload.slot_index:
+            raise ValueError("Frame is too short.")
+        # Checks the slot count against the frame's length, and the timing.
+        probe = self.payload.clone(slots=frame[3] + 1)
+        probe.array_load(frame)
+        size = repeat * len(frame) * frame.itemsize
+        if self.used + size > self.budget:
+            raise ValueError(
+                f"Sequence needs {self.used + size} bytes, "
+                f"more than the budget of {self.budget}."
+            )
+        self.steps.append((frame, repeat, probe.interval))
+        self.used = self.used + size
+        self._ring = None
+
+    def clear(self) -> None:
+        "Remove all frames."
+        self.steps = []
+        self.used = 0
+        self._ring = None
+
+    def __len__(self):
+        "Frames sent in one trip around the ring."
+        return sum(step[1] for step in self.steps)
+
+    @property
+    def ring(self):
+        "Every frame, repeats included, joined into one buffer."
+        if self._ring is None:
+            if not self.steps:
+                raise ValueError("The sequence is empty.")
+            ring = array.array(self.payload.data_code)
+            for frame, repeat, _ in self.steps:
+                for _ in range(repeat):
+                    ring.extend(frame)
+            self._ring = ring
+        return self._ring
+
+    @property
+    def interval(self) -> int:
+        "The time for one trip around the sequence. (microseconds)"
+        return sum(repeat * interval for _, repeat, interval in self.steps)
+
+    def play(self, transmitter, loop=True) -> None:
+        """Hand the ring to the state machine, and return at once.
+
+        :param transmitter: a :class:`DMXTransmitter`.
+        :param bool loop: True repeats the sequence until the next ``show``,
+            ``run`` or ``stop``. False sends it once, then the payload.
+        """
+        if loop:
+            transmitter.show(loop=self.ring)
+        else:
+            transmitter.show(once=self.ring)
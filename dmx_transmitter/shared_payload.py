@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.shared_payload`
+================================
+
+A payload whose words live in shared memory, for rendering in other
+processes. Host only: needs multiprocessing.shared_memory.
+
+The process that sends creates the payload; rendering processes attach to
+it by name, and write slots in place. Nothing is pickled or copied
+between processes. A sequence number in front of the words makes a
+seqlock: writers make it odd while they write, and :meth:`array_copy`,
+which :meth:`DMXTransmitter.show` uses, retries until it copies a frame no
+writer was part way through.
+
+Example::
+
+    # Sending process
+    dmx = DMXTransmitter(first_out_pin, payload_class=SharedPayload, name="dmx")
+    dmx.show()
+
+    # Rendering process
+    payload = SharedPayload.attach("dmx")
+    with payload.writing():
+        payload.set_frame(frame)
+
+With more than one rendering process, give every process the same
+multiprocessing.Lock as 'lock'; the seqlock allows one writer at a time.
+
+* Author: Dana Runge
+"""
+
+import array
+import sys
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+from .payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+# Header, 64 bit words: sequence number, universes << 32 | slots, and the
+# creator's resource tracker process id (0 from Python 3.13).
+_HEADER = 24
+
+
+def _tracker() -> int:
+    "The resource tracker process this process registers shared memory with."
+    # pylint: disable=protected-access
+    tracker = resource_tracker._resource_tracker
+    tracker.ensure_running()
+    return tracker._pid or 0
+
+
+class SharedPayload(Payload_USITT_DMX512_A):
+    """A :class:`Payload_USITT_DMX512_A` in shared memory.
+
+    :param int universes: as in Payload_USITT_DMX512_A. Read from the
+        shared memory when attaching.
+    :param int slots: as in Payload_USITT_DMX512_A. Read from the shared
+        memory when attaching.
+    :param str name: the shared memory name. Default: a new unique name,
+        see 'name'.
+    :param bool create: False to attach to an existing payload. Default:
+        True. :meth:`attach` is the same.
+    :param lock: a multiprocessing.Lock shared by every writer, when there
+        is more than one writing process.
+    :param Payload_USITT_DMX512_A clone_from: copy the timing of this payload.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        universes=1,
+        slots=512,
+        name=None,
+        create=True,
+        lock=None,
+        clone_from=None,
+    ):
+        self.lock = lock
+        self._create = create
+        self._shm = None
+        self._sequence = None
+        self._bytes = None
+        self._one_slot_mark = None
+        if not create:
+            if sys.version_info >= (3, 13):
+                # pylint: disable-next=unexpected-keyword-arg
+                self._shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                self._shm = shared_memory.SharedMemory(name=name)
+            header = self._shm.buf[:_HEADER].cast("Q")
+            universes, slots = header[1] >> 32, header[1] & 0xFFFFFFFF
+            if sys.version_info < (3, 13) and header[2] != _tracker():
+                # Stop this process's own tracker unlinking it at exit. A
+                # tracker shared with the creator, as in its forks and
+                # multiprocessing children, keeps the creator's registration.
+                # pylint: disable=protected-access
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+            header.release()
+        self._name = name
+        super().__init__(universes=universes, slots=slots, clone_from=clone_from)
+
+    @classmethod
+    def attach(cls, name, lock=None):
+        "Attach to the payload another process created with this 'name'."
+        return cls(name=name, create=False, lock=lock)
+
+    @property
+    def name(self) -> str:
+        "The shared memory name, for :meth:`attach`."
+        return self._shm.name
+
+    def _make_array(self, count):
+        "The words, in shared memory after the header."
+        size = count * array.array(self.data_code).itemsize
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(
+                name=self._name, create=True, size=_HEADER + size
+            )
+            header = self._shm.buf[:_HEADER].cast("Q")
+            header[0] = 0
+            header[1] = self.universes << 32 | (count - self.slot_index)
+            header[2] = _tracker() if sys.version_info < (3, 13) else 0
+            header.release()
+        self._sequence = self._shm.buf[:8].cast("Q")
+        self._bytes = self._shm.buf[_HEADER : _HEADER + size]
+        return self._bytes.cast(self.data_code)
+
+    def _init_array(self, slots) -> None:
+        """Set up a new array. Attaching writes nothing: the creator's words
+        are in use."""
+        if self._create:
+            super()._init_array(slots)
+        else:
+            # One slot has no storage for it. As the default.
+            self._mark_between_slots = 8 - self._MinimumTiming.mark_between_slots
+
+    def _init_start_code(self, start_code=0x00) -> None:
+        "Set the START CODE, unless attaching: the creator has set it."
+        if self._create:
+            super()._init_start_code(start_code)
+
+    @property
+    def _mark_between_slots(self) -> int:
+        "Read from the words, so timing another process sets is followed."
+        if self.slots > 1:
+            return self._get_mark_val(self.array[self.slot_index])
+        return self._one_slot_mark
+
+    @_mark_between_slots.setter
+    def _mark_between_slots(self, val) -> None:
+        # The words are set by mark_between_slots. Kept for one slot.
+        self._one_slot_mark = val
+
+    @contextmanager
+    def writing(self):
+        """Make writes in this block look like one to :meth:`array_copy`.
+
+        Keep the block short: the sending process waits while it is open.
+        """
+        if self.lock is not None:
+            self.lock.acquire()
+        try:
+            self._sequence[0] = self._sequence[0] + 1  # Odd: a write is open.
+            try:
+                yield self
+            finally:
+                self._sequence[0] = self._sequence[0] + 1
+        finally:
+            if self.lock is not None:
+                self.lock.release()
+
+    def array_copy(self):
+        """Return a copy of the array, never part way through a
+        :meth:`writing` block. For sending."""
+        frame = array.array(self.data_code)
+        while True:
+            before = self._sequence[0]
+            if not before & 1:
+                frame.frombytes(self._bytes)
+                if self._sequence[0] == before:
+                    return frame
+                del frame[:]
+            time.sleep(0)
+
+    def close(self) -> None:
+        """Detach from the shared memory. Unusable afterwards.
+
+        Views of the words, such as NumPy arrays, must be gone first.
+        """
+        self.array.release()
+        self._bytes.release()
+        self._sequence.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        "Free the shared memory, once every process has closed it."
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        "Close, and free the shared memory if this process created it."
+        self.close()
+        if self._create:
+            self.unlink()
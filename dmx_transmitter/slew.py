@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: MIT
+"""
+`dmx_transmitter.slew`
+======================
+
+Limit how fast channels change, for motors and LED drivers that misbehave
+on large steps.
+
+Channel values written to a :class:`SlewLimiter` are targets. Each
+:meth:`SlewLimiter.step`, once a frame, moves the output of every channel
+not yet at its target by at most its rate, and writes those channels in
+one batched update. Channels at their target are not looked at, so once
+the output has settled a step costs nothing::
+
+    slew = SlewLimiter(dmx.payload)
+    slew.set_rate(slice(0, 2), 4)  # Pan and tilt: 4 a frame.
+    slew[0] = 255
+    while slew.step():
+        dmx.show()
+
+The output may be a payload or a :class:`Masters`.
+
+* Author: Dana Runge
+"""
+
+from .masters import channel_index, channel_writes, checked_writes
+
+__author__ = "Dana Runge"
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/mydana/CircuitPython_DMX_Transmitter"
+
+
+class SlewLimiter:
+    """Channel targets, reached at a limited rate.
+
+    :param output: a payload, or anything with ``len()``, slicing and
+        ``update(indexes, values)``, such as a :class:`Masters`. Its values
+        now are the starting point.
+    :param int rate: the largest change a frame, for every channel.
+        Default: 255, no limit.
+
+    Index like the payload: a slot major index, a slice, or
+    (universe, slot). Reading returns the target.
+    """
+
+    def __init__(self, output, rate=255):
+        self.output = output
+        self.payload = getattr(output, "payload", output)
+        self.current = bytearray(output[:])
+        self.targets = bytearray(self.current)
+        self.rates = bytearray([self._rate(rate)]) * len(self.current)
+        self._moving = set()
+
+    @staticmethod
+    def _rate(rate) -> int:
+        rate = int(rate)
+        if not 1 <= rate <= 255:
+            raise ValueError("'rate' shall be 1 - 255")
+        return rate
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __getitem__(self, index):
+        index = channel_index(self.payload, index)
+        if isinstance(index, range):
+            return [self.targets[channel] for channel in index]
+        return self.targets[index]
+
+    def __setitem__(self, index, val) -> None:
+        self.update(*channel_writes(self.payload, index, val))
+
+    def update(self, indexes, values) -> None:
+        "Set many targets in one call."
+        indexes, values = checked_writes(indexes, values, len(self.targets))
+        targets = self.targets
+        current = self.current
+        moving = self._moving
+        for index, val in zip(indexes, values):
+            targets[index] = val
+            if current[index] != val:
+                moving.add(index)
+            else:
+                moving.discard(index)
+
+    def set_rate(self, index, rate) -> None:
+        """Set the largest change a frame for some channels.
+
+        :param index: a slot major index, a slice, or (universe, slot).
+        :param int rate: 1 - 255. 255 is no limit.
+        """
+        rate = self._rate(rate)
+        index = channel_index(self.payload, index)
+        for channel in index if isinstance(index, range) else (index,):
+            self.rates[channel] = rate
+
+    def settle(self) -> None:
+        "Jump every channel to its target."
+        indexes = list(self._moving)
+        for index in indexes:
+            self.current[index] = self.targets[index]
+        self._moving.clear()
+        self.output.update(indexes, [self.targets[index] for index in indexes])
+
+    @property
+    def settled(self) -> bool:
+        "True when every channel is at its target."
+        return not self._moving
+
+    def step(self) -> int:
+        """Move every channel not at its target by up to its rate, and
+        write them. Once a frame. Returns how many are still moving."""
+        moving = self._moving
+        if not moving:
+            return 0
+        targets = self.targets
+        current = self.current
+        rates = self.rates
+        indexes = list(moving)
+        values = []
+        for index in indexes:
+            now = current[index]
+            target = targets[index]
+            rate = rates[index]
+            if target > now:
+                now = target if target - now <= rate else now + rate
+            else:
+                now = target if now - target <= rate else now - rate
+            current[index] = now
+            values.append(now)
+            if now == target:
+                moving.discard(index)
+        self.output.update(indexes, values)
+        return len(moving)
@@ -66,56 +66,91 @@ class TimingPin:  # pylint: disable=too-few-public-methods
     the state machine stalls unexpededly, the pin values will also stall.
     """
 
-    def __init__(self, *pins, program):
-        # __init__ is NOT used by the user.
-
-        # How many pins are already in use.
-        taken = (
-            5  # 5 bits for delay
-            + 8  # 8 bits of opcode parameters
-            # Unless we use some bits for sideset:
-            - program.pio_kwargs["sideset_pin_count"]
-            - program.pio_kwargs["sideset_enable"]
-        )
+    def __init__(self, *pins, program, field=None):
+        # __init__ is NOT used by the user. See TimingPins.
 
-        # Which bits do we leave alone?
-        mask = (
-            0xE000  # This is the opcode
-            | 2 ** (taken) - 1  # These are delay & opcode parameters
-            | (0x1000 if program.pio_kwargs["sideset_enable"] else 0)
+        # How many bits the program's own sideset takes.
+        side_bits = (
+            program.pio_kwargs["sideset_pin_count"]
+            + program.pio_kwargs["sideset_enable"]
         )
-
-        if len(pins) > program.pio_kwargs["sideset_pin_count"]:
-            raise ValueError(
-                f"No more than {program.pio_kwargs['sideset_pin_count']} pins."
-            )
-
+        if len(pins) > side_bits:
+            raise ValueError(f"No more than {side_bits} pins.")
+
+        # The program's sideset sits above the delay & opcode parameters.
+        taken = 5 + 8 - side_bits
+        # Which bits do we leave alone? The opcode, delay & opcode parameters.
+        mask = 0xE000 | 2**taken - 1
+        # The pins take the most significant bits of the delay field.
+        self.shift = 13 - len(pins)
+
+        if field is None:
+            # Each pin function is called once per program sideset value,
+            # not once per opcode.
+            values = [
+                sum(2**bit for bit, fun in enumerate(pins) if fun(side))
+                for side in range(2**side_bits)
+            ]
+            field = [values[(opcode & 0x1FFF) >> taken] for opcode in program.assembled]
+
+        self.universes = getattr(program, "universes", None)
         self.assembled = array.array(
             "H",
             (
-                (
-                    # Assemble the replacement sideset bits.
-                    sum(
-                        # Go through the sideset pins from opcode.
-                        2**bit
-                        for bit, fun in enumerate(pins)
-                        # 0x1FFF removes the 3 most significat bits
-                        # these are the operation code.
-                        # Then >> taken, removes the delay, opcode parameters
-                        # Leaving only the allocated sideset.
-                        if fun((opcode & 0x1FFF) >> taken)
-                    )
-                    << taken  # And move back into the right bits.
-                )
-                | (opcode & mask)
-                for opcode in program.assembled
+                int(bits) << self.shift | opcode & mask
+                for bits, opcode in zip(field, program.assembled)
             ),
         )
 
         self.pio_kwargs = dict(
             program.pio_kwargs,
-            sideset_pin_count=program.pio_kwargs["sideset_pin_count"] - len(pins),
-            initial_sideset_pin_state=bin(
-                sum(2**bit for bit, fun in enumerate(pins) if fun(0))
+            sideset_enable=False,
+            sideset_pin_count=len(pins),
+            initial_sideset_pin_state=sum(
+                2**bit for bit, fun in enumerate(pins) if fun(0)
             ),
         )
+        # rp2pio.StateMachine arguments. Empty without timing pins.
+        self.sm_kwargs = {}
+        if pins:
+            self.sm_kwargs = {
+                name: self.pio_kwargs[name]
+                for name in (
+                    "sideset_enable",
+                    "sideset_pin_count",
+                    "initial_sideset_pin_state",
+                )
+            }
+
+
+_programs = {}
+
+
+def TimingPins(*pins, program):  # pylint: disable=invalid-name
+    """The program rewritten for these timing pins. Made once, then shared.
+
+    Variants are kept by the program's machine code and pin functions, so
+    clones and other state machines with the same configuration reuse
+    them, and different programs never share one.
+    When the program is the frozen machine code (its 'frozen' is true)
+    and the pins are the functions in this module, the pin values come
+    from frozen_timing_pins.py and the pin functions are not called.
+
+    :param pins: up to three (3) of the functions in this module.
+    :param program: the machine code, with a 'universes' attribute.
+    """
+    key = (bytes(program.assembled), pins)
+    variant = _programs.get(key)
+    if variant is None:
+        field = None
+        names = tuple(getattr(fun, "__name__", "") for fun in pins)
+        if getattr(program, "frozen", False) and all(
+            globals().get(name) is fun for name, fun in zip(names, pins)
+        ):
+            # pylint: disable=import-outside-toplevel
+            from .frozen_timing_pins import TIMING_PIN_FIELDS
+
+            field = TIMING_PIN_FIELDS.get(names)
+        variant = TimingPin(*pins, program=program, field=field)
+        _programs[key] = variant
+    return variant
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+"""Measure the import time and RAM of each part of the library.
+
+Run on a board, or on a host with CPython (no RAM figures there).
+Each module is imported fresh, after unloading the whole library. A
+module that cannot be imported here is listed with the error.
+"""
+
+import gc
+import sys
+import time
+
+MODULES = (
+    "dmx_transmitter",
+    "dmx_transmitter.dmx_transmitter",
+    "dmx_transmitter.payload_USITT_DMX512_A",
+    "dmx_transmitter.frozen_code",
+    "dmx_transmitter.timing_pins",
+    "dmx_transmitter.merge",
+    "dmx_transmitter.scene_cache",
+    "dmx_transmitter.sequencer",
+    "dmx_transmitter.recorder",
+    "dmx_transmitter.payload_Alternate_Start_Code",
+    "dmx_transmitter.rdm",
+    "dmx_transmitter.frozen_timing_pins",
+    "dmx_transmitter.compliance",
+    "dmx_transmitter.frame_codec",
+    "dmx_transmitter.masters",
+    "dmx_transmitter.slew",
+    "dmx_transmitter.pixel_map",
+    "dmx_transmitter.pipeline",
+    "dmx_transmitter.live",
+    "dmx_transmitter.async_driver",
+    # Host only: these need multiprocessing or mmap, and fail on a board.
+    "dmx_transmitter.shared_payload",
+    "dmx_transmitter.render_pool",
+    "dmx_transmitter.scene_library",
+)
+
+
+def mem_free():
+    "Free RAM in bytes, or None where gc cannot tell."
+    gc.collect()
+    return gc.mem_free() if hasattr(gc, "mem_free") else None
+
+
+def unload():
+    "Forget every module of the library."
+    for name in [name for name in sys.modules if name.startswith("dmx_transmitter")]:
+        del sys.modules[name]
+
+
+def measure(name):
+    "Import 'name' fresh. Returns (milliseconds, bytes) or the error."
+    unload()
+    before = mem_free()
+    start = time.monotonic_ns()
+    try:
+        __import__(name)
+    except ImportError as error:
+        return error
+    elapsed = (time.monotonic_ns() - start) / 1_000_000
+    after = mem_free()
+    return elapsed, None if before is None else before - after
+
+
+print(f"{'module':48} {'ms':>8} {'bytes':>8}")
+for module in MODULES:
+    result = measure(module)
+    if isinstance(result, ImportError):
+        print(f"{module:48} {'-':>8} {'-':>8}  {result}")
+    else:
+        size = "-" if result[1] is None else result[1]
+        print(f"{module:48} {result[0]:8.2f} {size:>8}")
+unload()
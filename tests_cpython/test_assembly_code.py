@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import array
+import os
+import unittest
+
+from dmx_transmitter import assembly_code, frozen_code, frozen_timing_pins
+from dmx_transmitter.assembly_code import AssemblyCode, TimingAnalyzer
+
+
+class TimingAnalyzerTestCase(unittest.TestCase):
+    """Test the static timing analysis of the assembly code"""
+
+    def test_formulas(self):
+        for universes in (1, 2, 3):
+            analyzer = TimingAnalyzer(AssemblyCode.pre_process(universes))
+            formulas = analyzer.formulas()
+            self.assertEqual(formulas["MBB"], "2 + word0")
+            self.assertEqual(formulas["BRK"], "4 + word1")
+            self.assertEqual(formulas["DAT"], "32")
+            self.assertEqual(formulas["STP"], "4 + STP")
+            self.assertEqual(formulas["WAT"], "(2 + MAF) if MAF else 0")
+            self.assertEqual(
+                analyzer.frame_formula(),
+                "90 + sum(STP) + word0 + word1 + word2 + 41 * word3"
+                + " + ((2 + MAF) if MAF else 0)",
+            )
+
+    def test_payload(self):
+        try:
+            AssemblyCode.cross_check(trials=60)
+        except AssertionError as error:
+            self.fail(str(error))
+
+    def test_unmodeled(self):
+        with self.assertRaises(ValueError):
+            TimingAnalyzer("top:\n    mov x, y    ;AAA ; no\n")
+
+
+class FrozenProgram:  # pylint: disable=too-few-public-methods
+    "The frozen machine code, standing in for the assembler."
+
+    def __init__(self, universes):
+        self.pio_kwargs = dict(frozen_code.PIO_KWARGS)
+        self.assembled = array.array("H", frozen_code.MACHINE_CODE[universes - 1])
+
+
+class FrozenCodeTestCase(unittest.TestCase):
+    """Test the frozen module against the assembly code and TimingPin"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        self.assertEqual(
+            frozen_code.ASSEMBLY_CODE_SHA256, assembly_code.assembly_code_digest()
+        )
+        self.assertEqual(frozen_code.MINIMUM_TIMING, AssemblyCode.get_timing())
+        fields = assembly_code.timing_pin_fields(FrozenProgram)
+        self.assertEqual(len(fields), 1 + 6 + 30 + 120)
+        path = os.path.join(os.path.dirname(frozen_code.__file__), "frozen_code.py")
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(file.read(), assembly_code.frozen_module(FrozenProgram))
+        path = frozen_timing_pins.__file__
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(
+                file.read(), assembly_code.frozen_pins_module(FrozenProgram)
+            )
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import asyncio
+import unittest
+
+from dmx_transmitter.async_driver import AsyncDriver, Batch
+from dmx_transmitter.dmx_transmitter import DMXTransmitter
+
+
+class StateMachine:  # pylint: disable=too-few-public-methods
+    "Stands in for rp2pio.StateMachine. Keeps the frames it was given."
+
+    def __init__(self, program, **kwargs):
+        self.program = program
+        self.kwargs = kwargs
+        self.frames = []
+        self.once = []
+
+    def background_write(self, once=None, loop=None):
+        if once is not None:
+            self.once.append(once)
+        if loop is not None:
+            self.frames.append(loop)
+
+    def stop(self):
+        pass
+
+
+class AsyncDriverTestCase(unittest.TestCase):
+    """Test batched effect writes, one show per tick and lateness stats"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        dmx = DMXTransmitter(
+            first_out_pin=None, universes=2, slots=16, state_machine_class=StateMachine
+        )
+        now = [0]
+        period = dmx.payload.interval * 1000  # Nanoseconds.
+
+        async def sleep(seconds):
+            now[0] = now[0] + round(seconds * 1_000_000_000)
+
+        driver = AsyncDriver(dmx, clock=lambda: now[0], sleep=sleep)
+        seen = []
+
+        def plain(tick, batch):
+            batch[tick] = 100 + tick
+
+        @driver.every_frame
+        async def effect(tick, batch):
+            await asyncio.sleep(0)
+            batch[1, tick] = 200 + tick
+            seen.append(tick)
+
+        driver.every_frame(plain)
+        asyncio.run(driver.run(ticks=3))
+        frames = dmx.state_machine.frames
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(seen, [0, 1, 2])
+        self.assertEqual(dmx.payload[0:3], [100, 101, 102])
+        self.assertEqual(dmx.payload[1, 0:3], [200, 201, 202])
+        self.assertEqual(now[0], 2 * period)
+        self.assertEqual(driver.stats.ticks, 3)
+        self.assertEqual(driver.stats.late, 0)
+        self.assertEqual(driver.stats.jitter, 0.0)
+
+        # An effect that takes 2.75 frames: ticks are skipped, not bunched.
+        driver.remove(effect)
+
+        def slow(_tick, _batch):
+            now[0] = now[0] + period * 11 // 4
+
+        driver.every_frame(slow)
+        asyncio.run(driver.run(ticks=3))
+        self.assertEqual(len(frames), 6)
+        self.assertEqual(driver.stats.skipped, 3)
+        self.assertEqual(driver.stats.late, 1)
+        self.assertAlmostEqual(driver.stats.maximum, period * 3 / 4 / 1_000_000_000)
+        self.assertGreater(driver.stats.jitter, 0)
+        self.assertFalse(driver.running)
+
+
+class BatchTestCase(unittest.TestCase):
+    """Test (universe, slot) writes are checked as the payload checks them"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        dmx = DMXTransmitter(
+            first_out_pin=None, universes=2, slots=16, state_machine_class=StateMachine
+        )
+        batch = Batch(dmx.payload)
+        batch[1, 15] = 1
+        batch[0, 2:4] = 2
+        batch[-1, -1] = 4  # Negative indexes count back, as in the payload.
+        self.assertEqual(batch.writes, {31: 4, 2: 2, 3: 2})
+        for index in ((0, 16), (0, -17), (-3, 0), (2, 0)):
+            with self.assertRaises(IndexError):
+                batch[index] = 3
+        self.assertEqual(len(batch), 3)
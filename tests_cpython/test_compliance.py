@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.compliance import check, check_all
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class ComplianceTestCase(unittest.TestCase):
+    """Test the DMX512-A timing checks and their margins"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(slots=24)
+        payload.mark_after_break = 12
+        report = check(payload)
+        self.assertTrue(report.compliant)
+        self.assertEqual(report.timing, payload.timing)
+        self.assertEqual(report.worst.name, "mark_after_break")
+        self.assertEqual(report.worst.margin, 0)
+        # The same configuration as a dictionary.
+        self.assertEqual(
+            check({"slots": 24, "mark_after_break": 12}).checks, report.checks
+        )
+        reports = check_all(
+            {
+                "short break": {"space_for_break": 88, "mark_after_break": 12},
+                "fast": {"slots": 2, "mark_after_break": 12},
+                "default": {},
+            }
+        )
+        self.assertEqual(reports["short break"].worst.name, "space_for_break")
+        self.assertEqual(reports["short break"].worst.margin, -4)
+        self.assertEqual(reports["fast"].worst.name, "break_to_break")
+        self.assertFalse(reports["fast"].compliant)
+        self.assertFalse(reports["default"].compliant)  # MAB is 8.
+        self.assertEqual(len(check_all([{}, payload])), 2)
+        with self.assertRaises(ValueError):
+            check({"break": 100})
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import random
+import unittest
+
+from dmx_transmitter import frame_codec
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class FrameCodecTestCase(unittest.TestCase):
+    """Test whole frames in and out of payloads"""
+
+    def test_buffer(self):
+        for universes in (1, 2, 3):
+            payload = Payload_USITT_DMX512_A(universes=universes, slots=17)
+            frame = bytes(random.randint(0, 255) for _ in range(len(payload)))
+            payload.set_frame(frame)
+            self.assertEqual(bytes(payload[:]), frame)
+            with self.assertRaises(ValueError):
+                payload.set_frame(frame[1:])
+
+    @unittest.skipIf(frame_codec.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        numpy = frame_codec.numpy
+        for universes in (1, 2, 3):
+            payload = Payload_USITT_DMX512_A(universes=universes, slots=512)
+            payload.mark_after_frame = 20
+            expected = Payload_USITT_DMX512_A(universes=universes, slots=512)
+            expected.mark_after_frame = 20
+            frame = numpy.random.randint(0, 256, (universes, 512), dtype=numpy.uint8)
+            payload.set_frame(frame)
+            expected[:] = frame.reshape(-1).tolist()
+            self.assertEqual(payload.array, expected.array)
+            self.assertTrue((payload.get_frame() == frame).all())
+            with self.assertRaises(ValueError):
+                payload.set_frame(numpy.full((universes, 512), 256))
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import threading
+import unittest
+
+from dmx_transmitter.live import LiveWriter
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class StateMachine:  # pylint: disable=too-few-public-methods
+    "Keeps the loop buffers it was given."
+
+    def __init__(self):
+        self.loops = []
+        self.once = []
+
+    def background_write(self, once=None, loop=None):
+        if once is not None:
+            self.once.append(once)
+        if loop is not None:
+            self.loops.append(loop)
+
+
+class Transmitter:
+    "Stands in for a DMXTransmitter."
+
+    def __init__(self):
+        self.payload = Payload_USITT_DMX512_A(universes=3, slots=64)
+        self.state_machine = StateMachine()
+        self.recorder = None
+
+    def show(self, once=None, loop=None):
+        self.state_machine.background_write()
+        self.state_machine.background_write(once=once, loop=loop)
+
+
+class LiveWriterTestCase(unittest.TestCase):
+    """Test back buffer writes and publishing only changed words"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        now = [0]
+        transmitter = Transmitter()
+        live = LiveWriter(transmitter, clock=lambda: now[0])
+        live.start()
+        loops = transmitter.state_machine.loops
+        self.assertEqual(len(loops), 1)
+        live[0] = 10
+        live[2, 5] = 20
+        live[60:70] = [30] * 10
+        # Not before the first frame is out.
+        self.assertFalse(live.publish())
+        now[0] = now[0] + transmitter.payload.interval * 1000
+        self.assertTrue(live.publish())
+        self.assertEqual(loops[-1], transmitter.payload.array)
+        self.assertIsNot(loops[-1], loops[0])
+        # The third buffer catches up from the start.
+        threads = [
+            threading.Thread(target=live.update, args=([i * 3], [i])) for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] = now[0] + int(seconds * 1e9)
+
+        live.sleep = sleep
+        self.assertTrue(live.publish(wait=True))
+        self.assertEqual(len(slept), 1)
+        self.assertEqual(len({id(loop) for loop in loops}), 3)
+        self.assertEqual(loops[-1], transmitter.payload.array)
+        self.assertIs(live.frame, loops[-1])
+        # Then the first, catching up with both publishes since.
+        live[1, 1] = 40
+        self.assertTrue(live.publish(wait=True))
+        self.assertIs(loops[-1], loops[0])
+        self.assertEqual(loops[-1], transmitter.payload.array)
+
+
+class Interrupted:
+    "A lock that lets a writer in as soon as it is released."
+
+    def __init__(self, write):
+        self.write = write
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        write, self.write = self.write, None
+        if write is not None:
+            write()
+        return False
+
+
+class TornWriteTestCase(unittest.TestCase):
+    """Test publish sends the values it took under the lock"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        transmitter = Transmitter()
+        live = LiveWriter(transmitter, clock=lambda: 0)
+        live.start()
+        live._published = None  # pylint: disable=protected-access
+        live[0:64] = 10
+        before = transmitter.payload.array_copy()
+        # Another writer starts a multi-word write as publish lets go.
+        # pylint: disable-next=protected-access
+        live._lock = Interrupted(
+            lambda: transmitter.payload.update(range(64), [99] * 64)
+        )
+        self.assertTrue(live.publish())
+        self.assertEqual(transmitter.state_machine.loops[-1], before)
+
+
+class SendingStateMachine:
+    """Stands in for an rp2pio.StateMachine that tells which buffer it is
+    sending, and whether the last one handed over is still pending."""
+
+    def __init__(self):
+        self.last_write = None
+        self.pending_write = 0
+        self.loops = []
+
+    def background_write(self, once=None, loop=None):  # pylint: disable=unused-argument
+        if loop is not None:
+            self.loops.append(loop)
+            if self.last_write is None:
+                self.last_write = loop
+            else:
+                self.pending_write = 1
+
+    def end_of_frame(self):
+        "Take the pending buffer, as at the end of a frame."
+        if self.pending_write:
+            self.last_write = self.loops[-1]
+            self.pending_write = 0
+
+
+class SendingTestCase(unittest.TestCase):
+    """Test publishing while a frame is being sent"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        transmitter = Transmitter()
+        state_machine = transmitter.state_machine = SendingStateMachine()
+        live = LiveWriter(transmitter, clock=lambda: 0)
+        live.start()
+        first = state_machine.last_write
+        live[0] = 1
+        # The state machine says when it took a buffer: no frame interval.
+        self.assertTrue(live.publish())
+        second = state_machine.loops[-1]
+        self.assertIsNot(second, first)
+        # Still sending the first, the second pending: nothing is handed
+        # over, and waiting sleeps until the second is taken.
+        live[0] = 2
+        self.assertFalse(live.publish())
+        self.assertEqual(len(state_machine.loops), 2)
+        live.sleep = lambda seconds: state_machine.end_of_frame()
+        self.assertTrue(live.publish(wait=True))
+        third = state_machine.loops[-1]
+        self.assertIsNot(third, first)
+        self.assertIsNot(third, second)
+        # Sending the third: the next goes into another buffer, and the one
+        # being sent is left as it was.
+        sent = state_machine.loops[-1][:]
+        state_machine.end_of_frame()
+        live[0] = 3
+        self.assertTrue(live.publish())
+        self.assertIs(state_machine.loops[-1], first)
+        self.assertEqual(third, sent)
+        self.assertEqual(first, transmitter.payload.array)
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.masters import Masters, scale_table
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class MastersTestCase(unittest.TestCase):
+    """Test master levels applied when encoding, keeping channel values"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=2, slots=8)
+        payload[3] = 40
+        masters = Masters(payload)
+        self.assertEqual(masters[3], 40)
+        masters[0:3] = [200, 100, 50]
+        masters[1, 2] = 255
+        self.assertEqual(payload[0:4], [200, 100, 50, 40])
+        masters.grand = 128
+        self.assertEqual(masters[0:3], [200, 100, 50])
+        self.assertEqual(payload[0:3], [100, 50, 25])
+        self.assertEqual(payload[1, 2], 128)
+        masters.set_universe(1, 0)
+        self.assertEqual(payload[1, 2], 0)
+        self.assertEqual(payload[0], 100)
+        masters.grand = 255
+        masters.group("front", slice(0, 2), level=0)
+        masters.group("side", [1, 2], level=128)
+        self.assertEqual(payload[0:4], [0, 0, 25, 40])
+        masters.set_group("front", 255)
+        self.assertEqual(payload[0:4], [200, 50, 25, 40])
+        # Writes under a master are scaled as they go in.
+        masters[2] = 255
+        self.assertEqual(payload[2], 128)
+        masters.remove_group("side")
+        masters.set_universe(1, 255)
+        self.assertEqual(payload[0:4], [200, 100, 255, 40])
+        self.assertEqual(payload[1, 2], 255)
+        self.assertEqual(list(scale_table(255)), list(range(256)))
+        self.assertEqual(max(scale_table(0)), 0)
+        with self.assertRaises(ValueError):
+            masters.grand = 256
+        with self.assertRaises(ValueError):
+            masters[0] = -1
+        # (universe, slot) is checked as the payload checks it.
+        before = list(masters.values)
+        with self.assertRaises(IndexError):
+            masters[1, 8] = 1
+        with self.assertRaises(IndexError):
+            masters[2, 0] = 1
+        masters[1, -1] = 7
+        self.assertEqual(payload[1, 7], 7)
+        self.assertEqual(masters[1, 6:], [0, 7])
+        masters[1, -1] = 0
+        # Nothing is kept from a write that fails.
+        with self.assertRaises(IndexError):
+            masters.update([0, 16], [9, 9])
+        with self.assertRaises(ValueError):
+            masters.update([0, 1], [9, 256])
+        self.assertEqual(list(masters.values), before)
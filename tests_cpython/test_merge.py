@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.merge import HTP, LTP, Merger
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class FakeClock:
+    "A clock the test can move, in nanoseconds."
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now = self.now + int(seconds * 1_000_000_000)
+
+
+class MergeTestCase(unittest.TestCase):
+    """Test the HTP and LTP merge engine"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.payload = Payload_USITT_DMX512_A(universes=3, slots=16)
+        self.merger = Merger(self.payload, clock=self.clock)
+        self.console = self.merger.add_source("console")
+        self.effects = self.merger.add_source("effects")
+
+    def test_htp(self):
+        self.console[0:3] = 100
+        self.effects[1] = 200
+        self.effects[40] = 7
+        self.merger.merge()
+        self.assertEqual(self.payload[0:3], [100, 200, 100])
+        self.assertEqual(self.payload[40], 7)
+        self.effects[1] = 0
+        self.assertEqual(self.merger.merge(), 1)
+        self.assertEqual(self.payload[1], 100)
+        # Nothing changed, nothing written.
+        self.assertEqual(self.merger.merge(), 0)
+
+    def test_ltp(self):
+        self.merger.set_mode(slice(0, 4), LTP)
+        self.console[0] = 200
+        self.clock.advance(0.1)
+        self.effects[0] = 10
+        self.merger.merge()
+        self.assertEqual(self.payload[0], 10)
+        self.clock.advance(0.1)
+        self.console[0] = 200
+        self.merger.merge()
+        self.assertEqual(self.payload[0], 200)
+
+    def test_timeout(self):
+        self.console[5] = 50
+        self.clock.advance(1)
+        self.effects[5] = 90
+        self.merger.merge()
+        self.assertEqual(self.payload[5], 90)
+        self.clock.advance(2)
+        self.console.touch()
+        self.clock.advance(1)
+        self.merger.merge()
+        self.assertFalse(self.effects.live)
+        self.assertEqual(self.payload[5], 50)
+
+    def test_remove_source(self):
+        self.console[2] = 30
+        self.effects[2] = 60
+        self.merger.merge()
+        self.merger.remove_source(self.effects)
+        self.merger.merge()
+        self.assertEqual(self.payload[2], 30)
+        self.assertEqual(HTP, self.merger.modes[2])
+
+
+class PayloadUpdateTestCase(unittest.TestCase):
+    """Test the bulk update path"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=2, slots=8)
+        payload.update([0, 8, 15], [1, 2, 3])
+        self.assertEqual(payload[0], 1)
+        self.assertEqual(payload[8], 2)
+        self.assertEqual(payload[15], 3)
+        with self.assertRaises(IndexError):
+            payload.update([16], [0])
+        with self.assertRaises(ValueError):
+            payload.update([0], [256])
+        with self.assertRaises(ValueError):
+            payload.update([0, 1], [0])
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+# pylint: disable=invalid-name
+# pylint: enable=invalid-name
+import unittest
+
+from dmx_transmitter.payload_Alternate_Start_Code import (
+    Payload_Manufacturer_Specific,
+    Payload_System_Information_Packet,
+    Payload_Text_Packet,
+    checksum8,
+    checksum16,
+)
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+
+
+class TextPacketTestCase(unittest.TestCase):
+    """Test the Text Packet and the encoding cache"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        template = Payload_USITT_DMX512_A(universes=3, slots=8)
+        template.space_for_break = 100
+        packet = Payload_Text_Packet("Hello", page=2, clone_from=template)
+        self.assertEqual(packet.start_code, 0x17)
+        self.assertEqual(packet.slots, 8)
+        self.assertEqual(packet.space_for_break, 100)
+        data = [2, 0] + list(b"Hello") + [0]
+        self.assertEqual(packet[:], data * 3)
+        # A second packet with the same message comes from the cache.
+        again = Payload_Text_Packet("Hello", page=2, clone_from=template)
+        self.assertEqual(again.array, packet.array)
+        packet.set_message("World", page=2)
+        self.assertEqual(packet[:8], [2, 0] + list(b"World") + [0])
+        with self.assertRaises(ValueError):
+            packet.set_message("Too long")
+        self.assertEqual(packet.clone().array, packet.array)
+
+
+class SystemInformationPacketTestCase(unittest.TestCase):
+    """Test the System Information Packet checksums"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        previous = bytes(range(1, 101))
+        sip = Payload_System_Information_Packet(
+            previous, sequence=7, universe=1, manufacturers=(0x1234,)
+        )
+        self.assertEqual(sip.start_code, 0xCF)
+        data = sip.data_slots
+        self.assertEqual(len(data), 23)
+        self.assertEqual(data[0], 22)
+        self.assertEqual(data[2] << 8 | data[3], checksum16(previous))
+        self.assertEqual(data[12:14], b"\x12\x34")
+        self.assertEqual(data[-1], checksum8(data[:-1], 0xCF))
+
+
+class ManufacturerSpecificTestCase(unittest.TestCase):
+    """Test the manufacturer specific packet"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        packet = Payload_Manufacturer_Specific(0x7FF0, b"\x01\x02")
+        self.assertEqual(packet.start_code, 0x91)
+        self.assertEqual(packet[:], [0x7F, 0xF0, 1, 2])
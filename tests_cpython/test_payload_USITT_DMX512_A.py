@@ -70,7 +70,7 @@ class PayloadMixin:
             sum(properties.values())
             - properties["mark_between_slots"]
             + (4 + 32) * 2  # Start and data bits
-            + (4 + 32 + self.payload.mark_between_slots) * self.slots
+            + (4 + 32 + self.payload.mark_between_slots) * (self.slots - 1)
         )
         self.assertEqual(interval, self.payload.interval, "Interval")
         #
@@ -193,3 +193,111 @@ class ResourceLimitsTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             Payload_USITT_DMX512_A(universes=4)
         Payload_USITT_DMX512_A()
+
+
+class TimingTestCase(unittest.TestCase):
+    """Test the cached timing summary"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=2, slots=24)
+        timing = payload.timing
+        self.assertIs(timing, payload.timing)
+        self.assertEqual(timing.interval, payload.interval)
+        self.assertEqual(timing.slot_time, 36 + payload.mark_between_slots)
+        self.assertEqual(timing.terminal_time, 36)
+        self.assertAlmostEqual(timing.refresh, 1_000_000 / timing.interval)
+        frame = payload.array_copy()
+        payload.mark_after_frame = 20
+        self.assertEqual(payload.timing.terminal_time, 56)
+        # mark_before_break is 3 shorter with a mark_after_frame.
+        self.assertEqual(payload.interval, timing.interval + 20 - 3)
+        payload.space_for_break = 200
+        self.assertEqual(payload.timing.space_for_break, 200)
+        payload.array_load(frame)
+        self.assertEqual(payload.timing, timing)
+        # Written straight into the array, as another process would.
+        payload.array[1] = payload.array[1] + 10
+        self.assertEqual(payload.timing.space_for_break, timing.space_for_break + 10)
+        payload[0] = 255  # Slot data is not timing.
+        self.assertIs(payload.timing, payload.timing)
+
+
+class BulkMarkTestCase(unittest.TestCase):
+    """Test the bulk mark fill and template clear against word by word"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        for universes in (1, 2, 3):
+            payload = Payload_USITT_DMX512_A(universes=universes, slots=40)
+            payload.mark_after_frame = 20
+            data = [random.randint(0, 255) for _ in range(len(payload))]
+            payload[:] = data
+            payload.mark_between_slots = 77
+            self.assertEqual(list(payload), data)
+            # pylint: disable=protected-access
+            for word in payload.array[payload.slot_index : -1]:
+                self.assertEqual(payload._get_mark_val(word), 72)
+            self.assertEqual(payload.mark_after_frame, 20)
+            payload.clear()
+            self.assertEqual(list(payload), [0] * len(payload))
+            expected = payload._set_mark_val(0, 72)
+            self.assertEqual(set(payload.array[payload.slot_index : -1]), {expected})
+            self.assertEqual(payload.mark_after_frame, 20)
+
+
+class UpdateTestCase(unittest.TestCase):
+    """Test the coalesced bulk update against single writes"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        for universes in (1, 2, 3):
+            payload = Payload_USITT_DMX512_A(universes=universes, slots=30)
+            expected = Payload_USITT_DMX512_A(universes=universes, slots=30)
+            indexes = [random.randrange(len(payload)) for _ in range(200)]
+            values = [random.randint(0, 255) for _ in indexes]
+            payload.update(indexes, values)
+            for index, val in zip(indexes, values):
+                expected[index] = val  # The last write wins.
+            self.assertEqual(payload.array, expected.array)
+            payload.update(zip(indexes, [255 - val for val in values]))
+            payload.update({0: 1, len(payload) - 1: 2})
+            self.assertEqual(payload[0], 1)
+            self.assertEqual(payload[len(payload) - 1], 2)
+            with self.assertRaises(IndexError):
+                payload.update([len(payload)], [0])
+            with self.assertRaises(ValueError):
+                payload.update([0, 1], [0, 256])
+
+
+class TwoDimensionalTestCase(unittest.TestCase):
+    """Test payload[universe, slot] indexing against flat indexes"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        for universes in (1, 2, 3):
+            slots = 20
+            payload = Payload_USITT_DMX512_A(universes=universes, slots=slots)
+            payload[:] = [random.randint(0, 255) for _ in range(len(payload))]
+            flat = list(payload)
+            for universe in range(universes):
+                row = flat[universe * slots : (universe + 1) * slots]
+                self.assertEqual(payload[universe, 3], row[3])
+                self.assertEqual(payload[universe, -1], row[-1])
+                self.assertEqual(payload[universe, :], row)
+                self.assertEqual(payload[universe, 2:11:3], row[2:11:3])
+                self.assertEqual(payload[universe, ::-2], row[::-2])
+            last = (universes - 1) * slots
+            payload[-1, 4] = 99
+            flat[last + 4] = 99
+            payload[-1, 5:9] = [1, 2, 3, 4]
+            flat[last + 5 : last + 9] = [1, 2, 3, 4]
+            payload[0, ::2] = 7
+            flat[0:slots:2] = [7] * 10
+            payload[0, 9:1:-4] = (5, 6)
+            flat[9:1:-4] = (5, 6)
+            self.assertEqual(list(payload), flat)
+            with self.assertRaises(IndexError):
+                payload[universes, 0]  # pylint: disable=pointless-statement
+            with self.assertRaises(IndexError):
+                payload[0, slots] = 1
+            with self.assertRaises(ValueError):
+                payload[0, 0:2] = [1]
+            with self.assertRaises(ValueError):
+                payload[0, :] = 256
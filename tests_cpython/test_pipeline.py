@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.pipeline import (
+    curve,
+    effect,
+    encoder,
+    follow,
+    htp,
+    master,
+    scene,
+    show,
+)
+
+
+class Transmitter:  # pylint: disable=too-few-public-methods
+    "Stands in for a DMXTransmitter. Keeps what show sent."
+
+    def __init__(self):
+        self.payload = Payload_USITT_DMX512_A(universes=2, slots=8)
+        self.shown = []
+
+    def show(self):
+        self.shown.append(self.payload[:])
+
+
+class PipelineTestCase(unittest.TestCase):
+    """Test pulling reused frames from sources to a sink"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        transmitter = Transmitter()
+        size = len(transmitter.payload)
+        renders = []
+
+        def chase(number, frame):
+            renders.append(number)
+            frame[number % size] = 255
+            frame[(number - 1) % size] = 0
+
+        live = bytearray(size)
+        level = [255]
+        chain = show(
+            encoder(
+                master(
+                    htp(effect(chase, size), follow(live), scene([10] * size)),
+                    lambda: level[0],
+                ),
+                transmitter.payload,
+            ),
+            transmitter,
+        )
+        # Nothing runs until pulled.
+        self.assertEqual(renders, [])
+        self.assertIs(next(chain), transmitter.payload)
+        self.assertEqual(transmitter.shown, [[255] + [10] * (size - 1)])
+        live[3] = 50
+        level[0] = 51
+        next(chain)
+        self.assertEqual(renders, [0, 1])
+        self.assertEqual(transmitter.shown[-1], [2, 51, 2, 10] + [2] * (size - 4))
+        # Stages yield the same buffer every frame.
+        source = effect(chase, size)
+        self.assertIs(next(source), next(source))
+        inverted = curve(scene(range(4)), range(255, -1, -1))
+        self.assertEqual(list(next(inverted)), [255, 254, 253, 252])
+        # A frame without translate(), as on CircuitPython.
+        inverted = curve(follow(memoryview(bytes(range(4)))), range(255, -1, -1))
+        self.assertEqual(list(next(inverted)), [255, 254, 253, 252])
+        with self.assertRaises(ValueError):
+            next(curve(scene([0]), range(10)))
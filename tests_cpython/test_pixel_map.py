@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter import pixel_map
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.pixel_map import PixelMap
+
+
+class PixelMapTestCase(unittest.TestCase):
+    """Test compiling a layout and writing images across payloads"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payloads = [
+            Payload_USITT_DMX512_A(universes=2, slots=8),
+            Payload_USITT_DMX512_A(universes=1, slots=8),
+        ]
+        payloads[0][7] = 99
+        pixels = PixelMap(payloads, width=3, height=2)
+        self.assertEqual(pixels.universes, 3)
+        # Pixel tape along the top row, GRB, wrapping into universe 1.
+        end = pixels.strip([(0, 0), (1, 0), (2, 0)], universe=0, slot=1, order="GRB")
+        self.assertEqual(end, (1, 3))
+        # One fixture in the second payload.
+        pixels.add(1, 1, universe=2, slot=4, order="BGR")
+        image = bytes(range(1, 19))  # Pixel (x, y) starts at 3 * (3 * y + x) + 1.
+        pixels.write(image)
+        self.assertEqual(payloads[0][0:8], [0, 2, 1, 3, 5, 4, 6, 99])
+        self.assertEqual(payloads[0][1, 0:4], [8, 7, 9, 0])
+        self.assertEqual(payloads[1][0:8], [0, 0, 0, 0, 15, 14, 13, 0])
+        # A new image, and a layout change.
+        pixels.write(bytearray(18))
+        self.assertEqual(payloads[0][0:8], [0] * 7 + [99])
+        pixels.add(0, 1, universe=2, slot=0)
+        pixels.write(image)
+        self.assertEqual(payloads[1][0:3], [10, 11, 12])
+        with self.assertRaises(ValueError):
+            pixels.write(image[1:])
+        with self.assertRaises(ValueError):
+            pixels.write([300] * 18)  # Either way, with or without NumPy.
+        with self.assertRaises(ValueError):
+            pixels.add(0, 0, universe=0, slot=0, order="RGBW")
+        with self.assertRaises(IndexError):
+            pixels.add(3, 0, universe=0, slot=0)
+        with self.assertRaises(IndexError):
+            pixels.add(0, 0, universe=0, slot=6)
+        with self.assertRaises(IndexError):
+            pixels.add(0, 0, universe=3, slot=0)
+        with self.assertRaises(IndexError):
+            pixels.add(0, 0, universe=-1, slot=0)
+
+
+class PixelMapNumPyTestCase(unittest.TestCase):
+    """Test writing a NumPy image to a matrix"""
+
+    @unittest.skipIf(pixel_map.numpy is None, "NumPy is not installed")
+    def runTest(self):  # pylint: disable=invalid-name
+        numpy = pixel_map.numpy
+        payload = Payload_USITT_DMX512_A(universes=3, slots=512)
+        pixels = PixelMap([payload], width=32, height=12, channels=4)
+        points = [(x, y) for y in range(12) for x in range(32)]
+        pixels.strip(points, universe=0, slot=0, order="RGBW")
+        image = numpy.random.randint(0, 256, (12, 32, 4), dtype=numpy.uint8)
+        pixels.write(image)
+        # 128 RGBW fixtures fill each universe.
+        frame = payload.get_frame()
+        self.assertEqual(frame.reshape(-1).tolist(), image.reshape(-1).tolist())
+        # Checked as the payload checks values, whatever the dtype.
+        small = PixelMap([payload], width=2, height=1)
+        small.strip([(0, 0), (1, 0)], universe=0, slot=0)
+        for bad in ([10, 20, 30, 300, -1, 999], numpy.full((1, 2, 3), 0.5)):
+            with self.assertRaises(ValueError):
+                small.write(bad)
+        with self.assertRaises(ValueError):
+            small.write(numpy.zeros((2, 1, 3), dtype=numpy.uint8))
+        small.write(numpy.array([[[1, 2, 3], [4, 5, 6]]]))
+        self.assertEqual(payload[0:6], [1, 2, 3, 4, 5, 6])
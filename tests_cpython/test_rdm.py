@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import random
+import unittest
+
+from dmx_transmitter import rdm
+
+
+class RequestTestCase(unittest.TestCase):
+    """Test building, encoding, caching and decoding requests"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        controller = rdm.RDMController(0x7FF0_00000001, universes=2)
+        first = controller.get(0x4D50_12345678, rdm.DMX_START_ADDRESS)
+        self.assertEqual(first.start_code, rdm.START_CODE)
+        self.assertEqual(first.space_for_break, 176)
+        self.assertEqual(first.mark_after_break, 12)
+        message = rdm.decode(first)
+        self.assertEqual(message.destination, 0x4D50_12345678)
+        self.assertEqual(message.source, 0x7FF0_00000001)
+        self.assertEqual(message.command_class, rdm.GET_COMMAND)
+        self.assertEqual(message.pid, rdm.DMX_START_ADDRESS)
+        self.assertEqual(message.transaction, 0)
+        # Same request again: a patched copy, the first is left alone.
+        second = controller.get(0x4D50_12345678, rdm.DMX_START_ADDRESS)
+        self.assertIsNot(second, first)
+        self.assertEqual(rdm.decode(second).transaction, 1)
+        self.assertEqual(rdm.decode(first).transaction, 0)
+        third = controller.get(0x4D50_12345678, rdm.DMX_START_ADDRESS)
+        self.assertEqual(rdm.decode(third).transaction, 2)
+        self.assertEqual(rdm.decode(second).transaction, 1)
+        self.assertEqual(second[: second.slots], second[second.slots :], "universes")
+        request = controller.set(0x4D50_12345678, rdm.DMX_START_ADDRESS, b"\x00\x10")
+        self.assertEqual(rdm.decode(request).data, b"\x00\x10")
+        # Only the most recently used requests are kept.
+        for address in range(100):
+            controller.set(0x4D50_12345678, rdm.DMX_START_ADDRESS, bytes((0, address)))
+        # pylint: disable=protected-access
+        self.assertEqual(len(controller._requests), rdm._REQUESTS)
+        self.assertEqual(len(controller._order), rdm._REQUESTS)
+        # Mutes are not kept at all: discovery mutes each responder once.
+        muted = controller.mute(0x4D50_12345678)
+        self.assertEqual(rdm.decode(muted).pid, rdm.DISC_MUTE)
+        self.assertNotIn(rdm.DISC_MUTE, [key[2] for key in controller._requests])
+        damaged = bytearray(rdm.build_request(1, 2, rdm.GET_COMMAND, rdm.DEVICE_INFO))
+        damaged[-1] = damaged[-1] ^ 1
+        with self.assertRaises(ValueError):
+            rdm.decode(damaged)
+
+
+class FakeResponders:
+    "Responders on a wire. Replies collide when more than one answers."
+
+    def __init__(self, uids):
+        self.uids = uids
+        self.muted = set()
+        self.requests = 0
+        self.branches = set()
+
+    def __call__(self, payload):
+        self.requests = self.requests + 1
+        message = rdm.decode(payload)
+        if message.pid == rdm.DISC_UN_MUTE:
+            self.muted.clear()
+            return None
+        if message.pid == rdm.DISC_MUTE:
+            if message.destination not in self.uids:
+                return None
+            self.muted.add(message.destination)
+            return b"ack"
+        self.branches.add(id(payload))
+        lower = int.from_bytes(message.data[:6], "big")
+        upper = int.from_bytes(message.data[6:], "big")
+        answering = [
+            uid for uid in self.uids if lower <= uid <= upper and uid not in self.muted
+        ]
+        if not answering:
+            return None
+        if len(answering) == 1:
+            return rdm.encode_discovery_response(answering[0])
+        return bytes(
+            a | b
+            for a, b in zip(
+                *(rdm.encode_discovery_response(uid) for uid in answering[:2])
+            )
+        )
+
+
+class DiscoveryTestCase(unittest.TestCase):
+    """Test the discovery branch search"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        uids = sorted(random.sample(range(1, rdm.MAXIMUM_UID), 12))
+        uids.append(uids[0] + 1)  # Neighbors split at the deepest branch.
+        responders = FakeResponders(uids)
+        controller = rdm.RDMController(0x7FF0_00000001)
+        self.assertEqual(controller.discover(responders), sorted(uids))
+        self.assertEqual(responders.muted, set(uids))
+        # One payload for every branch request.
+        self.assertEqual(len(responders.branches), 1)
+        self.assertEqual(rdm.decode_discovery_response(b"\xFE\xAA"), None)
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import io
+import struct
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.recorder import FrameRecorder, FrameReplayer
+
+
+class StateMachine:  # pylint: disable=too-few-public-methods
+    "Collects what was written to it."
+
+    def __init__(self, sent):
+        self.sent = sent
+
+    def background_write(self, once=None, loop=None):
+        if once is not None:
+            self.sent.append(("stop", list(once), list(loop)))
+
+
+class FakeTransmitter:
+    "Collects what would have gone to the state machine."
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.sent = []
+        self.state_machine = StateMachine(self.sent)
+
+    def show(self, once=None, loop=None):
+        if once is not None:
+            self.sent.append(("once", list(once)))
+        self.sent.append(list(loop))
+
+
+def kinds(data):
+    "The kind of every record in a recording."
+    offset = struct.calcsize("<4sBcBBBH")
+    result = []
+    while offset < len(data):
+        kind, _, count = struct.unpack_from("<cqI", data, offset)
+        offset = offset + struct.calcsize("<cqI")
+        size = {b"K": 8, b"O": 8, b"D": 12, b"S": 0}[kind]
+        offset = offset + count * size
+        result.append(kind)
+    return b"".join(result)
+
+
+class RecorderTestCase(unittest.TestCase):
+    """Test recording keyframes and deltas, and replaying them"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=3, slots=64)
+        now = [0]
+        file = io.BytesIO()
+        recorder = FrameRecorder(file, payload, keyframe_every=3, clock=lambda: now[0])
+        expected = []
+        for tick in range(8):
+            now[0] = tick * 25_000_000
+            if tick != 4:  # Frame 4 has no changes.
+                payload[tick] = 200
+            frame = payload.array_copy()
+            if tick == 6:
+                once = payload.array_stop()
+                recorder.record(frame, once=once)
+                expected.append(("once", list(once)))
+            else:
+                recorder.record(frame)
+            if tick != 4:
+                expected.append(list(frame))
+        recorder.record_stop()
+        expected.append(("stop", list(payload.array_stop()), []))
+        # A keyframe every 3 frames, nothing for a frame with no changes.
+        self.assertEqual(kinds(file.getvalue()), b"KDDKDODKS")
+        # Deltas are much smaller than keyframes.
+        self.assertLess(len(file.getvalue()), 5 * len(frame) * frame.itemsize)
+        file.seek(0)
+        transmitter = FakeTransmitter(payload.clone(slots=payload.slots))
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] = now[0] + int(seconds * 1_000_000_000)
+
+        now[0] = 0
+        replayer = FrameReplayer(file, transmitter, clock=lambda: now[0], sleep=sleep)
+        self.assertEqual(replayer.play(), 7)
+        self.assertEqual(transmitter.sent, expected)
+        self.assertEqual(now[0], 7 * 25_000_000)
+        # Two and three universes use the same words, but do not match.
+        for other in (
+            Payload_USITT_DMX512_A(universes=2, slots=64),
+            Payload_USITT_DMX512_A(universes=3, slots=63),
+        ):
+            file.seek(0)
+            with self.assertRaises(ValueError):
+                FrameReplayer(file, FakeTransmitter(other))
+
+
+class OnceTestCase(unittest.TestCase):
+    """Test a once frame over an unchanged loop frame is replayed on time"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=3, slots=16)
+        now = [0]
+        file = io.BytesIO()
+        recorder = FrameRecorder(file, payload, clock=lambda: now[0])
+        frame = payload.array_copy()
+        recorder.record(frame)
+        now[0] = 1_000_000_000
+        once = payload.array_stop()
+        recorder.record(frame, once=once)
+        now[0] = 5_000_000_000
+        payload[0] = 1
+        recorder.record(payload.array_copy())
+        self.assertEqual(kinds(file.getvalue()), b"KODD")
+        file.seek(0)
+        transmitter = FakeTransmitter(payload.clone(slots=payload.slots))
+        shown = []
+
+        def show(once=None, loop=None):
+            shown.append((now[0], once is not None))
+            FakeTransmitter.show(transmitter, once=once, loop=loop)
+
+        def sleep(seconds):
+            now[0] = now[0] + int(seconds * 1_000_000_000)
+
+        transmitter.show = show
+        now[0] = 0
+        replayer = FrameReplayer(file, transmitter, clock=lambda: now[0], sleep=sleep)
+        self.assertEqual(replayer.play(), 3)
+        self.assertEqual(
+            shown, [(0, False), (1_000_000_000, True), (5_000_000_000, False)]
+        )
+        self.assertEqual(transmitter.sent[1], ("once", list(once)))
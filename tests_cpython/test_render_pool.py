@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.render_pool import RenderPool
+from dmx_transmitter.shared_payload import SharedPayload
+
+
+def render(frame, universe):
+    "A different ramp for every frame and universe."
+    return [(frame * 7 + universe * 3 + slot) % 256 for slot in range(16)]
+
+
+class Transmitter:  # pylint: disable=too-few-public-methods
+    "Stands in for a DMXTransmitter, keeping every frame shown."
+
+    def __init__(self, universes):
+        self.payload = SharedPayload(universes=universes, slots=16)
+        self.shown = []
+
+    def show(self):
+        self.shown.append(self.payload.array_copy())
+
+
+class RenderPoolTestCase(unittest.TestCase):
+    """Test rendering partitions in worker processes, then showing"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        transmitters = [Transmitter(3), Transmitter(1), Transmitter(2)]
+        try:
+            with RenderPool(transmitters, render, processes=2) as pool:
+                self.assertEqual(pool.universes, 6)
+                pool.frame()
+                self.assertEqual(pool.frame(), 1)
+                self.assertEqual(pool.stats["encode"].count, 6)
+                self.assertEqual(pool.stats["show"].count, 2)
+            universe = 0
+            for transmitter in transmitters:
+                self.assertEqual(len(transmitter.shown), 2)
+                for lane in range(transmitter.payload.universes):
+                    self.assertEqual(transmitter.payload[lane, :], render(1, universe))
+                    universe = universe + 1
+        finally:
+            for transmitter in transmitters:
+                transmitter.payload.close()
+                transmitter.payload.unlink()
+        plain = Transmitter(1)
+        plain.payload.close()
+        plain.payload.unlink()
+        plain.payload = Payload_USITT_DMX512_A(slots=16)
+        with self.assertRaises(ValueError):
+            RenderPool([plain], render)
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import array
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.scene_cache import SceneCache
+
+
+class SceneCacheTestCase(unittest.TestCase):
+    """Test storing, recalling and evicting scenes"""
+
+    def setUp(self):
+        self.payload = Payload_USITT_DMX512_A(universes=3, slots=32)
+        self.scene_size = len(self.payload.array) * self.payload.array.itemsize
+        self.cache = SceneCache(self.payload, budget=2 * self.scene_size)
+
+    def test_recall(self):
+        self.payload[0:3] = 255
+        self.payload.mark_between_slots = 20
+        self.cache.store("warm")
+        self.payload.clear()
+        self.payload.mark_between_slots = 8
+        self.cache.recall("warm")
+        self.assertEqual(self.payload[0:4], [255, 255, 255, 0])
+        self.assertEqual(self.payload.mark_between_slots, 20)
+        self.assertEqual(list(self.cache.frame("warm")), list(self.payload.array))
+
+    def test_lru_eviction(self):
+        for name in ("a", "b"):
+            self.cache.store(name)
+        self.cache.frame("a")  # "b" is now least recently used.
+        self.cache.store("c")
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.cache.used, 2 * self.scene_size)
+        with self.assertRaises(KeyError):
+            self.cache.recall("b")
+
+    def test_budget(self):
+        cache = SceneCache(self.payload, budget=self.scene_size - 1)
+        with self.assertRaises(ValueError):
+            cache.store("too big")
+        with self.assertRaises(ValueError):
+            Payload_USITT_DMX512_A(universes=3, slots=31).array_load(
+                self.payload.array_copy()
+            )
+        # Two and three universes share a word size: checked all the same.
+        self.cache.store("three")
+        self.cache.payload = Payload_USITT_DMX512_A(universes=2, slots=32)
+        with self.assertRaises(ValueError):
+            self.cache.recall("three")
+        with self.assertRaises(ValueError):
+            self.cache.payload.array_load(array.array("H", bytes(74)))
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import os
+import tempfile
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.scene_library import SceneLibrary, SceneLibraryWriter
+
+
+class SceneLibraryTestCase(unittest.TestCase):
+    """Test writing and memory mapped recall of cues"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".dmxl")
+        os.close(handle)
+        self.payload = Payload_USITT_DMX512_A(universes=2, slots=24)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def runTest(self):  # pylint: disable=invalid-name
+        with SceneLibraryWriter(self.path, self.payload) as writer:
+            for cue in range(10):
+                self.payload[:] = cue
+                writer.snapshot(f"cue {cue}")
+            self.payload.mark_between_slots = 30
+            self.payload[5] = 99
+            writer.snapshot("last")
+        expected = self.payload.array_copy()
+        self.payload.clear()
+        self.payload.mark_between_slots = 8
+        with SceneLibrary(self.path) as library:
+            self.assertEqual(len(library), 11)
+            self.assertEqual(library.slots, 24)
+            self.assertEqual(library.name(3), "cue 3")
+            library.recall(3, self.payload)
+            self.assertEqual(self.payload[:], [3] * 48)
+            library.recall("last", self.payload)
+            self.assertEqual(self.payload.array, expected)
+            self.assertEqual(self.payload.mark_between_slots, 30)
+            with self.assertRaises(IndexError):
+                library.recall(11, self.payload)
+            with self.assertRaises(ValueError):
+                library.recall(0, Payload_USITT_DMX512_A(universes=2, slots=23))
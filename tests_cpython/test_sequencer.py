@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import array
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.sequencer import Sequencer
+
+
+class Transmitter:  # pylint: disable=too-few-public-methods
+    "Stands in for a DMXTransmitter."
+
+    def __init__(self):
+        self.sent = []
+
+    def show(self, once=None, loop=None):
+        self.sent.append((once, loop))
+
+
+class SequencerTestCase(unittest.TestCase):
+    """Test joining frames and repeats into one ring"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=2, slots=16)
+        sequence = Sequencer(payload)
+        payload[0] = 255
+        first = payload.array_copy()
+        sequence.add(repeat=2)
+        short = payload.clone(slots=4)
+        sequence.add(short)
+        self.assertEqual(len(sequence), 3)
+        # Repeats are copies in the ring: the state machine counts them.
+        ring = sequence.ring
+        self.assertEqual(len(ring), 2 * len(first) + len(short.array))
+        self.assertEqual(ring[: len(first)], first)
+        self.assertEqual(ring[len(first) : 2 * len(first)], first)
+        self.assertEqual(ring[2 * len(first) :], short.array)
+        self.assertEqual(sequence.used, len(ring) * ring.itemsize)
+        self.assertEqual(sequence.interval, 2 * payload.interval + short.interval)
+        # Handed over once, and play returns.
+        transmitter = Transmitter()
+        sequence.play(transmitter)
+        sequence.play(transmitter, loop=False)
+        self.assertEqual(transmitter.sent, [(None, ring), (ring, None)])
+        # The ring stays within its budget.
+        small = Sequencer(payload, budget=3 * len(first) * first.itemsize)
+        small.add(first, repeat=3)
+        with self.assertRaises(ValueError):
+            small.add(short)
+        self.assertEqual(len(small), 3)
+        with self.assertRaises(ValueError):
+            sequence.add(array.array("H", bytes(len(first))))
+        with self.assertRaises(ValueError):
+            sequence.add(first[:-1])
+        with self.assertRaises(ValueError):
+            sequence.add(repeat=0)
+        with self.assertRaises(ValueError):
+            sequence.add(Payload_USITT_DMX512_A(universes=1, slots=4))
+        sequence.clear()
+        self.assertEqual(sequence.used, 0)
+        with self.assertRaises(ValueError):
+            sequence.ring  # pylint: disable=pointless-statement
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import threading
+import time
+import unittest
+
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.shared_payload import SharedPayload
+
+
+class SharedPayloadTestCase(unittest.TestCase):
+    """Test attaching to a shared payload and the seqlock snapshot"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        with SharedPayload(universes=3, slots=32) as owner:
+            owner.mark_between_slots = 20
+            owner._init_start_code(0x17)  # pylint: disable=protected-access
+            with SharedPayload.attach(owner.name) as renderer:
+                self.assertEqual(renderer.universes, 3)
+                self.assertEqual(renderer.slots, 32)
+                self.assertEqual(renderer.mark_between_slots, 20)
+                # Attaching writes nothing.
+                self.assertEqual(owner.start_code, 0x17)
+                self.assertEqual(renderer.timing, owner.timing)
+                # Timing set by the other process is followed.
+                owner.space_for_break = 100
+                owner.mark_between_slots = 30
+                self.assertEqual(renderer.timing, owner.timing)
+                owner.space_for_break = 172
+                owner.mark_between_slots = 20
+                owner._init_start_code(0x00)  # pylint: disable=protected-access
+                with renderer.writing():
+                    renderer[2, :] = 200
+                    renderer.clear()
+                    renderer[1, 5] = 9
+                self.assertEqual(owner[1, 5], 9)
+                self.assertEqual(owner[2, :], [0] * 32)
+                expected = Payload_USITT_DMX512_A(universes=3, slots=32)
+                expected.mark_between_slots = 20
+                expected[1, 5] = 9
+                self.assertEqual(owner.array_copy(), expected.array)
+                # A copy waits for an open write to finish.
+                copies = []
+                with renderer.writing():
+                    renderer[0, 0] = 1
+                    thread = threading.Thread(
+                        target=lambda: copies.append(owner.array_copy())
+                    )
+                    thread.start()
+                    time.sleep(0.05)
+                    self.assertEqual(copies, [])
+                    renderer[0, 1] = 2
+                thread.join()
+                self.assertEqual(copies, [owner.array_copy()])
+                self.assertEqual(owner[0, 0:2], [1, 2])
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import unittest
+
+from dmx_transmitter.masters import Masters
+from dmx_transmitter.payload_USITT_DMX512_A import Payload_USITT_DMX512_A
+from dmx_transmitter.slew import SlewLimiter
+
+
+class Output:
+    "A payload that counts the channels written."
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.written = 0
+
+    def __len__(self):
+        return len(self.payload)
+
+    def __getitem__(self, index):
+        return self.payload[index]
+
+    def update(self, indexes, values):
+        self.written = self.written + len(indexes)
+        self.payload.update(indexes, values)
+
+
+class SlewLimiterTestCase(unittest.TestCase):
+    """Test rate limited steps that stop once the output has settled"""
+
+    def runTest(self):  # pylint: disable=invalid-name
+        payload = Payload_USITT_DMX512_A(universes=2, slots=8)
+        payload[5] = 100
+        output = Output(payload)
+        slew = SlewLimiter(output)
+        slew.set_rate(slice(0, 2), 100)
+        slew.set_rate((1, 0), 10)
+        slew[0:2] = [255, 0]
+        slew[1, 0] = 25
+        slew[5] = 0  # No limit.
+        self.assertEqual(slew[0], 255)
+        self.assertEqual(payload[0], 0)
+        self.assertEqual(slew.step(), 2)
+        self.assertEqual(payload[0], 100)
+        self.assertEqual(payload[1, 0], 10)
+        self.assertEqual(payload[5], 0)
+        self.assertEqual(slew.step(), 2)
+        self.assertEqual(payload[0], 200)
+        self.assertEqual(payload[1, 0], 20)
+        self.assertEqual(slew.step(), 0)
+        self.assertEqual(payload[0], 255)
+        self.assertEqual(payload[1, 0], 25)
+        self.assertTrue(slew.settled)
+        # Settled: nothing is written.
+        written = output.written
+        self.assertEqual(slew.step(), 0)
+        self.assertEqual(output.written, written)
+        # Back before the target is reached, and settle.
+        slew[0] = 0
+        slew.step()
+        slew[0] = 155
+        self.assertEqual(slew.step(), 0)
+        slew[0:16] = 50
+        slew.settle()
+        self.assertEqual(payload[:], [50] * 16)
+        # Through masters.
+        masters = Masters(Payload_USITT_DMX512_A(slots=4))
+        masters.grand = 0
+        slew = SlewLimiter(masters, rate=200)
+        slew[0] = 255
+        slew.step()
+        self.assertEqual(masters[0], 200)
+        self.assertEqual(masters.payload[0], 0)
+        with self.assertRaises(ValueError):
+            slew.set_rate(0, 0)
+        # (universe, slot) stays in its universe.
+        slew = SlewLimiter(Payload_USITT_DMX512_A(universes=2, slots=4))
+        with self.assertRaises(IndexError):
+            slew[0, 5] = 9
+        with self.assertRaises(IndexError):
+            slew.set_rate((2, 0), 9)
+        self.assertTrue(slew.settled)
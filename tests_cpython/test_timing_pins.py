@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Dana Runge
+#
+# SPDX-License-Identifier: Unlicense
+import array
+import os
+import subprocess
+import sys
+import unittest
+
+from dmx_transmitter import frozen_code
+from dmx_transmitter.timing_pins import (
+    BREAK,
+    MAB,
+    NOT_TRANSMITTING,
+    TRANSMITTING,
+    TimingPin,
+    TimingPins,
+)
+
+
+class Program:  # pylint: disable=too-few-public-methods
+    "The frozen machine code, as in dmx_transmitter.MachineCode."
+
+    def __init__(self, universes, frozen=True):
+        self.universes = universes
+        self.pio_kwargs = dict(frozen_code.PIO_KWARGS)
+        self.assembled = array.array("H", frozen_code.MACHINE_CODE[universes - 1])
+        self.frozen = frozen
+
+
+class TimingPinsTestCase(unittest.TestCase):
+    """Test the timing pin program variants"""
+
+    def test_placement(self):
+        program = Program(1)
+        variant = TimingPin(BREAK, NOT_TRANSMITTING, program=program)
+        self.assertEqual(variant.shift, 11)
+        self.assertEqual(variant.pio_kwargs["sideset_pin_count"], 2)
+        self.assertEqual(variant.sm_kwargs["initial_sideset_pin_state"], 0b10)
+        for opcode, word in zip(program.assembled, variant.assembled):
+            side = (opcode >> 10) & 0x7
+            self.assertEqual(word & 0xE3FF, opcode & 0xE3FF)
+            pins = BREAK(side) | NOT_TRANSMITTING(side) << 1
+            self.assertEqual((word >> 11) & 0x3, pins)
+        self.assertEqual(TimingPin(program=program).sm_kwargs, {})
+        with self.assertRaises(ValueError):
+            TimingPin(BREAK, MAB, TRANSMITTING, NOT_TRANSMITTING, program=program)
+
+    def test_memoized(self):
+        first = TimingPins(MAB, TRANSMITTING, program=Program(2))
+        self.assertIs(first, TimingPins(MAB, TRANSMITTING, program=Program(2)))
+        self.assertIsNot(first, TimingPins(MAB, TRANSMITTING, program=Program(3)))
+        other = Program(2)
+        other.assembled[0] = other.assembled[0] ^ 0x1F  # Another delay.
+        self.assertIsNot(first, TimingPins(MAB, TRANSMITTING, program=other))
+        computed = TimingPin(MAB, TRANSMITTING, program=Program(2, frozen=False))
+        self.assertEqual(first.assembled, computed.assembled)
+
+    def test_lazy(self):
+        # The frozen timing pin fields are only loaded for timing pins.
+        script = (
+            "import sys\n"
+            "from dmx_transmitter.dmx_transmitter import MachineCode\n"
+            "from dmx_transmitter.timing_pins import MAB, TimingPins\n"
+            "program = MachineCode(1)\n"
+            "print('dmx_transmitter.frozen_timing_pins' in sys.modules)\n"
+            "TimingPins(MAB, program=program)\n"
+            "print('dmx_transmitter.frozen_timing_pins' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            cwd=root,
+            text=True,
+        )
+        self.assertEqual(result.stdout.split(), ["False", "True"])